@@ -1,2 +1,5 @@
-from .alter import GraphAlter
+from lazy import lazy_attributes
+
 from .types import AlterOptions
+
+__getattr__ = lazy_attributes(__name__, {"GraphAlter": ".alter"})
@@ -1,5 +1,6 @@
 from alter.strategy import AlterStrategy
 from graph import DBGraph, DirectedGraph
+from instrument import timed
 
 
 class GraphAlter:
@@ -7,6 +8,7 @@ class GraphAlter:
     def __init__(self, strategy: AlterStrategy):
         self.strategy = strategy
 
+    @timed("alter")
     def alter(self, graph: DBGraph) -> DBGraph:
         return self.strategy.alter(graph)
 
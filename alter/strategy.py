@@ -15,13 +15,13 @@ class AlterStrategy(ABC):
         raise NotImplementedError
 
 
-def alter_strategy_factory(strategy_type: str) -> AlterStrategy:
+def alter_strategy_factory(strategy_type: str, seed=None) -> AlterStrategy:
     """
     Factory function to create an alteration strategy based on the given type.
     """
     if strategy_type == "to_multigraph":
         from alter.to_multigraph import ToMultigraph
 
-        return ToMultigraph(K=(2, 2), assign_probability=0.2)
+        return ToMultigraph(K=(2, 2), assign_probability=0.2, seed=seed)
     else:
         raise ValueError(f"Unknown alteration strategy type: {strategy_type}")
@@ -1,6 +1,7 @@
 from alter.strategy import AlterStrategy
 from graph import DBGraph, DirectedGraph
-import random
+import numpy as np
+import sys
 
 
 class ToMultigraph(AlterStrategy):
@@ -10,6 +11,7 @@ class ToMultigraph(AlterStrategy):
         K: int | tuple[int],
         assign_probability: float = 0.5,
         edges_labels_strategy: str = "dummy",  # TODO: implement different strategies
+        seed=None,
     ):
         """Assign multiple edges between nodes to convert a graph into a multigraph.
 
@@ -17,6 +19,7 @@ class ToMultigraph(AlterStrategy):
             K (int | tuple[int], optional): _description_. Defaults to 2.
             assign_probability (float, optional): _description_. Defaults to 0.5.
             edges_labels_strategy (str): Strategy to assign labels to new edges. Defaults to "dummy". It assign the label "extra_[existinglabel]".
+            seed (optional): Seed of the NumPy generator, for reproducible alterations.
 
         Raises:
             ValueError: K must be an int or a tuple of two ints
@@ -29,28 +32,57 @@ class ToMultigraph(AlterStrategy):
             raise ValueError("K must be an int or a tuple of two ints")
         self.assign_probability = assign_probability
         self.edges_labels_strategy = edges_labels_strategy
+        self._rng = np.random.default_rng(seed)
 
     def alter(self, graph: DBGraph) -> DBGraph:
         """
         Alter the given graph to convert it into a multigraph.
 
+        Every arc is selected with probability ``assign_probability``; each
+        selected arc gets K extra parallel arcs, K drawn uniformly in
+        [K[0], K[1]]. Selection and multiplicities are drawn for all arcs at
+        once and the extra arcs are inserted with a single add_edges_from.
+
         Parameters:
         graph (DirectedGraph): The input directed graph to be altered.
         Returns:
         DirectedGraph: The altered multigraph.
         """
+        edges = list(graph.edges(data=True))
+        selected = np.flatnonzero(
+            self._rng.random(len(edges)) <= self.assign_probability
+        )
+        multiplicity = self._rng.integers(
+            self.K[0], self.K[1] + 1, size=selected.size
+        )
+        repeated = np.repeat(selected, multiplicity)
+
+        # One interned label string per distinct original label
+        extra_labels = {}
+        for i in selected.tolist():
+            label = edges[i][2].get("label", "")
+            if label not in extra_labels:
+                extra_labels[label] = sys.intern(f"extra_{label}")
+
         multi_g = graph.copy()
-        for u, v, data in graph.edges(data=True):
-            rand = random.random()
-            if rand > self.assign_probability:
-                continue
-            K = random.randint(self.K[0], self.K[1])
-            for _ in range(K):
-                multi_g.add_edge(u, v, label=f"extra_{data['label']}")
+        multi_g.add_edges_from(
+            (u, v, {"label": extra_labels[data.get("label", "")]})
+            for u, v, data in (edges[i] for i in repeated.tolist())
+        )
 
+        # Read back by what_changed, so it needs no state on the strategy
+        multi_g.graph["multigraph_counts"] = (len(edges), selected.size, repeated.size)
         return multi_g
 
     def what_changed(self, original_graph: DBGraph, altered_graph: DBGraph) -> str:
+        if "multigraph_counts" in altered_graph.graph:
+            original_edge_count, selected, added_edges = altered_graph.graph[
+                "multigraph_counts"
+            ]
+            return (
+                f"Converted to multigraph by adding {added_edges} edges on {selected} arcs "
+                f"(from {original_edge_count} to {original_edge_count + added_edges} edges)."
+            )
         original_edge_count = original_graph.number_of_edges()
         altered_edge_count = altered_graph.number_of_edges()
         added_edges = altered_edge_count - original_edge_count
@@ -0,0 +1,213 @@
+"""
+Benchmark inputs and cases.
+
+Inputs are synthetic and deterministic: a labelled uniform random graph with
+``scale`` arcs over ``scale // 4`` nodes, and a database of graphs with 1000
+arcs each adding up to ``scale`` arcs. They are generated offline from fixed
+seeds on first use and cached under the data directory, so every run (and
+every machine) times the same bytes.
+
+A case is a function taking an ``Inputs`` and returning the zero-argument
+callable to time and the number of arcs it processes (for throughput);
+everything done before returning (reading inputs, building strategies) is
+setup and is not timed.
+"""
+
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Callable
+
+from generator.graphs.types import GRAPH_STRATEGIES
+from generator.labels.types import LABEL_STRATEGIES
+from reader import InputFormat
+from saver import OutputFormat
+
+# Bump when the generated inputs change, so stale cached files are not reused
+INPUT_VERSION = 1
+SEED = 0
+NODE_LABELS = ["A", "B", "C", "D"]
+EDGE_LABELS = ["x", "y", "z"]
+DB_GRAPH_EDGES = 1000
+
+
+@dataclass
+class Inputs:
+    scale: int
+    data_dir: str
+    _cache: dict = field(default_factory=dict, repr=False)
+
+    @property
+    def num_nodes(self) -> int:
+        return max(2, self.scale // 4)
+
+    @property
+    def graph_path(self) -> str:
+        return os.path.join(self.data_dir, f"graph-v{INPUT_VERSION}-{self.scale}.data")
+
+    @property
+    def db_path(self) -> str:
+        return os.path.join(self.data_dir, f"db-v{INPUT_VERSION}-{self.scale}.data")
+
+    def output_path(self, name: str) -> str:
+        return os.path.join(self.data_dir, f"out-{name}-{self.scale}.data")
+
+    def ensure(self) -> None:
+        """Generate the input files if they are not cached yet."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        if not os.path.exists(self.graph_path):
+            _write_atomic(self.graph_path, self._write_graph)
+        if not os.path.exists(self.db_path):
+            _write_atomic(self.db_path, self._write_db)
+
+    def _write_graph(self, path: str) -> None:
+        from generator.graphs.random import RandomGraphStrategy
+        from generator.labels.random import RandomStrategy
+        from generator.stream import stream_graph
+        from saver import saver_factory
+
+        batches = stream_graph(
+            RandomGraphStrategy(self.num_nodes, self.scale, seed=SEED),
+            RandomStrategy(seed=SEED),
+            set(NODE_LABELS),
+            set(EDGE_LABELS),
+        )
+        saver_factory(OutputFormat.data).save_batches(batches, path)
+
+    def _write_db(self, path: str) -> None:
+        from generator.batch import BatchConfig, generate_graphs, plan_jobs
+        from saver import saver_factory
+
+        config = BatchConfig(
+            graph_strategy=GRAPH_STRATEGIES.random,
+            label_strategy=LABEL_STRATEGIES.random,
+            node_labels=NODE_LABELS,
+            edge_labels=EDGE_LABELS,
+        )
+        num_graphs = max(1, self.scale // DB_GRAPH_EDGES)
+        jobs = plan_jobs(num_graphs, [DB_GRAPH_EDGES // 4], [DB_GRAPH_EDGES], seed=SEED)
+        with saver_factory(OutputFormat.data).open_db(path) as writer:
+            for g in generate_graphs(jobs, config, workers=1):
+                writer.write(g)
+
+    def graph(self):
+        if "graph" not in self._cache:
+            from reader import reader_factory
+
+            self._cache["graph"] = reader_factory(InputFormat.data).read(self.graph_path)
+        return self._cache["graph"]
+
+    def db(self):
+        if "db" not in self._cache:
+            from reader import reader_factory
+
+            self._cache["db"] = reader_factory(InputFormat.data).read_db(self.db_path)
+        return self._cache["db"]
+
+
+def _write_atomic(path: str, write: Callable[[str], None]) -> None:
+    # Keep the extension: the saver appends it to paths that lack it
+    stem, ext = os.path.splitext(path)
+    tmp = f"{stem}.tmp-{os.getpid()}{ext}"
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def read(inputs: Inputs):
+    from reader import reader_factory
+
+    reader = reader_factory(InputFormat.data)
+    return lambda: reader.read(inputs.graph_path), inputs.scale
+
+
+def read_db(inputs: Inputs):
+    from reader import reader_factory
+
+    reader = reader_factory(InputFormat.data)
+    return lambda: reader.read_db(inputs.db_path), inputs.scale
+
+
+def to_data_string(inputs: Inputs):
+    from saver.data import DataSaverStrategy
+
+    graph = inputs.graph()
+    return lambda: DataSaverStrategy()._to_data_string(graph), inputs.scale
+
+
+def save(inputs: Inputs):
+    from saver import saver_factory
+
+    graph = inputs.graph()
+    saver = saver_factory(OutputFormat.data)
+    return lambda: saver.save(graph, inputs.output_path("save")), inputs.scale
+
+
+def save_db(inputs: Inputs):
+    from saver import saver_factory
+
+    db = inputs.db()
+    saver = saver_factory(OutputFormat.data)
+    return lambda: saver.save_db(db, inputs.output_path("save_db")), inputs.scale
+
+
+def extract_k_distant_nodes(inputs: Inputs):
+    graph = inputs.graph()
+
+    def run():
+        # Landmarks come from the stdlib generator
+        random.seed(SEED)
+        return graph.extract_k_distant_nodes(32)
+
+    return run, inputs.scale
+
+
+def extract_subgraph_by_edge_count(inputs: Inputs):
+    graph = inputs.graph()
+    start = next(iter(graph))
+    num_edges = inputs.scale // 10
+    return lambda: graph.extract_subgraph_by_edge_count(start, num_edges), num_edges
+
+
+def _generate(graph_strategy: GRAPH_STRATEGIES):
+    def case(inputs: Inputs):
+        from generator import generator_factory
+
+        return (
+            lambda: generator_factory(
+                graph_strategy, inputs.num_nodes, inputs.scale, seed=SEED
+            ).generate(),
+            inputs.scale,
+        )
+
+    return case
+
+
+def label_random(inputs: Inputs):
+    from generator.labels.random import RandomStrategy
+
+    graph = inputs.graph()
+    return (
+        lambda: RandomStrategy(seed=SEED).assign(graph, set(NODE_LABELS), set(EDGE_LABELS)),
+        inputs.scale,
+    )
+
+
+Case = Callable[[Inputs], tuple[Callable[[], object], int]]
+
+CASES: dict[str, Case] = {
+    "read": read,
+    "read_db": read_db,
+    "to_data_string": to_data_string,
+    "save": save,
+    "save_db": save_db,
+    "extract_k_distant_nodes": extract_k_distant_nodes,
+    "extract_subgraph_by_edge_count": extract_subgraph_by_edge_count,
+    "generate_random": _generate(GRAPH_STRATEGIES.random),
+    "generate_barabasi_albert": _generate(GRAPH_STRATEGIES.barabasi_albert),
+    "generate_rmat": _generate(GRAPH_STRATEGIES.rmat),
+    "label_random": label_random,
+}
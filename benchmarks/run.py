@@ -0,0 +1,176 @@
+"""
+Benchmark runner for readers, savers, extraction and generators.
+
+Every (case, scale) pair runs in a fresh interpreter, so its peak RSS is not
+inflated by earlier cases. Each case is timed ``--repeat`` times and the
+fastest run is kept. Results can be saved as a baseline and later compared
+against it: a case is a regression when its time or peak memory exceeds the
+baseline by more than ``--threshold``.
+
+Usage:
+    python benchmarks/run.py [--scales 1e4,1e5,1e6] [--cases read,save_db]
+        [--repeat 3] [--out results.json]
+        [--baseline benchmarks/baseline.json] [--threshold 0.25]
+        [--save-baseline benchmarks/baseline.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+from cases import CASES, Inputs  # noqa: E402
+from instrument import peak_rss_mb  # noqa: E402
+from generator.labels.cache import DEFAULT_CACHE_DIR  # noqa: E402
+
+DEFAULT_SCALES = "1e4,1e5,1e6"
+DEFAULT_DATA_DIR = os.path.join(DEFAULT_CACHE_DIR, "benchmarks")
+
+
+def run_case(name: str, scale: int, data_dir: str, repeat: int) -> dict:
+    """Time one case in this process. Called in the child interpreter."""
+    inputs = Inputs(scale, data_dir)
+    fn, arcs = CASES[name](inputs)
+    setup_rss = peak_rss_mb()
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    peak = peak_rss_mb()
+    return {
+        "case": name,
+        "scale": scale,
+        "arcs": arcs,
+        "best_s": round(best, 6),
+        "mean_s": round(sum(times) / len(times), 6),
+        "arcs_per_s": round(arcs / best) if best > 0 else None,
+        "peak_rss_mb": round(peak, 1),
+        # Growth of the high-water mark over the setup (inputs loaded)
+        "case_rss_mb": round(max(0.0, peak - setup_rss), 1),
+    }
+
+
+def spawn_case(name: str, scale: int, data_dir: str, repeat: int) -> dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--worker", name, str(scale),
+         "--data-dir", data_dir, "--repeat", str(repeat)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return {"case": name, "scale": scale, "error": proc.stderr.strip().splitlines()[-1:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results: list[dict], baseline: dict, threshold: float) -> list[str]:
+    """Return one message per case slower or bigger than the baseline by more than ``threshold``."""
+    regressions = []
+    for result in results:
+        key = f"{result['case']}@{result['scale']}"
+        base = baseline.get(key)
+        if base is None or "error" in result:
+            continue
+        for metric in ("best_s", "peak_rss_mb"):
+            old, new = base[metric], result[metric]
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(f"{key} {metric}: {old} -> {new} (+{100 * (new / old - 1):.0f}%)")
+    return regressions
+
+
+def print_table(results: list[dict], baseline: dict) -> None:
+    print(f"{'case':<32}{'scale':>10}{'best s':>10}{'arcs/s':>12}{'peak MB':>10}{'vs base':>10}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['case']:<32}{r['scale']:>10}  ERROR {' '.join(r['error'])}")
+            continue
+        base = baseline.get(f"{r['case']}@{r['scale']}")
+        delta = f"{100 * (r['best_s'] / base['best_s'] - 1):+.0f}%" if base and base["best_s"] else ""
+        print(
+            f"{r['case']:<32}{r['scale']:>10}{r['best_s']:>10.3f}"
+            f"{r['arcs_per_s'] or 0:>12,}{r['peak_rss_mb']:>10.0f}{delta:>10}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="Comma-separated arc counts")
+    parser.add_argument("--cases", default=None, help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (the fastest is kept)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR, help="Where generated inputs are cached")
+    parser.add_argument("--out", default=None, help="Write the results as JSON")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown, as a fraction")
+    parser.add_argument("--save-baseline", default=None, help="Write the results as a new baseline")
+    parser.add_argument("--worker", nargs=2, metavar=("CASE", "SCALE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        name, scale = args.worker
+        print(json.dumps(run_case(name, int(scale), args.data_dir, args.repeat)))
+        return 0
+
+    scales = [int(float(s)) for s in args.scales.split(",")]
+    names = args.cases.split(",") if args.cases else list(CASES)
+    unknown = sorted(set(names) - set(CASES))
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    results = []
+    for scale in scales:
+        print(f"Preparing inputs for {scale} arcs...", flush=True)
+        Inputs(scale, args.data_dir).ensure()
+        for name in names:
+            results.append(spawn_case(name, scale, args.data_dir, args.repeat))
+            r = results[-1]
+            status = "error" if "error" in r else f"{r['best_s']:.3f}s"
+            print(f" - {name}@{scale}: {status}", flush=True)
+
+    print()
+    print_table(results, baseline)
+
+    report = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "results": {f"{r['case']}@{r['scale']}": r for r in results},
+    }
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    failed = any("error" in r for r in results)
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        print()
+        if regressions:
+            print(f"FAIL: {len(regressions)} regression(s) beyond {100 * args.threshold:.0f}%:")
+            for line in regressions:
+                print(f"  {line}")
+            failed = True
+        else:
+            print(f"No regression beyond {100 * args.threshold:.0f}% against {args.baseline}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
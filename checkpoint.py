@@ -0,0 +1,104 @@
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of a ``db_construct`` run, stored as JSON next to the output.
+
+    The plan (start nodes, per-graph sizes, the state of the stdlib random
+    generator once the plan was drawn, the state of the size generator and
+    the entropy the per-graph sampler generators derive from) is fixed when
+    the run starts and only grows when the database is extended, so it is
+    written once per run or extension. The progress (last committed graph id
+    and the output size right after it) goes to a separate small file that
+    is replaced after every graph. Resuming truncates the output to
+    ``offset``, which drops any partially written graph, and continues with
+    the next id.
+    """
+
+    config: dict
+    start_nodes: list
+    sizes: list[int]
+    random_state: list | None = None
+    sampler_entropy: int | None = None
+    size_rng_state: dict | None = None
+    last_graph_id: int = -1
+    offset: int = 0
+    path: str = field(default="", repr=False, compare=False)
+
+    PROGRESS = ("last_graph_id", "offset")
+
+    @staticmethod
+    def path_for(output_path: str) -> str:
+        return f"{output_path}.ckpt.json"
+
+    @staticmethod
+    def landmarks_path_for(output_path: str) -> str:
+        """Where the landmark distances and greedy state of the run are kept."""
+        return f"{output_path}.landmarks.npz"
+
+    @property
+    def progress_path(self) -> str:
+        return f"{self.path[:-len('.json')]}.progress.json"
+
+    @property
+    def complete(self) -> bool:
+        return self.last_graph_id + 1 >= len(self.start_nodes)
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        with open(path) as f:
+            data = json.load(f)
+        # Written by older versions, which kept the progress in the plan
+        data.pop("complete", None)
+        checkpoint = cls(**data, path=path)
+        if os.path.exists(checkpoint.progress_path):
+            with open(checkpoint.progress_path) as f:
+                for key, value in json.load(f).items():
+                    setattr(checkpoint, key, value)
+        return checkpoint
+
+    @staticmethod
+    def _write(path: str, data: dict) -> None:
+        """Atomically replace ``path``, so a crash never leaves it half written."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def save(self) -> None:
+        """Write the plan, and the progress (first, so a stale one never outlives it)."""
+        self._save_progress()
+        data = asdict(self)
+        for key in ("path", *self.PROGRESS):
+            del data[key]
+        self._write(self.path, data)
+
+    def _save_progress(self) -> None:
+        progress = {key: getattr(self, key) for key in self.PROGRESS}
+        self._write(self.progress_path, progress)
+
+    def commit(self, graph_id: int, offset: int) -> None:
+        """Record a written graph: only the progress file is rewritten."""
+        self.last_graph_id = graph_id
+        self.offset = offset
+        self._save_progress()
+
+    def mismatches(self, config: dict, ignore: tuple[str, ...] = ()) -> list[str]:
+        """Names of the settings that differ from the ones the checkpoint was made with."""
+        return sorted(
+            key
+            for key in self.config.keys() | config.keys()
+            if key not in ignore and self.config.get(key) != config.get(key)
+        )
+
+    def extend(self, start_nodes: list, sizes: list[int], db_size: int) -> None:
+        """Append graphs to the plan; the run is incomplete until they are written."""
+        self.start_nodes.extend(start_nodes)
+        self.sizes.extend(sizes)
+        self.config["db_size"] = db_size
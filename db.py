@@ -1,49 +1,129 @@
+import os
+import pickle
+import tempfile
+import weakref
+from typing import Iterable, Iterator, Union
+
 import networkx as nx
-from typing import Union
 
 from graph import DBGraph
+from instrument import METRICS
+from memory import BUDGET
+from records import DBArrays
 
 Graph = nx.MultiDiGraph
 
 
+def _discard(spill) -> None:
+    spill.close()
+    try:
+        os.remove(spill.name)
+    except FileNotFoundError:
+        pass
+
+
 class DBGraphs:
+    """
+    An ordered collection of graphs.
+
+    The graphs held in memory are accounted with ``estimated_size``; once
+    they exceed ``memory_budget`` bytes (default: the global ``--memory-budget``,
+    unlimited if unset) they are pickled to a temporary spill file and
+    dropped. ``iter_graphs`` reads spilled graphs back lazily, before the ones
+    still in memory, so the order is that of ``add_graph``; ``get_graphs``
+    returns them as a list.
+    """
+
+    def __init__(
+        self, graphs: Iterable[DBGraph] | None = None, memory_budget: int | None = None
+    ):
+        self.memory_budget = BUDGET.limit if memory_budget is None else memory_budget
+        # Use a fresh list per instance to avoid shared state across DBGraphs
+        # objects; it only holds the graphs added since the last spill
+        self._graphs: list[DBGraph] = []
+        self._size = 0
+        self._spill = None
+        self._spilled = 0
+        for graph in graphs or ():
+            self.add_graph(graph)
 
-    def __init__(self, graphs: list[DBGraph] | None = None):
-        # Use a fresh list per instance to avoid shared state across DBGraphs objects
-        self.graphs = list(graphs) if graphs is not None else []
+    def __len__(self) -> int:
+        return self._spilled + len(self._graphs)
 
     def add_graph(self, graph: DBGraph):
-        self.graphs.append(graph)
+        self._graphs.append(graph)
+        if self.memory_budget is None:
+            return
+        self._size += graph.estimated_size()
+        # As in run_overlapped, a single graph over the budget stays in memory
+        if self._size > self.memory_budget and len(self._graphs) > 1:
+            self._spill_graphs()
+
+    def _spill_graphs(self) -> None:
+        if self._spill is None:
+            self._spill = tempfile.NamedTemporaryFile(
+                prefix="dbgraphs-", suffix=".spill", delete=False
+            )
+            weakref.finalize(self, _discard, self._spill)
+        for graph in self._graphs:
+            pickle.dump(graph, self._spill, pickle.HIGHEST_PROTOCOL)
+        self._spill.flush()
+        METRICS.count("spilled_graphs", len(self._graphs))
+        self._spilled += len(self._graphs)
+        self._graphs = []
+        self._size = 0
+
+    def iter_graphs(self) -> Iterator[DBGraph]:
+        """
+        Iterate over the graphs in insertion order. Spilled graphs are
+        unpickled one at a time, so only one of them is in memory at once.
+        """
+        if self._spill is not None:
+            with open(self._spill.name, "rb") as f:
+                for _ in range(self._spilled):
+                    yield pickle.load(f)
+        yield from self._graphs
 
     def get_graphs(self) -> list[DBGraph]:
-        return self.graphs
+        """
+        All graphs, in insertion order. Once graphs have spilled this loads
+        them all back into memory: prefer ``iter_graphs`` to stream them.
+        """
+        if self._spill is None:
+            return self._graphs
+        return list(self.iter_graphs())
+
+    def to_arrays(self) -> DBArrays:
+        """All graphs as concatenated NumPy arrays with shared label codes."""
+        node_vocab, edge_vocab = {}, {}
+        arrays, graph_ids = [], []
+        for g in self.iter_graphs():
+            arrays.append(g.to_arrays(node_vocab, edge_vocab))
+            graph_ids.append(g.get_graph_id())
+        return DBArrays.concatenate(arrays, graph_ids, node_vocab, edge_vocab)
 
     def print_stats(self):
-        for i, g in enumerate(self.graphs):
-            print(
-                f"Graph {i}: {g.number_of_nodes()} nodes, {g.number_of_edges()} edges"
-            )
+        # Only the counts are kept, so spilled graphs are read back once
+        nodes, edges = [], []
+        for i, g in enumerate(self.iter_graphs()):
+            nodes.append(g.number_of_nodes())
+            edges.append(g.number_of_edges())
+            print(f"Graph {i}: {nodes[-1]} nodes, {edges[-1]} edges")
 
         # Mean number of nodes and edges
-        total_nodes = sum(g.number_of_nodes() for g in self.graphs)
-        total_edges = sum(g.number_of_edges() for g in self.graphs)
-        mean_nodes = total_nodes / len(self.graphs) if self.graphs else 0
-        mean_edges = total_edges / len(self.graphs) if self.graphs else 0
+        total_nodes = sum(nodes)
+        total_edges = sum(edges)
+        mean_nodes = total_nodes / len(nodes) if nodes else 0
+        mean_edges = total_edges / len(edges) if edges else 0
 
         # std number of nodes and edges
         std_nodes = (
-            sum((g.number_of_nodes() - mean_nodes) ** 2 for g in self.graphs)
-            / len(self.graphs)
-            if self.graphs
-            else 0
+            sum((n - mean_nodes) ** 2 for n in nodes) / len(nodes) if nodes else 0
         ) ** 0.5
         std_edges = (
-            sum((g.number_of_edges() - mean_edges) ** 2 for g in self.graphs)
-            / len(self.graphs)
-            if self.graphs
-            else 0
+            sum((m - mean_edges) ** 2 for m in edges) / len(edges) if edges else 0
         ) ** 0.5
         print("Overall statistics:")
-        print("- Total graphs:", len(self.graphs))
+        print("- Total graphs:", len(nodes))
         print("- Total nodes:", total_nodes, "Mean:", mean_nodes, "Std:", std_nodes)
         print("- Total edges:", total_edges, "Mean:", mean_edges, "Std:", std_edges)
@@ -1 +1,3 @@
-from .strategy import distribution_factory
+from lazy import lazy_attributes
+
+__getattr__ = lazy_attributes(__name__, {"distribution_factory": ".strategy"})
@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+
+from distributions.strategy import DistributionStratetegy
+
+
+class EmpiricalDistribution(DistributionStratetegy):
+
+    CACHE_SUFFIX = ".sizes.npz"
+
+    def __init__(self, path: str, max_bins: int = 4096, **kwargs):
+        """
+        Edge-count distribution of an existing ``.data`` database.
+
+        The database is streamed once and summarised as an exact histogram of
+        edge counts, or as ``max_bins`` quantiles when it has more distinct
+        counts than that. The summary is cached next to the database
+        (``<path>.sizes.npz``) and rebuilt when the database changes.
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_bins = max_bins
+        self.values, self.weights, self.is_quantile = self._load_sketch()
+
+    def _source_stamp(self) -> np.ndarray:
+        stat = os.stat(self.path)
+        return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    def _load_sketch(self) -> tuple[np.ndarray, np.ndarray, bool]:
+        cache_path = f"{self.path}{self.CACHE_SUFFIX}"
+        stamp = self._source_stamp()
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                if np.array_equal(cached["stamp"], stamp) and int(
+                    cached["max_bins"]
+                ) == self.max_bins:
+                    return (
+                        cached["values"],
+                        cached["weights"],
+                        bool(cached["is_quantile"]),
+                    )
+
+        values, weights, is_quantile = self._build_sketch(self._edge_counts())
+        try:
+            np.savez(
+                cache_path,
+                stamp=stamp,
+                max_bins=self.max_bins,
+                values=values,
+                weights=weights,
+                is_quantile=is_quantile,
+            )
+        except OSError:
+            pass  # read-only location: keep the sketch in memory only
+        return values, weights, is_quantile
+
+    def _edge_counts(self) -> np.ndarray:
+        """Stream the database and return the number of edges of every graph."""
+        counts = []
+        current = None
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.startswith(b"t #"):
+                    if current is not None:
+                        counts.append(current)
+                    current = 0
+                elif line.startswith(b"e "):
+                    # One edge per label, as DataGraphReader does
+                    current = (current or 0) + max(1, len(line.split()) - 3)
+        if current is not None:
+            counts.append(current)
+        if not counts:
+            raise ValueError(f"No graphs found in {self.path}")
+        return np.array(counts, dtype=np.int64)
+
+    def _build_sketch(self, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray, bool]:
+        values, weights = np.unique(counts, return_counts=True)
+        if len(values) <= self.max_bins:
+            return values.astype(np.float64), weights.astype(np.float64), False
+        probs = np.linspace(0.0, 1.0, self.max_bins + 1)
+        return np.quantile(counts, probs), probs, True
+
+    def _draw(self, n: int) -> np.ndarray:
+        if self.is_quantile:
+            # Inverse CDF, linearly interpolated between stored quantiles
+            return np.interp(self._rng.random(n), self.weights, self.values)
+        return self._rng.choice(self.values, size=n, p=self.weights / self.weights.sum())
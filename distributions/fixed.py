@@ -0,0 +1,13 @@
+import numpy as np
+
+from distributions.strategy import DistributionStratetegy
+
+
+class FixedDistribution(DistributionStratetegy):
+
+    def __init__(self, value: float, **kwargs):
+        super().__init__(**kwargs)
+        self.value = value
+
+    def _draw(self, n: int) -> np.ndarray:
+        return np.full(n, self.value, dtype=np.float64)
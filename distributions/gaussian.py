@@ -1,13 +1,14 @@
-import random
+import numpy as np
+
 from distributions.strategy import DistributionStratetegy
 
 
 class GaussianDistribution(DistributionStratetegy):
 
-    def __init__(self, mean: float, stddev: float):
+    def __init__(self, mean: float, stddev: float, **kwargs):
+        super().__init__(**kwargs)
         self.mean = mean
         self.stddev = stddev
 
-    def get(self):
-
-        return random.gauss(self.mean, self.stddev)
+    def _draw(self, n: int) -> np.ndarray:
+        return self._rng.normal(self.mean, self.stddev, size=n)
@@ -0,0 +1,15 @@
+import numpy as np
+
+from distributions.strategy import DistributionStratetegy
+
+
+class LogNormalDistribution(DistributionStratetegy):
+
+    def __init__(self, mean: float, sigma: float, **kwargs):
+        """``mean`` and ``sigma`` are those of the underlying normal distribution."""
+        super().__init__(**kwargs)
+        self.mean = mean
+        self.sigma = sigma
+
+    def _draw(self, n: int) -> np.ndarray:
+        return self._rng.lognormal(self.mean, self.sigma, size=n)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from distributions.strategy import DistributionStratetegy
+
+
+class PowerLawDistribution(DistributionStratetegy):
+
+    def __init__(self, alpha: float, xmin: float = 1.0, **kwargs):
+        """Continuous power law p(x) ~ x^-alpha for x >= xmin (alpha > 1)."""
+        super().__init__(**kwargs)
+        if alpha <= 1:
+            raise ValueError(f"Power-law exponent must be greater than 1, got {alpha}")
+        if xmin <= 0:
+            raise ValueError(f"Power-law xmin must be positive, got {xmin}")
+        self.alpha = alpha
+        self.xmin = xmin
+
+    def _draw(self, n: int) -> np.ndarray:
+        # Inverse transform sampling of the Pareto tail
+        u = self._rng.random(n)
+        return self.xmin * (1.0 - u) ** (-1.0 / (self.alpha - 1.0))
+
+
+class ZipfDistribution(DistributionStratetegy):
+
+    def __init__(self, a: float, **kwargs):
+        """Discrete Zipf distribution over 1, 2, ... with P(k) ~ k^-a (a > 1)."""
+        super().__init__(**kwargs)
+        if a <= 1:
+            raise ValueError(f"Zipf exponent must be greater than 1, got {a}")
+        self.a = a
+
+    def _draw(self, n: int) -> np.ndarray:
+        return self._rng.zipf(self.a, size=n).astype(np.float64)
@@ -1,28 +1,154 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 
 class DistributionStratetegy(ABC):
 
+    def __init__(
+        self,
+        low: float | None = None,
+        high: float | None = None,
+        bounds: str = "clip",
+        seed=None,
+    ):
+        """
+        Parameters
+        ----------
+        low, high : float | None
+            Optional bounds applied to every sample.
+        bounds : str
+            "clip" clamps out-of-range samples to the bounds, "truncate"
+            redraws them (the distribution is truncated to [low, high]).
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator, for reproducible samples.
+        """
+        if bounds not in ("clip", "truncate"):
+            raise ValueError(f"bounds must be 'clip' or 'truncate', got {bounds!r}")
+        if low is not None and high is not None and low > high:
+            raise ValueError(f"Lower bound {low} is greater than upper bound {high}")
+        self.low = low
+        self.high = high
+        self.bounds = bounds
+        self._rng = np.random.default_rng(seed)
+
     @abstractmethod
+    def _draw(self, n: int) -> np.ndarray:
+        """Draw ``n`` unbounded samples."""
+        pass
+
+    def _in_bounds(self, values: np.ndarray) -> np.ndarray:
+        mask = np.ones(values.shape, dtype=bool)
+        if self.low is not None:
+            mask &= values >= self.low
+        if self.high is not None:
+            mask &= values <= self.high
+        return mask
+
+    def sample(self, n: int, max_rounds: int = 100) -> np.ndarray:
+        """Return ``n`` samples as a float64 array, with the bounds applied."""
+        values = np.asarray(self._draw(n), dtype=np.float64)
+        if self.bounds == "truncate":
+            for _ in range(max_rounds):
+                redraw = ~self._in_bounds(values)
+                if not redraw.any():
+                    break
+                values[redraw] = self._draw(int(redraw.sum()))
+            # Whatever is still out of range after max_rounds is clipped
+        if self.low is not None or self.high is not None:
+            values = np.clip(values, self.low, self.high)
+        return values
+
+    def get_state(self) -> dict:
+        """State of the generator, JSON-serializable, to continue the stream later."""
+        return self._rng.bit_generator.state
+
+    def set_state(self, state: dict) -> None:
+        self._rng.bit_generator.state = state
+
     def get(self):
         """Return the next edge according to the distribution strategy."""
-        pass
+        return float(self.sample(1)[0])
+
 
+def _parse_params(params_str: str) -> dict[str, float | str]:
+    params = {}
+    for param in filter(None, (p.strip() for p in params_str.split(","))):
+        key, value = param.split("=", 1)
+        key, value = key.strip(), value.strip()
+        try:
+            params[key] = float(value)
+        except ValueError:
+            params[key] = value
+    return params
 
-def distribution_factory(dist_str: str) -> DistributionStratetegy:
+
+def distribution_factory(dist_str: str, seed=None) -> DistributionStratetegy:
+    """
+    Build a distribution from a string such as "gaussian(mean=0,stddev=1)".
+
+    Supported: gaussian(mean, stddev), uniform(low, high),
+    lognormal(mean, sigma), powerlaw(alpha, xmin), zipf(a), fixed(value) and
+    empirical(path, bins), which follows the edge counts of a ``.data`` database.
+    Every distribution also accepts min=, max= bounds and
+    bounds=clip|truncate, e.g. "lognormal(mean=5,sigma=1,min=10,max=5000)".
+    """
     # examinate dist_str to detect which distribution to use and the parameters
-    if dist_str.startswith("gaussian"):
-        from distributions.gaussian import (
-            GaussianDistribution,
-        )  # local import to avoid circular dependency
-
-        # Example dist_str: "gaussian(mean=0,stddev=1)"
-        params_str = dist_str[len("gaussian(") : -1]
-        params = {}
-        for param in params_str.split(","):
-            key, value = param.split("=")
-            params[key.strip()] = float(value.strip())
-
-        return GaussianDistribution(mean=params["mean"], stddev=params["stddev"])
-    else:
+    name, sep, params_str = dist_str.strip().partition("(")
+    if not sep or not params_str.endswith(")"):
         raise ValueError(f"Unsupported distribution strategy: {dist_str}")
+    name = name.strip()
+    params = _parse_params(params_str[:-1])
+    common = dict(
+        low=params.pop("min", None),
+        high=params.pop("max", None),
+        bounds=params.pop("bounds", "clip"),
+        seed=seed,
+    )
+
+    try:
+        if name == "gaussian":
+            from distributions.gaussian import (
+                GaussianDistribution,
+            )  # local import to avoid circular dependency
+
+            return GaussianDistribution(
+                mean=params["mean"], stddev=params["stddev"], **common
+            )
+        elif name == "uniform":
+            from distributions.uniform import UniformDistribution
+
+            return UniformDistribution(
+                start=params["low"], end=params["high"], **common
+            )
+        elif name == "lognormal":
+            from distributions.lognormal import LogNormalDistribution
+
+            return LogNormalDistribution(
+                mean=params["mean"], sigma=params["sigma"], **common
+            )
+        elif name == "powerlaw":
+            from distributions.powerlaw import PowerLawDistribution
+
+            return PowerLawDistribution(
+                alpha=params["alpha"], xmin=params.get("xmin", 1.0), **common
+            )
+        elif name == "zipf":
+            from distributions.powerlaw import ZipfDistribution
+
+            return ZipfDistribution(a=params["a"], **common)
+        elif name == "fixed":
+            from distributions.fixed import FixedDistribution
+
+            return FixedDistribution(value=params["value"], **common)
+        elif name == "empirical":
+            from distributions.empirical import EmpiricalDistribution
+
+            return EmpiricalDistribution(
+                path=str(params["path"]),
+                max_bins=int(params.get("bins", 4096)),
+                **common,
+            )
+    except KeyError as e:
+        raise ValueError(f"Missing parameter {e} for distribution: {dist_str}")
+    raise ValueError(f"Unsupported distribution strategy: {dist_str}")
@@ -0,0 +1,16 @@
+import numpy as np
+
+from distributions.strategy import DistributionStratetegy
+
+
+class UniformDistribution(DistributionStratetegy):
+
+    def __init__(self, start: float, end: float, **kwargs):
+        super().__init__(**kwargs)
+        if start > end:
+            raise ValueError(f"Uniform range start {start} is greater than end {end}")
+        self.start = start
+        self.end = end
+
+    def _draw(self, n: int) -> np.ndarray:
+        return self._rng.uniform(self.start, self.end, size=n)
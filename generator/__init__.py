@@ -1,2 +1,9 @@
-from .graphs.strategy import generator_factory
-from .labels.strategy import label_factory
+from lazy import lazy_attributes
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "generator_factory": ".graphs.strategy",
+        "label_factory": ".labels.strategy",
+    },
+)
@@ -0,0 +1,98 @@
+import random
+from dataclasses import dataclass
+from functools import partial
+from typing import Iterator
+
+import numpy as np
+
+from generator.graphs.types import GRAPH_STRATEGIES
+from generator.labels.types import LABEL_STRATEGIES
+from graph import DBGraph
+from pipeline.executor import ordered_map
+
+
+@dataclass
+class GraphJob:
+    graph_id: int
+    num_nodes: int
+    num_edges: int
+    seed: np.random.SeedSequence
+
+
+@dataclass
+class BatchConfig:
+    graph_strategy: GRAPH_STRATEGIES
+    label_strategy: LABEL_STRATEGIES
+    node_labels: list[str]
+    edge_labels: list[str]
+    orientation: str = "new_to_old"
+    label_distribution: str = "uniform"
+    probabilities: tuple[float, float, float, float] | None = None
+
+
+def plan_jobs(
+    num_graphs: int,
+    num_nodes: list[int],
+    num_edges: list[int],
+    seed: int | None = None,
+) -> list[GraphJob]:
+    """
+    Build one job per graph. Sizes are either a single value shared by all
+    graphs or one value per graph; every job gets its own child of a root
+    SeedSequence, so results do not depend on which worker runs the job.
+    """
+
+    def expand(values: list[int], name: str) -> list[int]:
+        if len(values) == 1:
+            return values * num_graphs
+        if len(values) != num_graphs:
+            raise ValueError(
+                f"{name} must have 1 or {num_graphs} values, got {len(values)}"
+            )
+        return list(values)
+
+    nodes = expand(num_nodes, "num_nodes")
+    edges = expand(num_edges, "num_edges")
+    seeds = np.random.SeedSequence(seed).spawn(num_graphs)
+    return [
+        GraphJob(graph_id=i, num_nodes=n, num_edges=e, seed=s)
+        for i, (n, e, s) in enumerate(zip(nodes, edges, seeds))
+    ]
+
+
+def generate_graph(job: GraphJob, config: BatchConfig) -> DBGraph:
+    """Generate and label a single graph. Runs inside a worker process."""
+    from generator.graphs.strategy import generator_factory
+    from generator.labels.strategy import label_factory
+
+    graph_seed, label_seed = job.seed.spawn(2)
+    # Strategies that draw from the stdlib generator (e.g. Louvain)
+    random.seed(int(label_seed.generate_state(1, dtype=np.uint64)[0]))
+
+    graph_generator = generator_factory(
+        config.graph_strategy,
+        job.num_nodes,
+        job.num_edges,
+        seed=graph_seed,
+        orientation=config.orientation,
+        probabilities=config.probabilities,
+    )
+    g = graph_generator.generate()
+    label_factory(
+        config.label_strategy,
+        seed=label_seed,
+        distribution=config.label_distribution,
+    ).assign(
+        g, set(config.node_labels), set(config.edge_labels)
+    )
+    return DBGraph(g, graph_id=job.graph_id)
+
+
+def generate_graphs(
+    jobs: list[GraphJob], config: BatchConfig, workers: int | None = None
+) -> Iterator[DBGraph]:
+    """
+    Yield the generated graphs in job order. At most ``2 * workers`` jobs are
+    in flight, so finished graphs never pile up behind a slow one.
+    """
+    yield from ordered_map(partial(generate_graph, config=config), jobs, workers)
@@ -1,28 +1,139 @@
+from typing import Iterator
+
+import numpy as np
+
 from generator.graphs.strategy import GeneratorStrategy
 from graph import DirectedGraph
-import networkx as nx
 
 
 class AlbertBarabasiStrategy(GeneratorStrategy):
 
+    ORIENTATIONS = ("new_to_old", "old_to_new", "random")
+
     def __init__(
         self,
         num_nodes: int,
         connectivity: int,
+        orientation: str = "new_to_old",
+        seed: int | np.random.SeedSequence | None = None,
+        batch_size: int = 1 << 16,
     ):
         """
+        Preferential attachment over a preallocated repeated-nodes array.
+
+        The graph starts as a star of ``connectivity + 1`` nodes; every following
+        node attaches ``connectivity`` edges to targets drawn proportionally to
+        their degree. Targets are drawn with replacement, so the result is a
+        directed multigraph (parallel arcs are kept instead of re-drawn).
+
         Parameters
         ----------
         num_nodes : int
             Number of nodes
         connectivity : int
             Number of edges to attach from a new node to existing nodes
+        orientation : str
+            Direction of the emitted arcs: "new_to_old" (new node -> target),
+            "old_to_new" (target -> new node) or "random" (fair coin per arc).
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator, for reproducible graphs.
+        batch_size : int
+            Number of new nodes whose targets are sampled in one NumPy batch.
         """
         super().__init__()
+        if connectivity < 1 or connectivity >= num_nodes:
+            raise ValueError(
+                f"connectivity must be in [1, num_nodes), got {connectivity} with {num_nodes} nodes"
+            )
+        if orientation not in self.ORIENTATIONS:
+            raise ValueError(
+                f"Unknown orientation {orientation!r}, expected one of {self.ORIENTATIONS}"
+            )
         self.num_nodes = num_nodes
         self.connectivity = connectivity
+        self.orientation = orientation
+        self.seed = seed
+        self.batch_size = max(1, batch_size)
+
+    def num_edges(self) -> int:
+        m = self.connectivity
+        return m + m * (self.num_nodes - m - 1)
+
+    def generate_edge_batches(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield ``(src, dst)`` int64 arrays, one batch of new nodes at a time.
+
+        ``repeated`` holds both endpoints of every arc emitted so far
+        (``repeated[2e]`` is the new node of arc ``e``, ``repeated[2e + 1]`` its
+        target), so a uniform index into its filled prefix is a degree-weighted
+        node draw. Draws that fall inside the batch being built point at targets
+        that are not known yet; they are resolved by pointer jumping, which
+        terminates because every draw points strictly backwards.
+        """
+        rng = np.random.default_rng(self.seed)
+        m = self.connectivity
+        n = self.num_nodes
+        repeated = np.empty(2 * self.num_edges(), dtype=np.int64)
+
+        # Initial star: nodes 1..m attached to node 0
+        star = np.arange(1, m + 1, dtype=np.int64)
+        repeated[0 : 2 * m : 2] = star
+        repeated[1 : 2 * m : 2] = 0
+        yield self._orient(rng, star, np.zeros(m, dtype=np.int64))
+
+        filled_edges = m
+        for first in range(m + 1, n, self.batch_size):
+            last = min(first + self.batch_size, n)
+            new_nodes = np.arange(first, last, dtype=np.int64)
+            k = (last - first) * m
+
+            # Pool size seen by each arc: every arc of earlier nodes, both endpoints
+            step = np.repeat(np.arange(last - first, dtype=np.int64), m)
+            pool = 2 * (filled_edges + step * m)
+            draw = (rng.random(k) * pool).astype(np.int64)
+
+            src = np.repeat(new_nodes, m)
+            dst = np.empty(k, dtype=np.int64)
+
+            base = 2 * filled_edges
+            outside = draw < base
+            dst[outside] = repeated[draw[outside]]
+
+            # Draws inside the batch: even slots are new nodes, odd slots targets
+            local = draw[~outside] - base
+            inside = np.flatnonzero(~outside)
+            is_src = (local & 1) == 0
+            dst[inside[is_src]] = src[local[is_src] >> 1]
+
+            pending = inside[~is_src]
+            if pending.size:
+                parent = np.arange(k, dtype=np.int64)
+                parent[pending] = local[~is_src] >> 1
+                while True:
+                    jumped = parent[parent]
+                    if np.array_equal(jumped, parent):
+                        break
+                    parent = jumped
+                dst[pending] = dst[parent[pending]]
+
+            repeated[base : base + 2 * k : 2] = src
+            repeated[base + 1 : base + 2 * k : 2] = dst
+            filled_edges += k
+            yield self._orient(rng, src, dst)
+
+    def _orient(
+        self, rng: np.random.Generator, new: np.ndarray, old: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if self.orientation == "new_to_old":
+            return new, old
+        if self.orientation == "old_to_new":
+            return old, new
+        flip = rng.random(new.size) < 0.5
+        return np.where(flip, old, new), np.where(flip, new, old)
 
     def generate(self) -> DirectedGraph:
-        g_simple = nx.barabasi_albert_graph(self.num_nodes, self.connectivity)
-        g_multi = nx.MultiGraph(g_simple)
-        return g_multi
+        g = DirectedGraph()
+        g.add_nodes_from(range(self.num_nodes))
+        for src, dst in self.generate_edge_batches():
+            g.add_edges_from(zip(src.tolist(), dst.tolist()))
+        return g
@@ -0,0 +1,55 @@
+from typing import Iterator
+
+import numpy as np
+
+from generator.graphs.strategy import GeneratorStrategy
+from graph import DirectedGraph
+
+
+class RandomGraphStrategy(GeneratorStrategy):
+
+    def __init__(
+        self,
+        num_nodes: int,
+        num_edges: int,
+        seed: int | np.random.SeedSequence | None = None,
+        batch_size: int = 1 << 20,
+    ):
+        """
+        Uniform random directed multigraph: every arc picks both endpoints
+        uniformly at random, independently of the others.
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes
+        num_edges : int
+            Number of arcs (parallel arcs and self-loops are kept)
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator, for reproducible graphs.
+        batch_size : int
+            Number of arcs generated per NumPy batch.
+        """
+        super().__init__()
+        if num_nodes < 1 or num_edges < 0:
+            raise ValueError("num_nodes must be positive and num_edges non-negative")
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.seed = seed
+        self.batch_size = max(1, batch_size)
+
+    def generate_edge_batches(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        rng = np.random.default_rng(self.seed)
+        for start in range(0, self.num_edges, self.batch_size):
+            k = min(self.batch_size, self.num_edges - start)
+            yield (
+                rng.integers(0, self.num_nodes, size=k, dtype=np.int64),
+                rng.integers(0, self.num_nodes, size=k, dtype=np.int64),
+            )
+
+    def generate(self) -> DirectedGraph:
+        g = DirectedGraph()
+        g.add_nodes_from(range(self.num_nodes))
+        for src, dst in self.generate_edge_batches():
+            g.add_edges_from(zip(src.tolist(), dst.tolist()))
+        return g
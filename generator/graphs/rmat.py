@@ -0,0 +1,115 @@
+from typing import Iterator
+
+import numpy as np
+
+from generator.graphs.strategy import GeneratorStrategy
+from graph import DirectedGraph
+
+
+class RMATStrategy(GeneratorStrategy):
+
+    def __init__(
+        self,
+        num_nodes: int,
+        num_edges: int,
+        probabilities: tuple[float, float, float, float] = (0.57, 0.19, 0.19, 0.05),
+        seed: int | np.random.SeedSequence | None = None,
+        batch_size: int = 1 << 20,
+    ):
+        """
+        Recursive MATrix (R-MAT) generator, the Kronecker-style model used by Graph500.
+
+        Each arc picks one quadrant of the adjacency matrix per bit of the node
+        ids, with probabilities (a, b, c, d) for top-left, top-right,
+        bottom-left and bottom-right. Skewed probabilities give heavy-tailed
+        degrees and nested community structure. Arcs landing on ids beyond
+        ``num_nodes`` (when it is not a power of two) are redrawn.
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes
+        num_edges : int
+            Number of arcs to generate (parallel arcs and self-loops are kept)
+        probabilities : tuple[float, float, float, float]
+            Quadrant probabilities (a, b, c, d), must sum to 1
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator, for reproducible graphs.
+        batch_size : int
+            Number of arcs generated per NumPy batch.
+        """
+        super().__init__()
+        if num_nodes < 1 or num_edges < 0:
+            raise ValueError("num_nodes must be positive and num_edges non-negative")
+        if len(probabilities) != 4 or min(probabilities) < 0:
+            raise ValueError("probabilities must be four non-negative numbers (a, b, c, d)")
+        if not np.isclose(sum(probabilities), 1.0):
+            raise ValueError(f"probabilities must sum to 1, got {sum(probabilities)}")
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.probabilities = tuple(float(p) for p in probabilities)
+        self.seed = seed
+        self.batch_size = max(1, batch_size)
+        self.scale = max(1, int(np.ceil(np.log2(num_nodes))))
+        if not self._reaches_nodes():
+            raise ValueError(
+                f"probabilities {self.probabilities} never produce an arc between "
+                f"nodes below {num_nodes}"
+            )
+
+    def _reaches_nodes(self) -> bool:
+        """
+        Whether some arc with both endpoints in ``[0, num_nodes)`` has a
+        positive probability (otherwise every draw would be rejected).
+        """
+        bits = ((0, 0), (0, 1), (1, 0), (1, 1))
+        quadrants = [q for q, p in zip(bits, self.probabilities) if p > 0]
+        bound = self.num_nodes - 1
+        # From the top bit down, track whether src/dst still equal the bound's prefix
+        states = {(True, True)}
+        for level in reversed(range(self.scale)):
+            bit = (bound >> level) & 1
+            next_states = set()
+            for src_tight, dst_tight in states:
+                for src_bit, dst_bit in quadrants:
+                    if (src_tight and src_bit > bit) or (dst_tight and dst_bit > bit):
+                        continue
+                    next_states.add(
+                        (src_tight and src_bit == bit, dst_tight and dst_bit == bit)
+                    )
+            states = next_states
+        return bool(states)
+
+    def _draw(self, rng: np.random.Generator, k: int) -> tuple[np.ndarray, np.ndarray]:
+        a, b, c, _ = self.probabilities
+        src = np.zeros(k, dtype=np.int64)
+        dst = np.zeros(k, dtype=np.int64)
+        for level in range(self.scale):
+            r = rng.random(k)
+            src_bit = r >= a + b
+            dst_bit = ((r >= a) & ~src_bit) | (r >= a + b + c)
+            src |= src_bit.astype(np.int64) << level
+            dst |= dst_bit.astype(np.int64) << level
+        valid = (src < self.num_nodes) & (dst < self.num_nodes)
+        return src[valid], dst[valid]
+
+    def generate_edge_batches(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Yield ``(src, dst)`` int64 arrays of at most ``batch_size`` arcs each."""
+        rng = np.random.default_rng(self.seed)
+        remaining = self.num_edges
+        # Oversample to absorb the arcs rejected for falling outside [0, num_nodes)
+        acceptance = (self.num_nodes / (1 << self.scale)) ** 2
+        while remaining > 0:
+            k = min(self.batch_size, remaining)
+            src, dst = self._draw(rng, int(k / acceptance) + 1)
+            src, dst = src[:k], dst[:k]
+            remaining -= src.size
+            if src.size:
+                yield src, dst
+
+    def generate(self) -> DirectedGraph:
+        g = DirectedGraph()
+        g.add_nodes_from(range(self.num_nodes))
+        for src, dst in self.generate_edge_batches():
+            g.add_edges_from(zip(src.tolist(), dst.tolist()))
+        return g
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
+
+import numpy as np
 
 from generator.graphs.types import GRAPH_STRATEGIES
 from graph import DirectedGraph
@@ -10,22 +13,49 @@ class GeneratorStrategy(ABC):
         super().__init__()
 
     @abstractmethod
-    def generate(self, num_nodes: int, num_edges: int) -> DirectedGraph:
+    def generate(self) -> DirectedGraph:
         pass
 
+    def generate_edge_batches(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """
+        Yield the arcs of the graph as ``(src, dst)`` array batches, for
+        strategies that can produce them without building the graph.
+        Nodes are always ``0 .. num_nodes - 1``.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming generation"
+        )
+
+    def supports_batches(self) -> bool:
+        cls = type(self)
+        return cls.generate_edge_batches is not GeneratorStrategy.generate_edge_batches
+
 
 def generator_factory(
-    graph_strategy: GRAPH_STRATEGIES, num_nodes: int, num_edges: int
+    graph_strategy: GRAPH_STRATEGIES,
+    num_nodes: int,
+    num_edges: int,
+    seed=None,
+    orientation: str = "new_to_old",
+    probabilities: tuple[float, float, float, float] | None = None,
 ) -> GeneratorStrategy:
 
     if graph_strategy == GRAPH_STRATEGIES.barabasi_albert:
         from generator.graphs.albert_barabasi import AlbertBarabasiStrategy
 
         connectivity = max(1, num_edges // num_nodes)
-        return AlbertBarabasiStrategy(num_nodes, connectivity)
-    elif graph_strategy == GRAPH_STRATEGIES.random:
-        raise ValueError(
-            f"TO FIX: Random graph strategy not implemented yet. Implement inside generator/graphs/random.py"
+        return AlbertBarabasiStrategy(
+            num_nodes, connectivity, orientation=orientation, seed=seed
         )
+    elif graph_strategy == GRAPH_STRATEGIES.rmat:
+        from generator.graphs.rmat import RMATStrategy
+
+        if probabilities is None:
+            return RMATStrategy(num_nodes, num_edges, seed=seed)
+        return RMATStrategy(num_nodes, num_edges, probabilities, seed=seed)
+    elif graph_strategy == GRAPH_STRATEGIES.random:
+        from generator.graphs.random import RandomGraphStrategy
+
+        return RandomGraphStrategy(num_nodes, num_edges, seed=seed)
     else:
         raise ValueError(f"Unsupported graph strategy: {graph_strategy}")
@@ -4,6 +4,7 @@ from enum import Enum
 class GraphStrategyName(str, Enum):
     random = "random"
     barabasi_albert = "barabasi_albert"
+    rmat = "rmat"
 
 
 GRAPH_STRATEGIES = GraphStrategyName
@@ -0,0 +1,48 @@
+import hashlib
+import os
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "GRAPHTOOLKIT_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "graphtoolkit"),
+)
+
+
+class CommunityCache:
+    """
+    On-disk store of community assignments, one ``.npy`` file per key.
+
+    The key hashes the graph content (node ids and arc endpoints, in order),
+    the detection method and the seed, so a changed graph or seed never hits
+    a stale entry.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = os.path.join(cache_dir, "communities")
+
+    @staticmethod
+    def key(nodes: list, src: np.ndarray, dst: np.ndarray, method: str, seed) -> str:
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"{method}|{seed}|{len(nodes)}|".encode())
+        h.update(repr(nodes).encode())
+        h.update(np.ascontiguousarray(src).tobytes())
+        h.update(np.ascontiguousarray(dst).tobytes())
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def get(self, key: str) -> np.ndarray | None:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        return np.load(path)
+
+    def put(self, key: str, communities: np.ndarray) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename, so concurrent runs never read a partial file
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, communities)
+        os.replace(tmp_path, self._path(key))
@@ -1,13 +1,16 @@
-from generator.labels import LabelStrategy
-import random
+from generator.labels.cache import DEFAULT_CACHE_DIR, CommunityCache
+from generator.labels.strategy import LabelStrategy
+import numpy as np
 
-from graph import DirectedGraph
+from graph import DirectedGraph, undirected_csr
 from networkx.algorithms.community import louvain_communities
 
 
 class CommunityStrategy(LabelStrategy):
     """
-    Assigns community-based labels to nodes and edges. It uses the Louvain method to detect communities.
+    Assigns community-based labels to nodes and edges. Communities are found with
+    the Louvain method or, for large graphs, with a vectorized label propagation
+    over integer adjacency arrays.
 
     If the user provides node labels, they are assigned to communities in a round-robin fashion,
     otherwise communities are labeled with integers.
@@ -15,53 +18,138 @@ class CommunityStrategy(LabelStrategy):
     If the user provides edge labels, they are assigned to communities in a round-robin fashion,
     otherwise edges connecting nodes within the same community are labeled "1" and edges connecting
     nodes from different communities are labeled "0".
+
+    With a seed, community assignments are cached on disk keyed by the graph
+    content, the method and the seed, so repeated runs skip the detection.
     """
 
-    def __init__(self):
-        self._node_labels_assigned = set()
-        self._edge_labels_assigned = set()
-
-    def _get_node_label(self, node_labels: set[str], index: int) -> str:
-        if len(node_labels) == 0:
-            return str(index)
-        remaining_labels = node_labels.difference(self._node_labels_assigned)
-        if len(remaining_labels) > 0:
-            label = random.choice(list(remaining_labels))
-            self._node_labels_assigned.add(label)
-            return label
-        else:
-            self._node_labels_assigned.clear()
-            return self._get_node_label(node_labels, index)
-
-    def _get_edge_label(self, edge_labels: set[str]) -> str:
-        if len(edge_labels) == 0:
-            return None
-        remaining_labels = edge_labels.difference(self._edge_labels_assigned)
-        if len(remaining_labels) > 0:
-            label = random.choice(list(remaining_labels))
-            self._edge_labels_assigned.add(label)
-            return label
+    METHODS = ("louvain", "label_propagation")
+
+    def __init__(
+        self,
+        method: str = "louvain",
+        seed=None,
+        max_iter: int = 50,
+        cache_dir: str | None = DEFAULT_CACHE_DIR,
+    ):
+        if method not in self.METHODS:
+            raise ValueError(
+                f"Unknown community method {method!r}, expected one of {self.METHODS}"
+            )
+        self.method = method
+        if isinstance(seed, np.random.SeedSequence):
+            seed = int(seed.generate_state(1, dtype=np.uint32)[0])
+        self.seed = seed
+        self.max_iter = max_iter
+        self._rng = np.random.default_rng(seed)
+        self._cache = CommunityCache(cache_dir) if cache_dir is not None else None
+
+    def _round_robin(self, labels: set[str], size: int) -> np.ndarray:
+        """
+        Draw ``size`` labels so that every label is used once before any is reused.
+        """
+        choices = np.array(sorted(labels))
+        rounds = -(-size // len(choices))
+        # One random permutation per row (round), drawn in a single call
+        order = self._rng.random((rounds, len(choices))).argsort(axis=1).ravel()
+        return choices[order[:size]]
+
+    def _label_propagation(
+        self, indptr: np.ndarray, neighbors: np.ndarray
+    ) -> np.ndarray:
+        """
+        Semi-synchronous label propagation: each round, a random half of the
+        nodes adopts the most frequent label among its neighbors (ties broken
+        at random). Updating only half of the nodes avoids the oscillations of
+        fully synchronous updates on bipartite-like regions.
+        """
+        num_nodes = len(indptr) - 1
+        labels = np.arange(num_nodes, dtype=np.int64)
+        owner = np.repeat(np.arange(num_nodes, dtype=np.int64), np.diff(indptr))
+        if owner.size == 0:
+            return labels
+
+        for _ in range(self.max_iter):
+            # Count (node, neighbor label) pairs with one sort
+            keys = owner * num_nodes + labels[neighbors]
+            pairs, counts = np.unique(keys, return_counts=True)
+            pair_node = pairs // num_nodes
+            pair_label = pairs % num_nodes
+            # Converged once every node already holds one of its most frequent labels
+            best_count = np.zeros(num_nodes, dtype=np.int64)
+            np.maximum.at(best_count, pair_node, counts)
+            holds = pair_label == labels[pair_node]
+            current_count = np.zeros(num_nodes, dtype=np.int64)
+            current_count[pair_node[holds]] = counts[holds]
+            if np.array_equal(current_count, best_count):
+                break
+
+            score = counts + self._rng.random(counts.size)
+            # Best pair per node: sort by node, then by descending score
+            order = np.lexsort((-score, pair_node))
+            first = np.ones(order.size, dtype=bool)
+            first[1:] = pair_node[order][1:] != pair_node[order][:-1]
+            best_node = pair_node[order][first]
+            best_label = pair_label[order][first]
+
+            update = self._rng.random(best_node.size) < 0.5
+            labels[best_node[update]] = best_label[update]
+
+        return np.unique(labels, return_inverse=True)[1]
+
+    def _louvain(self, graph: DirectedGraph, nodes: list) -> np.ndarray:
+        node_to_idx = {node: i for i, node in enumerate(nodes)}
+        communities = np.empty(len(nodes), dtype=np.int64)
+        for i, comm in enumerate(louvain_communities(graph, seed=self.seed)):
+            communities[[node_to_idx[node] for node in comm]] = i
+        return communities
+
+    def communities(self, graph: DirectedGraph) -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return ``(nodes, src, dst, communities)``, where ``communities[i]`` is
+        the community id of ``nodes[i]`` and ``src``/``dst`` are the arc
+        endpoints as positions into ``nodes``.
+        """
+        nodes, src, dst = graph.edge_arrays()
+        use_cache = self._cache is not None and self.seed is not None
+        if use_cache:
+            key = self._cache.key(nodes, src, dst, self.method, self.seed)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return nodes, src, dst, cached
+
+        if self.method == "louvain":
+            communities = self._louvain(graph, nodes)
         else:
-            self._edge_labels_assigned.clear()
-            return self._get_edge_label(edge_labels)
+            indptr, neighbors, _ = undirected_csr(len(nodes), src, dst)
+            communities = self._label_propagation(indptr, neighbors)
+
+        if use_cache:
+            self._cache.put(key, communities)
+        return nodes, src, dst, communities
 
     def assign(
-        self, graph: DirectedGraph, node_labels: set[str], edge_labels: set[str]
-    ):
-        communities = louvain_communities(graph)
-        for i, comm in enumerate(communities):
-            # choose random node label from the provided list
-            node_label = self._get_node_label(node_labels, i)
-            for node in comm:
-                graph.nodes[node]["label"] = f"{node_label}"
-
-        for u, v, k in graph.edges(keys=True):
-            edge_label = self._get_edge_label(edge_labels)
-            if graph.nodes[u]["label"] == graph.nodes[v]["label"]:
-                graph.edges[u, v, k]["label"] = (
-                    edge_label if edge_label is not None else "1"
-                )
-            else:
-                graph.edges[u, v, k]["label"] = (
-                    edge_label if edge_label is not None else "0"
-                )
+        self,
+        graph: DirectedGraph,
+        node_labels: set[str] | None = None,
+        edge_labels: set[str] | None = None,
+    ) -> DirectedGraph:
+        nodes, src, dst, communities = self.communities(graph)
+        num_communities = int(communities.max()) + 1 if len(nodes) else 0
+
+        if node_labels:
+            community_labels = self._round_robin(node_labels, num_communities)
+        else:
+            community_labels = np.arange(num_communities).astype(str)
+        for (_, data), label in zip(
+            graph.nodes(data=True), community_labels[communities].tolist()
+        ):
+            data["label"] = label
+
+        if edge_labels:
+            labels = self._round_robin(edge_labels, len(src))
+        else:
+            labels = np.where(communities[src] == communities[dst], "1", "0")
+        for (_, _, data), label in zip(graph.edges(data=True), labels.tolist()):
+            data["label"] = label
+        return graph
@@ -4,5 +4,11 @@ from .strategy import LabelStrategy
 
 class NoneLabelStrategy(LabelStrategy):
 
-    def assign(self, graph) -> DirectedGraph:
+    def assign(self, graph, node_labels=None, edge_labels=None) -> DirectedGraph:
         return graph
+
+    def label_nodes(self, nodes, node_labels=None):
+        return None
+
+    def label_edges(self, src, dst, edge_labels=None):
+        return None
@@ -1,29 +1,87 @@
-from generator.labels import LabelStrategy
+from generator.labels.strategy import LabelStrategy
 from graph import DirectedGraph
-import random
+import numpy as np
 
 
 class RandomStrategy(LabelStrategy):
     """
     Assigns random labels to nodes and edges from the provided label lists.
+
+    Labels are drawn for all nodes (and all edges) in a single NumPy call and
+    written in one pass over the attribute dicts. With ``distribution="zipf"`` the
+    k-th label (in sorted order) is drawn with probability proportional to
+    ``1 / k ** zipf_exponent``; ``weights`` gives explicit per-label weights.
     """
 
-    def assign(
-        self, graph: DirectedGraph, node_labels: set[str], edge_labels: set[str]
+    DISTRIBUTIONS = ("uniform", "zipf")
+
+    def __init__(
+        self,
+        seed=None,
+        distribution: str = "uniform",
+        zipf_exponent: float = 1.0,
+        weights: dict[str, float] | None = None,
     ):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown label distribution {distribution!r}, expected one of {self.DISTRIBUTIONS}"
+            )
+        self._rng = np.random.default_rng(seed)
+        self.distribution = distribution
+        self.zipf_exponent = zipf_exponent
+        self.weights = weights
+
+    def assign(
+        self,
+        graph: DirectedGraph,
+        node_labels: set[str] | None = None,
+        edge_labels: set[str] | None = None,
+    ) -> DirectedGraph:
         self.assign_random_node_labels(graph, node_labels)
         self.assign_random_edge_labels(graph, edge_labels)
+        return graph
 
     def assign_random_node_labels(
         self, graph: DirectedGraph, node_labels: set[str]
     ) -> None:
-        for node in graph.nodes():
-            label = random.choice(list(node_labels))
-            graph.nodes[node]["label"] = label
+        labels = self._draw(node_labels, graph.number_of_nodes()).tolist()
+        # One pass over the attribute dicts: cheaper than building the
+        # {node: label} mapping that nx.set_node_attributes expects
+        for (_, data), label in zip(graph.nodes(data=True), labels):
+            data["label"] = label
 
     def assign_random_edge_labels(
         self, graph: DirectedGraph, edge_labels: set[str]
     ) -> None:
-        for u, v, key in graph.edges(keys=True):
-            label = random.choice(list(edge_labels))
-            graph.edges[u, v, key]["label"] = label
+        labels = self._draw(edge_labels, graph.number_of_edges()).tolist()
+        for (_, _, data), label in zip(graph.edges(data=True), labels):
+            data["label"] = label
+
+    def _probabilities(self, choices: np.ndarray) -> np.ndarray | None:
+        if self.weights is not None:
+            p = np.array([self.weights.get(c, 0.0) for c in choices], dtype=np.float64)
+        elif self.distribution == "zipf":
+            p = 1.0 / np.arange(1, len(choices) + 1, dtype=np.float64) ** self.zipf_exponent
+        else:
+            return None
+        if p.sum() <= 0:
+            raise ValueError("Label weights must not all be zero")
+        return p / p.sum()
+
+    def _draw(self, labels: set[str] | None, size: int) -> np.ndarray:
+        if not labels:
+            raise ValueError(
+                "Random labelling needs non-empty node and edge label sets (see --labels)"
+            )
+        # sorted so that a seeded run does not depend on set iteration order
+        choices = np.array(sorted(labels))
+        p = self._probabilities(choices)
+        if p is None:
+            return choices[self._rng.integers(0, len(choices), size=size)]
+        return choices[self._rng.choice(len(choices), size=size, p=p)]
+
+    def label_nodes(self, nodes, node_labels=None):
+        return self._draw(node_labels, len(nodes))
+
+    def label_edges(self, src, dst, edge_labels=None):
+        return self._draw(edge_labels, len(src))
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from generator.labels.types import LabelStrategyName
 from graph import DirectedGraph
 
@@ -7,23 +9,91 @@ from graph import DirectedGraph
 class LabelStrategy(ABC):
 
     @abstractmethod
-    def assign(self, graph: DirectedGraph) -> DirectedGraph:
+    def assign(
+        self,
+        graph: DirectedGraph,
+        node_labels: set[str] | None = None,
+        edge_labels: set[str] | None = None,
+    ) -> DirectedGraph:
         pass
 
+    def label_nodes(
+        self, nodes: np.ndarray, node_labels: set[str] | None = None
+    ) -> np.ndarray | None:
+        """
+        Return one label per node of a batch (or None for unlabelled nodes),
+        for strategies that only need local information.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} needs the whole graph and cannot label batches"
+        )
+
+    def label_edges(
+        self, src: np.ndarray, dst: np.ndarray, edge_labels: set[str] | None = None
+    ) -> np.ndarray | None:
+        """Return one label per arc of a batch (or None for unlabelled arcs)."""
+        raise NotImplementedError(
+            f"{type(self).__name__} needs the whole graph and cannot label batches"
+        )
+
+    def supports_batches(self) -> bool:
+        cls = type(self)
+        return (
+            cls.label_nodes is not LabelStrategy.label_nodes
+            and cls.label_edges is not LabelStrategy.label_edges
+        )
+
 
-def label_factory(label_strategy: LabelStrategyName) -> LabelStrategy:
+def label_factory(
+    label_strategy: LabelStrategyName, seed=None, distribution: str = "uniform"
+) -> LabelStrategy:
+    """
+    ``distribution`` applies to random labels: "uniform", "zipf", "zipf(s=1.5)"
+    or explicit per-label weights such as "weights(A=3,B=1)" (labels left out
+    get weight 0).
+    """
 
     if label_strategy == LabelStrategyName.none:
         from generator.labels.none import NoneLabelStrategy
 
         return NoneLabelStrategy()
     elif label_strategy == LabelStrategyName.random:
-        from generator.labels.random import RandomLabelStrategy
+        from generator.labels.random import RandomStrategy
 
-        return RandomLabelStrategy()
+        name, _, params_str = distribution.partition("(")
+        params = {}
+        for param in filter(None, params_str.rstrip(")").split(",")):
+            key, value = param.split("=")
+            params[key.strip()] = float(value.strip())
+        name = name.strip()
+        if name == "weights":
+            return RandomStrategy(seed=seed, weights=params)
+        return RandomStrategy(
+            seed=seed,
+            distribution=name,
+            zipf_exponent=params.get("s", 1.0),
+        )
     elif label_strategy == LabelStrategyName.community:
-        from generator.labels.community import CommunityLabelStrategy
+        from generator.labels.community import CommunityStrategy
 
-        return CommunityLabelStrategy()
+        return CommunityStrategy(seed=seed)
+    elif label_strategy == LabelStrategyName.community_lpa:
+        from generator.labels.community import CommunityStrategy
+
+        return CommunityStrategy(method="label_propagation", seed=seed)
     else:
         raise ValueError(f"Unsupported label strategy: {label_strategy}")
+
+
+def load_labels(path: str | None) -> tuple[set[str], set[str]]:
+    """
+    Read node and edge labels from a JSON file of the form
+    {"node_labels": ["lab1", ...], "edge_labels": ["labA", ...]}.
+    """
+    if path is None:
+        return set(), set()
+    import json
+
+    with open(path, "r") as f:
+        labels = json.load(f)
+    return set(labels.get("node_labels", [])), set(labels.get("edge_labels", []))
@@ -5,6 +5,7 @@ class LabelStrategyName(str, Enum):
     none = "none"
     random = "random"
     community = "community"
+    community_lpa = "community_lpa"
 
 
 LABEL_STRATEGIES = LabelStrategyName
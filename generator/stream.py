@@ -0,0 +1,32 @@
+from typing import Iterator
+
+import numpy as np
+
+from generator.graphs.strategy import GeneratorStrategy
+from generator.labels.strategy import LabelStrategy
+from records import EdgeBatch, NodeBatch
+
+
+def stream_graph(
+    graph_strategy: GeneratorStrategy,
+    label_strategy: LabelStrategy,
+    node_labels: set[str] | None = None,
+    edge_labels: set[str] | None = None,
+    batch_size: int = 1 << 20,
+) -> Iterator[NodeBatch | EdgeBatch]:
+    """
+    Lazily produce a labelled graph as node batches followed by edge batches.
+
+    Only one batch is alive at a time, so a saver consuming this iterator can
+    write graphs far larger than memory. Requires a generator strategy that
+    implements ``generate_edge_batches`` and a label strategy that can label
+    batches.
+    """
+    for start in range(0, graph_strategy.num_nodes, batch_size):
+        ids = np.arange(
+            start, min(start + batch_size, graph_strategy.num_nodes), dtype=np.int64
+        )
+        yield NodeBatch(ids, label_strategy.label_nodes(ids, node_labels))
+
+    for src, dst in graph_strategy.generate_edge_batches():
+        yield EdgeBatch(src, dst, label_strategy.label_edges(src, dst, edge_labels))
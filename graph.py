@@ -1,7 +1,25 @@
 import networkx as nx
 from collections import deque
 import numpy as np
-import random
+
+from instrument import timed
+from memory import EDGE_BYTES, NODE_BYTES
+from landmarks import NUM_LANDMARKS, LandmarkSelection
+from records import GraphArrays, label_codes
+
+
+def undirected_csr(
+    num_nodes: int, src: np.ndarray, dst: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """CSR ``(indptr, neighbors, edge_ids)`` of the undirected view of the given arcs."""
+    num_edges = len(src)
+    heads = np.concatenate([src, dst])
+    order = np.argsort(heads, kind="stable")
+    neighbors = np.concatenate([dst, src])[order]
+    edge_ids = np.concatenate([np.arange(num_edges), np.arange(num_edges)])[order]
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=num_nodes), out=indptr[1:])
+    return indptr, neighbors, edge_ids
 
 
 class DirectedGraph(nx.MultiDiGraph):
@@ -9,63 +27,125 @@ class DirectedGraph(nx.MultiDiGraph):
     def __init__(self, graph=None, **attr):
         super().__init__(graph, **attr)
 
-    def extract_k_distant_nodes(self, k: int, num_landmarks: int = 20) -> list:
+    def node_positions(self) -> tuple[list, dict | range]:
         """
-        Ultra-fast distance approximation for large graphs using Landmark Sketching.
-
-        Args:
-            k: Number of distant nodes to extract.
-            num_landmarks: Number of landmark nodes to use for distance approximation.
+        ``(nodes, node_to_idx)``: the nodes in iteration order and a mapping
+        from node to position. For compact graphs (nodes ``0..n-1`` in order,
+        see ``idmap.compact_graph``) the mapping is ``range(n)``, which
+        indexes without hashing.
         """
-        num_nodes = self.number_of_nodes()
-        if k <= 0:
-            return []
-        if k >= num_nodes:
-            return list(self.nodes())
-
         nodes = list(self.nodes())
-        node_to_idx = {node: i for i, node in enumerate(nodes)}
-
-        # 1. Select random landmarks
-        # We use random sampling as it provides good coverage of the graph 'volume'
-        landmarks = random.sample(nodes, min(num_landmarks, num_nodes))
-
-        # 2. Build the Distance Matrix (O(L * (V+E)))
-        # We use a 16-bit or 32-bit int to save memory at 500k scale
-        # Value 'num_nodes' acts as a proxy for infinity (unreachable)
-        G_undirected = self.to_undirected()
-        dist_matrix = np.full((num_nodes, len(landmarks)), num_nodes, dtype=np.int32)
+        if nodes == list(range(len(nodes))):
+            return nodes, range(len(nodes))
+        return nodes, {node: i for i, node in enumerate(nodes)}
 
-        for i, landmark in enumerate(landmarks):
-            # Single-source BFS
-            lengths = nx.single_source_shortest_path_length(G_undirected, landmark)
-            for node, dist in lengths.items():
-                dist_matrix[node_to_idx[node], i] = dist
+    def estimated_size(self) -> int:
+        """Approximate bytes held by the graph, from its node and arc counts."""
+        return NODE_BYTES * self.number_of_nodes() + EDGE_BYTES * self.number_of_edges()
 
-        # 3. Greedy Vector Selection (O(k * N))
-        # Start with the node furthest from the first landmark to avoid 'center' nodes
-        first_idx = np.argmax(dist_matrix[:, 0])
-        selected_indices = [first_idx]
-
-        # Initialize min_dists with distances to the first selected node
-        # Using Manhattan distance (L1 norm) on landmark vectors
-        current_vec = dist_matrix[first_idx]
-        min_dists = np.sum(np.abs(dist_matrix - current_vec), axis=1).astype(np.float64)
-
-        for _ in range(k - 1):
-            # Select node with largest minimum distance to the current set
-            farthest_idx = np.argmax(min_dists)
-            selected_indices.append(farthest_idx)
+    def adjacency_pairs(self) -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Distinct ``(u, v)`` pairs as ``(nodes, heads, tails, multiplicity)``:
+        int64 positions into ``nodes`` and the number of parallel arcs of each
+        pair, in ``self.edges()`` order.
+        """
+        nodes, node_to_idx = self.node_positions()
+        # Walk the adjacency once per (u, v) pair instead of paying the edge
+        # view's per-arc overhead
+        heads, tails, multiplicity = [], [], []
+        for u, nbrs in self._adj.items():
+            u_idx = node_to_idx[u]
+            for v, keydict in nbrs.items():
+                heads.append(u_idx)
+                tails.append(node_to_idx[v])
+                multiplicity.append(len(keydict))
+        return (
+            nodes,
+            np.array(heads, dtype=np.int64),
+            np.array(tails, dtype=np.int64),
+            np.array(multiplicity, dtype=np.int64),
+        )
+
+    def edge_arrays(self) -> tuple[list, np.ndarray, np.ndarray]:
+        """
+        Integer view of the arcs: ``(nodes, src, dst)`` where ``src``/``dst``
+        are int64 positions into ``nodes``, in ``self.edges()`` order.
+        """
+        nodes, heads, tails, multiplicity = self.adjacency_pairs()
+        # Expand parallel arcs
+        return nodes, np.repeat(heads, multiplicity), np.repeat(tails, multiplicity)
 
-            # Update distances: compare existing min_dist vs distance to new node
-            new_vec = dist_matrix[farthest_idx]
-            dist_to_new = np.sum(np.abs(dist_matrix - new_vec), axis=1)
+    def to_arrays(
+        self, node_vocab: dict | None = None, edge_vocab: dict | None = None
+    ) -> GraphArrays:
+        """
+        The graph as ``GraphArrays`` (int64 ``edge_index`` of shape ``(2, E)``
+        in ``self.edges()`` order, node and arc label codes). Labels are coded
+        through ``node_vocab``/``edge_vocab``, which are extended in place, so
+        several graphs can share them.
+        """
+        node_vocab = {} if node_vocab is None else node_vocab
+        edge_vocab = {} if edge_vocab is None else edge_vocab
+        nodes, heads, tails, multiplicity = self.adjacency_pairs()
+        node_labels = label_codes(
+            [data.get("labels", data.get("label")) for data in self._node.values()],
+            node_vocab,
+        )
+        # Same traversal order as adjacency_pairs, one entry per parallel arc
+        edge_labels = label_codes(
+            [
+                data.get("label")
+                for nbrs in self._adj.values()
+                for keydict in nbrs.values()
+                for data in keydict.values()
+            ],
+            edge_vocab,
+        )
+        return GraphArrays(
+            node_ids=np.asarray(nodes) if nodes else np.empty(0, dtype=np.int64),
+            node_labels=node_labels,
+            edge_index=np.stack(
+                [np.repeat(heads, multiplicity), np.repeat(tails, multiplicity)]
+            ),
+            edge_labels=edge_labels,
+        )
+
+    def undirected_csr(self) -> tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Undirected adjacency in CSR form: ``(nodes, indptr, neighbors, edge_ids)``.
 
-            # Vectorized update is extremely fast in NumPy
-            min_dists = np.minimum(min_dists, dist_to_new)
+        The neighbors of node position ``i`` are ``neighbors[indptr[i]:indptr[i + 1]]``;
+        ``edge_ids`` gives, for each entry, the position of the arc in
+        ``self.edges()`` order. Every arc appears once at each endpoint.
+        """
+        nodes, src, dst = self.edge_arrays()
+        return (nodes, *undirected_csr(len(nodes), src, dst))
 
-        return [nodes[i] for i in selected_indices]
+    @timed("extract_k_distant_nodes")
+    def extract_k_distant_nodes(
+        self, k: int, num_landmarks: int = NUM_LANDMARKS, selection=None
+    ) -> list:
+        """
+        Ultra-fast distance approximation for large graphs using Landmark Sketching.
 
+        Args:
+            k: Number of distant nodes to extract.
+            num_landmarks: Number of landmark nodes to use for distance approximation.
+            selection: Optional ``LandmarkSelection`` to reuse (e.g. loaded from
+                disk). Its landmark distances are not recomputed and its
+                already-selected nodes seed the greedy selection; only the
+                nodes added to reach ``k`` are returned.
+        """
+        if selection is None:
+            num_nodes = self.number_of_nodes()
+            if k <= 0:
+                return []
+            if k >= num_nodes:
+                return list(self.nodes())
+            selection = LandmarkSelection.from_graph(self, num_landmarks)
+        return selection.select(min(k, len(selection.nodes)))
+
+    @timed("extract_subgraph_by_edge_count")
     def extract_subgraph_by_edge_count(self, source_node, num_edges) -> "DirectedGraph":
         """BFS expansion that collects up to ``num_edges`` edges, keeping attributes."""
         if source_node not in self:
@@ -0,0 +1,86 @@
+import os
+from dataclasses import dataclass
+
+import networkx as nx
+import numpy as np
+
+from graph import DirectedGraph
+
+
+@dataclass
+class IdMap:
+    """
+    Mapping between the node ids of a source graph and compact ids
+    ``0..n-1``: compact id ``i`` stands for ``original[i]``. ``original`` is
+    sorted, so the compaction keeps the relative order of the ids.
+    """
+
+    original: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.original)
+
+    def restore(self, ids: np.ndarray) -> np.ndarray:
+        """Original ids of the given compact ids."""
+        return self.original[ids]
+
+    def compact(self, ids: np.ndarray) -> np.ndarray:
+        """Compact ids of the given original ids (which must be mapped)."""
+        ids = np.asarray(ids)
+        positions = np.searchsorted(self.original, ids)
+        found = positions < len(self.original)
+        found[found] = self.original[positions[found]] == ids[found]
+        if not found.all():
+            raise KeyError(f"Node ids not in the mapping: {ids[~found][:5].tolist()}")
+        return positions
+
+    def restore_graph(self, graph: DirectedGraph) -> DirectedGraph:
+        """Copy of ``graph`` (with compact node ids) relabelled with the original ids."""
+        nodes = list(graph.nodes())
+        restored = self.restore(np.asarray(nodes, dtype=np.int64)).tolist()
+        return nx.relabel_nodes(graph, dict(zip(nodes, restored)), copy=True)
+
+    @staticmethod
+    def path_for(output_path: str) -> str:
+        return f"{output_path}.ids.npy"
+
+    def save(self, path: str) -> None:
+        # np.save appends .npy unless the path already ends with it
+        tmp = f"{path[:-len('.npy')]}.tmp.npy"
+        np.save(tmp, self.original)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "IdMap":
+        return cls(np.load(path))
+
+
+def compact_graph(graph: DirectedGraph) -> tuple[DirectedGraph, IdMap]:
+    """
+    Relabel the nodes of ``graph`` to ``0..n-1`` (in the order of their
+    original ids, with ``np.unique(return_inverse=True)``) and return the new
+    graph, whose nodes are inserted in id order, with the mapping. Node, arc
+    and graph attributes and arc keys are kept.
+    """
+    nodes, src, dst = graph.edge_arrays()
+    original, compact = np.unique(np.asarray(nodes), return_inverse=True)
+    compact = compact.reshape(-1)
+    node_data = list(graph._node.values())
+
+    compacted = graph.__class__()
+    compacted.graph.update(graph.graph)
+    # Insert nodes by compact id, so node positions equal node ids
+    order = np.argsort(compact)
+    compacted.add_nodes_from(
+        (node_id, node_data[position])
+        for node_id, position in zip(compact[order].tolist(), order.tolist())
+    )
+    compacted.add_edges_from(
+        (u, v, key, data)
+        for u, v, (_, _, key, data) in zip(
+            compact[src].tolist(),
+            compact[dst].tolist(),
+            graph.edges(keys=True, data=True),
+        )
+    )
+    return compacted, IdMap(original)
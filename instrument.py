@@ -0,0 +1,176 @@
+"""
+Low-overhead instrumentation: named timers, counters and peak-RSS samples.
+
+Everything goes through the process-wide ``METRICS`` object, which is
+disabled by default; in that state ``timer`` returns a shared no-op context
+manager and ``timed`` wrappers cost one attribute check per call. The CLI
+enables it with ``--metrics-out``/``--profile`` and writes ``report()`` as JSON.
+
+Only the standard library is imported here, so instrumented modules do not
+slow down CLI startup.
+"""
+
+import functools
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, TypeVar
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+T = TypeVar("T")
+
+
+def peak_rss_mb(children: bool = False) -> float | None:
+    """Peak resident set size of this process (or of its reaped children) in MB."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _Timer:
+    __slots__ = ("count", "total", "max", "peak_rss_mb")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.peak_rss_mb = None
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "mean_s": round(self.total / self.count, 6) if self.count else 0.0,
+            "max_s": round(self.max, 6),
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+
+
+class _NoOp:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoOp()
+
+
+class Metrics:
+
+    def __init__(self):
+        self.enabled = False
+        self.timers: dict[str, _Timer] = {}
+        self.counters: dict[str, int] = {}
+        self._start = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._start = time.perf_counter()
+
+    def record(self, name: str, elapsed: float) -> None:
+        entry = self.timers.get(name)
+        if entry is None:
+            entry = self.timers[name] = _Timer()
+        entry.add(elapsed)
+        # Peak RSS is a running maximum, so sampling it after the stage tells
+        # how high memory had gone by the time the stage finished
+        entry.peak_rss_mb = peak_rss_mb()
+
+    def merge(self, name: str, total: float, count: int) -> None:
+        """Add time measured elsewhere (e.g. in worker processes) as one entry."""
+        entry = self.timers.get(name)
+        if entry is None:
+            entry = self.timers[name] = _Timer()
+        entry.count += count
+        entry.total += total
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextmanager
+    def _timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timer(self, name: str):
+        """Context manager timing its body under ``name``."""
+        if not self.enabled:
+            return _NOOP
+        return self._timer(name)
+
+    def report(self, **extra) -> dict:
+        return {
+            **extra,
+            "wall_s": round(time.perf_counter() - self._start, 6),
+            "peak_rss_mb": peak_rss_mb(),
+            "children_peak_rss_mb": peak_rss_mb(children=True),
+            "timers": {name: t.as_dict() for name, t in self.timers.items()},
+            "counters": dict(self.counters),
+        }
+
+    def write(self, path: str, **extra) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(**extra), f, indent=2)
+            f.write("\n")
+
+
+METRICS = Metrics()
+
+
+def timer(name: str):
+    return METRICS.timer(name)
+
+
+def timed(name: str) -> Callable:
+    """Decorator timing every call of the wrapped function under ``name``."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                METRICS.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def timed_iter(name: str, iterable: Iterable[T]) -> Iterator[T]:
+    """Yield from ``iterable``, timing each step (e.g. parsing the next graph)."""
+    if not METRICS.enabled:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        METRICS.record(name, time.perf_counter() - start)
+        yield item
@@ -0,0 +1,150 @@
+import os
+import random
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import networkx as nx
+import numpy as np
+
+from instrument import timer
+
+if TYPE_CHECKING:
+    from graph import DirectedGraph
+
+# Default number of BFS landmarks, also part of the stamp of saved selections
+NUM_LANDMARKS = 20
+
+
+@dataclass
+class LandmarkSelection:
+    """
+    State of the farthest-point selection behind ``extract_k_distant_nodes``.
+
+    ``dist_matrix[i, j]`` is the BFS distance (on the undirected view) from
+    landmark ``j`` to ``nodes[i]``, ``num_nodes`` standing in for unreachable.
+    ``selected`` holds the positions picked so far and ``min_dists`` the L1
+    distance of every node's landmark vector to the closest of them, so the
+    greedy selection can be extended later (e.g. from a saved copy) with
+    exactly the nodes a longer run would have picked.
+    """
+
+    nodes: list
+    dist_matrix: np.ndarray
+    selected: list[int]
+    min_dists: np.ndarray | None = None
+
+    @classmethod
+    def from_graph(
+        cls, graph: "DirectedGraph", num_landmarks: int = NUM_LANDMARKS
+    ) -> "LandmarkSelection":
+        nodes, node_to_idx = graph.node_positions()
+        num_nodes = len(nodes)
+
+        # 1. Select random landmarks
+        # We use random sampling as it provides good coverage of the graph 'volume'
+        landmarks = random.sample(nodes, min(num_landmarks, num_nodes))
+
+        # 2. Build the Distance Matrix (O(L * (V+E)))
+        # We use a 16-bit or 32-bit int to save memory at 500k scale
+        # Value 'num_nodes' acts as a proxy for infinity (unreachable)
+        with timer("extract_k_distant_nodes.bfs"):
+            G_undirected = graph.to_undirected()
+            dist_matrix = np.full((num_nodes, len(landmarks)), num_nodes, dtype=np.int32)
+
+            for i, landmark in enumerate(landmarks):
+                # Single-source BFS
+                lengths = nx.single_source_shortest_path_length(G_undirected, landmark)
+                rows = np.fromiter(
+                    map(node_to_idx.__getitem__, lengths), dtype=np.int64, count=len(lengths)
+                )
+                dist_matrix[rows, i] = np.fromiter(
+                    lengths.values(), dtype=np.int64, count=len(lengths)
+                )
+
+        return cls(nodes, dist_matrix, [])
+
+    def assume(self, selected: list) -> None:
+        """
+        Mark ``selected`` nodes as already picked, e.g. the start nodes of an
+        existing database whose saved selection is gone. Costs one distance
+        pass per node, which a saved selection avoids.
+        """
+        positions = {node: i for i, node in enumerate(self.nodes)}
+        self.selected = [positions[node] for node in selected]
+        self.min_dists = None
+        for i in self.selected:
+            dist = np.sum(np.abs(self.dist_matrix - self.dist_matrix[i]), axis=1)
+            self.min_dists = (
+                dist.astype(np.float64)
+                if self.min_dists is None
+                else np.minimum(self.min_dists, dist)
+            )
+
+    def select(self, k: int) -> list:
+        """Extend the selection to ``k`` nodes and return the newly selected ones."""
+        start = len(self.selected)
+        with timer("extract_k_distant_nodes.greedy"):
+            if not self.selected and k > 0:
+                # 3. Greedy Vector Selection (O(k * N))
+                # Start with the node furthest from the first landmark to avoid 'center' nodes
+                first_idx = int(np.argmax(self.dist_matrix[:, 0]))
+                self.selected.append(first_idx)
+
+                # Initialize min_dists with distances to the first selected node
+                # Using Manhattan distance (L1 norm) on landmark vectors
+                current_vec = self.dist_matrix[first_idx]
+                self.min_dists = np.sum(
+                    np.abs(self.dist_matrix - current_vec), axis=1
+                ).astype(np.float64)
+
+            while len(self.selected) < k:
+                # Select node with largest minimum distance to the current set
+                farthest_idx = int(np.argmax(self.min_dists))
+                self.selected.append(farthest_idx)
+
+                # Update distances: compare existing min_dist vs distance to new node
+                new_vec = self.dist_matrix[farthest_idx]
+                dist_to_new = np.sum(np.abs(self.dist_matrix - new_vec), axis=1)
+
+                # Vectorized update is extremely fast in NumPy
+                self.min_dists = np.minimum(self.min_dists, dist_to_new)
+
+        return [self.nodes[i] for i in self.selected[start:]]
+
+    def save(self, path: str, stamp: np.ndarray) -> None:
+        """Store the selection; ``stamp`` identifies the graph it was computed on."""
+        tmp = f"{path}.tmp.npz"
+        np.savez(
+            tmp,
+            stamp=stamp,
+            nodes=np.array(self.nodes),
+            dist_matrix=self.dist_matrix,
+            selected=np.array(self.selected, dtype=np.int64),
+            min_dists=self.min_dists if self.min_dists is not None else np.empty(0),
+        )
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, stamp: np.ndarray) -> "LandmarkSelection | None":
+        """The saved selection, or None if it is missing or was computed on another graph."""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as cached:
+            if not np.array_equal(cached["stamp"], stamp):
+                return None
+            min_dists = cached["min_dists"]
+            return cls(
+                nodes=cached["nodes"].tolist(),
+                dist_matrix=cached["dist_matrix"],
+                selected=cached["selected"].tolist(),
+                min_dists=min_dists if min_dists.size else None,
+            )
+
+    @staticmethod
+    def source_stamp(path: str, num_landmarks: int, seed) -> np.ndarray:
+        """Size and mtime of the graph file plus the settings the landmarks depend on."""
+        stat = os.stat(path)
+        return np.array(
+            [stat.st_size, stat.st_mtime_ns, num_landmarks, -1 if seed is None else seed],
+            dtype=np.int64,
+        )
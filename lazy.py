@@ -0,0 +1,18 @@
+from importlib import import_module
+
+
+def lazy_attributes(package: str, members: dict[str, str]):
+    """
+    Build a module-level ``__getattr__`` (PEP 562) that imports each member
+    from its submodule on first access.
+
+    Packages use it for everything that pulls in networkx, NumPy or pandas,
+    so that importing their enums (as the CLI does at startup) stays cheap.
+    """
+
+    def __getattr__(name: str):
+        if name in members:
+            return getattr(import_module(members[name], package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -1,18 +1,96 @@
 import typer
 from typing import Optional
 
+# Only enums are imported at startup; networkx, NumPy and pandas are loaded
+# inside the commands that need them (see scripts/check_import_time.py)
 from alter import AlterOptions
-from db import DBGraphs, DBGraph
-from distributions.strategy import distribution_factory
 from generator.labels.types import LABEL_STRATEGIES
 from reader import InputFormat
-from reify.strategy import reify_strategy_factory
 from reify.types import ReifyStrategyTypes
-from saver import OutputFormat, saver_factory
+from saver import DIRECTORY_FORMATS, NodeIds, OutputFormat
 from generator.graphs.types import GRAPH_STRATEGIES
+from sampler.types import SamplerType, StartNodePolicy
+from shard.types import CostModel
+from instrument import METRICS, timer
+from memory import BUDGET, parse_size
 
 app = typer.Typer(help="Tool for graph manipulation and generation")
 
+# Execution options shared by the database commands
+WORKERS_OPTION = typer.Option(
+    None, help="Worker processes (default: all cores, 1 runs in-process)"
+)
+READ_AHEAD_OPTION = typer.Option(8, help="Graphs parsed ahead of the workers")
+MAX_PENDING_OPTION = typer.Option(
+    None, help="Processed graphs waiting for the writer (default: twice the workers)"
+)
+COMPACT_IDS_OPTION = typer.Option(
+    False,
+    help="Relabel the nodes of the source graph to 0..n-1 on ingestion "
+    "(the mapping is saved as <output_path>.ids.npy)",
+)
+NODE_IDS_OPTION = typer.Option(
+    NodeIds.compact,
+    help="Node ids written with --compact-ids: compact or original",
+)
+SAMPLER_OPTION = typer.Option(
+    SamplerType.bfs,
+    help="Subgraph sampler: bfs, random_walk (with restart), forest_fire, snowball "
+    "or induced_random_node",
+)
+
+
+def check_node_ids(compact_ids: bool, node_ids: NodeIds) -> None:
+    if node_ids == NodeIds.original and not compact_ids:
+        raise typer.BadParameter(
+            "original ids are only restored with --compact-ids", param_hint="--node-ids"
+        )
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    metrics_out: Optional[str] = typer.Option(
+        None,
+        help="Write per-stage timings, counters and peak memory of the command as JSON",
+    ),
+    profile: Optional[str] = typer.Option(
+        None, help="Write a cProfile dump of the command (view with pstats or snakeviz)"
+    ),
+    memory_budget: Optional[str] = typer.Option(
+        None,
+        help="Approximate bytes of graphs read but not yet written by the overlapped "
+        "database commands (e.g. 512MB, 2GB); reading waits while it is exceeded",
+    ),
+):
+    """
+    Tool for graph manipulation and generation.
+    """
+    if memory_budget is not None:
+        try:
+            BUDGET.set(parse_size(memory_budget))
+        except ValueError as e:
+            raise typer.BadParameter(str(e), param_hint="--memory-budget")
+    if metrics_out is None and profile is None:
+        return
+    METRICS.enable()
+    profiler = None
+    if profile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    def finish():
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile)
+        if metrics_out is not None:
+            METRICS.write(metrics_out, command=ctx.invoked_subcommand)
+            print(f"Metrics written to {metrics_out}")
+
+    ctx.call_on_close(finish)
+
 
 @app.command("convert")
 def convert(
@@ -20,19 +98,47 @@ def convert(
     input_format: InputFormat = typer.Argument(..., help="Source format"),
     output_path: Optional[str] = typer.Argument(None, help="Path to the output file"),
     output_format: OutputFormat = typer.Argument(..., help="Destination format"),
+    compact_ids: bool = COMPACT_IDS_OPTION,
+    node_ids: NodeIds = NODE_IDS_OPTION,
+    stream: bool = typer.Option(
+        True,
+        help="Pass node and edge batches straight from the reader to the saver when both "
+        "support it, without building the graph (--no-stream always builds it)",
+    ),
 ):
     """
     Reads a graph and converts it to a different format.
     """
     from reader import reader_factory
+    from saver import saver_factory
 
+    check_node_ids(compact_ids, node_ids)
     reader = reader_factory(input_format)
-    saver = saver_factory(output_format)
 
     if output_path is None:
         output_path = f"output.{output_format}"
 
+    if stream and not compact_ids:
+        from records import StreamingError
+
+        saver = saver_factory(output_format)
+        if reader.supports_batches() and saver.supports_batches():
+            try:
+                saver.save_batches(reader.iter_batches(input_path), output_path)
+                return
+            except StreamingError as e:
+                print(f"{e}, converting through the graph instead.")
+
     g = reader.read(input_path)
+    id_map = None
+    if compact_ids:
+        from idmap import IdMap, compact_graph
+
+        g, id_map = compact_graph(g)
+        id_map.save(IdMap.path_for(output_path))
+    saver = saver_factory(
+        output_format, id_map=id_map if node_ids == NodeIds.original else None
+    )
     saver.save(g, output_path)
 
 
@@ -48,25 +154,159 @@ def generator(
     ),
     output_path: Optional[str] = typer.Argument(None, help="Path to the output file"),
     output_format: OutputFormat = typer.Argument(..., help="Destination format"),
+    seed: Optional[int] = typer.Option(None, help="Seed for reproducible graphs"),
+    orientation: str = typer.Option(
+        "new_to_old",
+        help="Arc orientation for preferential attachment: new_to_old, old_to_new or random",
+    ),
+    rmat_probs: str = typer.Option(
+        "0.57,0.19,0.19,0.05", help="R-MAT quadrant probabilities a,b,c,d"
+    ),
+    labels: Optional[str] = typer.Option(
+        None,
+        help='Path to a JSON file {"node_labels": [...], "edge_labels": [...]}',
+    ),
+    label_distribution: str = typer.Option(
+        "uniform",
+        help='Random label frequencies: "uniform", "zipf", "zipf(s=1.5)" '
+        'or "weights(A=3,B=1)"',
+    ),
+    stream: bool = typer.Option(
+        False,
+        help="Write edge batches as they are generated instead of building the graph "
+        "(random, rmat and barabasi_albert with none/random labels)",
+    ),
 ):
     """
     Generates random graphs. The user can choose algorithms to
     generate the graph and optionally assign labels to nodes and edges.
     """
+    import numpy as np
+
     from generator import generator_factory, label_factory
+    from generator.labels.strategy import load_labels
+    from saver import saver_factory
 
-    graph_generator = generator_factory(graph_strategy, num_nodes, num_edges)
-    label_generator = label_factory(label_strategy)
+    # Independent streams, so that labels do not follow the arc endpoints
+    graph_seed, label_seed = (
+        np.random.SeedSequence(seed).spawn(2) if seed is not None else (None, None)
+    )
+    graph_generator = generator_factory(
+        graph_strategy,
+        num_nodes,
+        num_edges,
+        seed=graph_seed,
+        orientation=orientation,
+        probabilities=tuple(float(p) for p in rmat_probs.split(",")),
+    )
+    label_generator = label_factory(
+        label_strategy, seed=label_seed, distribution=label_distribution
+    )
+    node_labels, edge_labels = load_labels(labels)
     saver = saver_factory(output_format)
 
+    if output_path is None:
+        output_path = f"output.{output_format}"
+
+    if stream:
+        from generator.stream import stream_graph
+
+        # Checked before save_batches opens (and truncates) the output
+        for name, supported in (
+            (graph_strategy.value, graph_generator.supports_batches()),
+            (label_strategy.value, label_generator.supports_batches()),
+            (output_format.value, saver.supports_batches()),
+        ):
+            if not supported:
+                raise typer.BadParameter(
+                    f"{name} does not support batches", param_hint="--stream"
+                )
+
+        typer.echo("Generating and saving graph in batches...")
+        saver.save_batches(
+            stream_graph(graph_generator, label_generator, node_labels, edge_labels),
+            output_path,
+        )
+        return
+
     typer.echo("Generating graph...")
-    g = graph_generator.generate()
+    with timer("generate"):
+        g = graph_generator.generate()
     typer.echo("Assigning labels...")
-    label_generator.assign(g)
+    with timer("label"):
+        label_generator.assign(g, node_labels, edge_labels)
 
     saver.save(g, output_path)
 
 
+@app.command("generate_db")
+def generate_db(
+    num_graphs: int = typer.Argument(..., help="Number of graphs to generate"),
+    graph_strategy: GRAPH_STRATEGIES = typer.Argument(
+        ..., help="Graph generation strategy"
+    ),
+    label_strategy: LABEL_STRATEGIES = typer.Argument(
+        ..., help="Label assignment strategy"
+    ),
+    output_path: str = typer.Argument(..., help="Path to the database to write"),
+    output_format: OutputFormat = typer.Argument(..., help="Database format"),
+    num_nodes: list[int] = typer.Option(
+        ..., help="Number of nodes: one value for all graphs or one per graph"
+    ),
+    num_edges: list[int] = typer.Option(
+        ..., help="Number of edges: one value for all graphs or one per graph"
+    ),
+    labels: Optional[str] = typer.Option(
+        None,
+        help='Path to a JSON file {"node_labels": [...], "edge_labels": [...]}',
+    ),
+    label_distribution: str = typer.Option(
+        "uniform",
+        help='Random label frequencies: "uniform", "zipf", "zipf(s=1.5)" '
+        'or "weights(A=3,B=1)"',
+    ),
+    seed: Optional[int] = typer.Option(None, help="Root seed of the batch"),
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes (default: all cores, 1 runs in-process)"
+    ),
+    orientation: str = typer.Option(
+        "new_to_old",
+        help="Arc orientation for preferential attachment: new_to_old, old_to_new or random",
+    ),
+    rmat_probs: str = typer.Option(
+        "0.57,0.19,0.19,0.05", help="R-MAT quadrant probabilities a,b,c,d"
+    ),
+):
+    """
+    Generates a database of graphs in parallel. Each graph is seeded from its
+    own child of the root seed, so the output is identical for any number of workers.
+    """
+    from generator.batch import BatchConfig, generate_graphs, plan_jobs
+    from generator.labels.strategy import load_labels
+    from saver import saver_factory
+
+    node_labels, edge_labels = load_labels(labels)
+    config = BatchConfig(
+        graph_strategy=graph_strategy,
+        label_strategy=label_strategy,
+        node_labels=sorted(node_labels),
+        edge_labels=sorted(edge_labels),
+        orientation=orientation,
+        label_distribution=label_distribution,
+        probabilities=tuple(float(p) for p in rmat_probs.split(",")),
+    )
+    jobs = plan_jobs(num_graphs, num_nodes, num_edges, seed=seed)
+    saver = saver_factory(output_format)
+
+    # Every graph is written as soon as it is next in id order
+    with saver.open_db(output_path) as writer:
+        for g in generate_graphs(jobs, config, workers=workers):
+            print(f"   - Generated graph {g.get_graph_id() + 1}/{num_graphs}: {g}")
+            writer.write(g)
+            METRICS.count("graphs")
+            METRICS.count("edges", g.number_of_edges())
+
+
 @app.command("db_construct")
 def db_construct(
     graph_path: str = typer.Argument(
@@ -81,53 +321,219 @@ def db_construct(
     ),
     output_path: str = typer.Argument(..., help="Path to the database to construct"),
     output_format: OutputFormat = typer.Argument(..., help="Database format"),
+    seed: Optional[int] = typer.Option(
+        None, help="Seed for graph sizes and landmark selection"
+    ),
+    resume: bool = typer.Option(
+        False,
+        help="Continue an interrupted run from <output_path>.ckpt.json instead of starting over",
+    ),
+    extend: bool = typer.Option(
+        False,
+        help="Grow a complete database to db_size graphs, appending only the new ones",
+    ),
+    sampler: SamplerType = SAMPLER_OPTION,
+    compact_ids: bool = COMPACT_IDS_OPTION,
+    node_ids: NodeIds = NODE_IDS_OPTION,
 ):
     """
     Constructs the database for storing graphs.
+
+    The plan (start nodes, sizes, random state) is written once to
+    <output_path>.ckpt.json and the progress (last graph id and output size)
+    after every graph to <output_path>.ckpt.progress.json, so an interrupted
+    run can be continued with --resume. The landmark distances
+    are kept in <output_path>.landmarks.npz, so --extend only pays for the
+    graphs it adds.
     """
-    from reader import reader_factory
-    from distributions import distribution_factory
+    import os
+    import random
+
+    import numpy as np
 
+    from checkpoint import Checkpoint
+    from distributions import distribution_factory
+    from graph import DBGraph
+    from landmarks import NUM_LANDMARKS, LandmarkSelection
+    from reader import reader_factory
+    from sampler import sampler_factory
     from saver import saver_factory
 
+    if resume and extend:
+        raise typer.BadParameter("use either --resume or --extend", param_hint="--extend")
+    check_node_ids(compact_ids, node_ids)
+    if (resume or extend) and output_format in DIRECTORY_FORMATS:
+        raise typer.BadParameter(
+            f"{output_format.value} output is a directory and cannot be resumed or extended, "
+            "use data output to checkpoint",
+            param_hint="--resume" if resume else "--extend",
+        )
+
+    config = {
+        "graph_path": os.path.abspath(graph_path),
+        "input_format": input_format.value,
+        "db_size": db_size,
+        "edge_distribution": edge_distribution,
+        "output_format": output_format.value,
+        "seed": seed,
+        "sampler": sampler.value,
+    }
+    if compact_ids:
+        # Start nodes are recorded as compact ids
+        config.update(compact_ids=True, node_ids=node_ids.value)
+    checkpoint_path = Checkpoint.path_for(output_path)
+    landmarks_path = Checkpoint.landmarks_path_for(output_path)
+    checkpoint = None
+    if resume or extend:
+        param_hint = "--resume" if resume else "--extend"
+        if not os.path.exists(checkpoint_path):
+            raise typer.BadParameter(
+                f"no checkpoint found at {checkpoint_path}", param_hint=param_hint
+            )
+        checkpoint = Checkpoint.load(checkpoint_path)
+        # Extending changes db_size and nothing else
+        mismatches = checkpoint.mismatches(config, ignore=("db_size",) if extend else ())
+        if mismatches:
+            raise typer.BadParameter(
+                f"{checkpoint_path} was written with a different {', '.join(mismatches)}",
+                param_hint=param_hint,
+            )
+        if resume and checkpoint.complete:
+            print(f"Database {output_path} is already complete.")
+            return
+        if extend and not checkpoint.complete:
+            raise typer.BadParameter(
+                f"{output_path} is incomplete, finish it with --resume first",
+                param_hint=param_hint,
+            )
+        if extend and db_size <= len(checkpoint.start_nodes):
+            print(
+                f"Database {output_path} already holds {len(checkpoint.start_nodes)} graphs."
+            )
+            return
+
     reader = reader_factory(input_format)
-    dist_strategy = distribution_factory(edge_distribution)
-    saver = saver_factory(output_format)
+    graph_sampler = sampler_factory(sampler)
 
     print("Reading main graph...", end="", flush=True)
     g = reader.read(graph_path)
     print(f" done. {g}", flush=True)
+    id_map = None
+    if compact_ids:
+        from idmap import IdMap, compact_graph
+
+        g, id_map = compact_graph(g)
+        id_map.save(IdMap.path_for(output_path))
+    saver = saver_factory(
+        output_format, id_map=id_map if node_ids == NodeIds.original else None
+    )
 
     max_edges = g.number_of_edges()
 
+    landmarks_stamp = LandmarkSelection.source_stamp(graph_path, NUM_LANDMARKS, seed)
     print("Constructing database:")
-    print(f" - Find {db_size} starting nodes...", end="", flush=True)
-    starting_nodes = g.extract_k_distant_nodes(db_size)
-    print(" done.")
-
-    for i, node in enumerate(starting_nodes):
+    if checkpoint is None:
+        dist_strategy = distribution_factory(edge_distribution, seed=seed)
+        if seed is not None:
+            random.seed(seed)
+        print(f" - Find {db_size} starting nodes...", end="", flush=True)
+        if 0 < db_size < g.number_of_nodes():
+            selection = LandmarkSelection.from_graph(g, NUM_LANDMARKS)
+            starting_nodes = g.extract_k_distant_nodes(db_size, selection=selection)
+            selection.save(landmarks_path, landmarks_stamp)
+        else:
+            starting_nodes = g.extract_k_distant_nodes(db_size)
+        print(" done.")
 
-        num_edges = int(dist_strategy.get())
-        if num_edges > max_edges:
+        # Draw every size up front: the plan is known before any extraction starts
+        with timer("sample_sizes"):
+            sizes = np.maximum(dist_strategy.sample(db_size), 0).astype(np.int64)
+
+        version, state, gauss = random.getstate()
+        checkpoint = Checkpoint(
+            config=config,
+            start_nodes=list(starting_nodes),
+            sizes=sizes[: len(starting_nodes)].tolist(),
+            random_state=[version, list(state), gauss],
+            # Every graph gets its own sampler generator, so a resumed run
+            # samples the same graphs
+            sampler_entropy=np.random.SeedSequence(seed).entropy,
+            size_rng_state=dist_strategy.get_state(),
+            path=checkpoint_path,
+        )
+        writer = saver.open_db(output_path)
+        checkpoint.save()
+    else:
+        if extend:
+            existing = len(checkpoint.start_nodes)
             print(
-                f"     - Warning: requested {num_edges} edges, but max is {max_edges}. Using {max_edges} instead."
+                f" - Extending from {existing} to {db_size} starting nodes...",
+                end="",
+                flush=True,
             )
-            num_edges = max_edges
+            selection = LandmarkSelection.load(landmarks_path, landmarks_stamp)
+            if selection is None:
+                # No usable cache: recompute the landmark distances and start
+                # the greedy selection from the nodes already in the database
+                if seed is not None:
+                    random.seed(seed)
+                selection = LandmarkSelection.from_graph(g, NUM_LANDMARKS)
+                selection.assume(checkpoint.start_nodes)
+            new_nodes = g.extract_k_distant_nodes(db_size, selection=selection)
+            selection.save(landmarks_path, landmarks_stamp)
+            print(" done.")
+
+            # The new sizes continue the stream the existing ones were drawn from
+            dist_strategy = distribution_factory(edge_distribution, seed=seed)
+            if checkpoint.size_rng_state is not None:
+                dist_strategy.set_state(checkpoint.size_rng_state)
+            with timer("sample_sizes"):
+                sizes = np.maximum(
+                    dist_strategy.sample(db_size - existing), 0
+                ).astype(np.int64)
+            checkpoint.extend(new_nodes, sizes[: len(new_nodes)].tolist(), db_size)
+            checkpoint.size_rng_state = dist_strategy.get_state()
+            checkpoint.save()
         print(
-            f"   - Extracting subgraph {i+1}/{db_size} with {num_edges} edges...",
-            end="",
-            flush=True,
+            f" - Continuing after graph {checkpoint.last_graph_id + 1}/{db_size} "
+            f"(truncating output to {checkpoint.offset} bytes)"
         )
-        subgraph = g.extract_subgraph_by_edge_count(node, num_edges)
-        print(f" done. {subgraph}")
-        # Wrap extracted graph with an id so saver can serialize it
-        db_graph = DBGraph(subgraph, graph_id=i)
-        db_batch = DBGraphs([db_graph])
-        print("    - Saving to database...", end="", flush=True)
-        saver.save_db(db_batch, output_path, append=True)
-        print(" done.")
-        # Free memory
-        del subgraph
+        version, state, gauss = checkpoint.random_state
+        random.setstate((version, tuple(state), gauss))
+        writer = saver.open_db(output_path, append=True)
+        # Drop whatever the interrupted run wrote after the last committed graph
+        os.truncate(writer.output_path, checkpoint.offset)
+
+    with writer:
+        first = checkpoint.last_graph_id + 1
+        for i in range(first, len(checkpoint.start_nodes)):
+            node = checkpoint.start_nodes[i]
+            num_edges = checkpoint.sizes[i]
+            if num_edges > max_edges:
+                print(
+                    f"     - Warning: requested {num_edges} edges, but max is {max_edges}. Using {max_edges} instead."
+                )
+                num_edges = max_edges
+            print(
+                f"   - Extracting subgraph {i+1}/{db_size} with {num_edges} edges...",
+                end="",
+                flush=True,
+            )
+            rng = np.random.default_rng(
+                np.random.SeedSequence(checkpoint.sampler_entropy, spawn_key=(i,))
+            )
+            subgraph = graph_sampler.sample(g, num_edges, start=node, rng=rng)
+            print(f" done. {subgraph}")
+            print("    - Saving to database...", end="", flush=True)
+            # Wrap extracted graph with an id so saver can serialize it
+            writer.write(DBGraph(subgraph, graph_id=i))
+            writer.flush()
+            checkpoint.commit(i, os.path.getsize(writer.output_path))
+            print(" done.")
+            METRICS.count("graphs")
+            METRICS.count("edges", subgraph.number_of_edges())
+            # Free memory
+            del subgraph
 
 
 @app.command("reify_db")
@@ -137,29 +543,85 @@ def reify_graph(
     output_path: str = typer.Argument(..., help="Path to the output file"),
     output_format: OutputFormat = typer.Argument(..., help="Destination format"),
     strategy: ReifyStrategyTypes = typer.Argument(..., help="Reification strategy"),
+    workers: Optional[int] = WORKERS_OPTION,
+    read_ahead: int = READ_AHEAD_OPTION,
+    max_pending: Optional[int] = MAX_PENDING_OPTION,
 ):
     """
     Reifies a database of graphs using the Multi-Arcs Expansion strategy.
     """
     from reader import reader_factory
     from saver import saver_factory
-    from reify import Reificator, reify_strategy_factory
+    from pipeline import Pipeline
+    from pipeline.overlap import run_overlapped
+    from pipeline.stages import ReifyStage
 
     reader = reader_factory(input_format)
     saver = saver_factory(output_format)
-    db = reader.read_db(input_path)
+    reif = Pipeline([ReifyStage(strategy)])
+
+    with saver.open_db(output_path) as writer:
+
+        def write(reif_g):
+            print(f"Reified graph {reif_g.get_graph_id()}")
+            writer.write(reif_g)
+            METRICS.count("graphs")
+            METRICS.count("edges", reif_g.number_of_edges())
+
+        report = run_overlapped(
+            enumerate(reader.iter_db(input_path)),
+            reif.process,
+            write,
+            workers=workers,
+            read_ahead=read_ahead,
+            max_pending=max_pending,
+        )
+    print(report.summary())
 
-    reif = Reificator(strategy=reify_strategy_factory(strategy))
 
-    reif_db = DBGraphs()
-    for g in db.get_graphs():
-        print(f"Reifing graph {g.get_graph_id()}")
-        reif_g = reif.reify(g)
-        reif_db.add_graph(reif_g)
+@app.command("dereify_db")
+def dereify_graph(
+    input_path: str = typer.Argument(..., help="Path to the source file"),
+    input_format: InputFormat = typer.Argument(..., help="Source format"),
+    output_path: str = typer.Argument(..., help="Path to the output file"),
+    output_format: OutputFormat = typer.Argument(..., help="Destination format"),
+    strategy: ReifyStrategyTypes = typer.Argument(
+        ..., help="Reification strategy used to build the input"
+    ),
+    workers: Optional[int] = WORKERS_OPTION,
+    read_ahead: int = READ_AHEAD_OPTION,
+    max_pending: Optional[int] = MAX_PENDING_OPTION,
+):
+    """
+    Undoes the reification of a database, collapsing intermediate nodes back into arcs.
+    """
+    from reader import reader_factory
+    from saver import saver_factory
+    from pipeline import Pipeline
+    from pipeline.overlap import run_overlapped
+    from pipeline.stages import ReifyStage
 
-    print("Saving reified database...", end="")
-    saver.save_db(reif_db, output_path)
-    print("Done.")
+    reader = reader_factory(input_format)
+    saver = saver_factory(output_format)
+    dereif = Pipeline([ReifyStage(strategy, inverse=True)])
+
+    with saver.open_db(output_path) as writer:
+
+        def write(g):
+            print(f"De-reified graph {g.get_graph_id()}")
+            writer.write(g)
+            METRICS.count("graphs")
+            METRICS.count("edges", g.number_of_edges())
+
+        report = run_overlapped(
+            enumerate(reader.iter_db(input_path)),
+            dereif.process,
+            write,
+            workers=workers,
+            read_ahead=read_ahead,
+            max_pending=max_pending,
+        )
+    print(report.summary())
 
 
 @app.command("alter_db")
@@ -169,29 +631,40 @@ def alter_graph(
     output_path: str = typer.Argument(..., help="Path to the output file"),
     output_format: OutputFormat = typer.Argument(..., help="Destination format"),
     strategy: AlterOptions = typer.Argument(..., help="Alteration strategy"),
+    seed: Optional[int] = typer.Option(None, help="Seed for reproducible alterations"),
+    workers: Optional[int] = WORKERS_OPTION,
+    read_ahead: int = READ_AHEAD_OPTION,
+    max_pending: Optional[int] = MAX_PENDING_OPTION,
 ):
     """
     Alters a graph in various ways (not yet implemented).
     """
     from reader import reader_factory
     from saver import saver_factory
-    from alter import GraphAlter
-    from alter.strategy import alter_strategy_factory
+    from pipeline.jobs import AlterJob
+    from pipeline.overlap import run_overlapped
 
     reader = reader_factory(input_format)
     saver = saver_factory(output_format)
-    alterer = GraphAlter(strategy=alter_strategy_factory(strategy))
-    db = reader.read_db(input_path)
-    multiedge_db = DBGraphs()
-    for g in db.get_graphs():
-        print(f"Altering graph {g.get_graph_id()}")
-        altered_g = alterer.alter(g)
-        print(alterer.what_changed(g, altered_g))
-        multiedge_db.add_graph(altered_g)
 
-    print("Saving altered database...", end="")
-    saver.save_db(multiedge_db, output_path)
-    print("Done.")
+    with saver.open_db(output_path) as writer:
+
+        def write(result):
+            altered_g, changes = result
+            print(f"Altered graph {altered_g.get_graph_id()}: {changes}")
+            writer.write(altered_g)
+            METRICS.count("graphs")
+            METRICS.count("edges", altered_g.number_of_edges())
+
+        report = run_overlapped(
+            enumerate(reader.iter_db(input_path)),
+            AlterJob(strategy, seed=seed),
+            write,
+            workers=workers,
+            read_ahead=read_ahead,
+            max_pending=max_pending,
+        )
+    print(report.summary())
 
 
 @app.command("sub_database")
@@ -206,51 +679,200 @@ def sub_database(
     ),
     output_path: str = typer.Argument(..., help="Path to the output file"),
     output_format: OutputFormat = typer.Argument(..., help="Destination format"),
+    seed: Optional[int] = typer.Option(None, help="Seed for graph sizes and sampling"),
+    workers: Optional[int] = WORKERS_OPTION,
+    read_ahead: int = READ_AHEAD_OPTION,
+    max_pending: Optional[int] = MAX_PENDING_OPTION,
+    sampler: SamplerType = SAMPLER_OPTION,
+    start_node: StartNodePolicy = typer.Option(
+        StartNodePolicy.first,
+        help="Where each subgraph grows from: first, random, highest_degree or distant "
+        "(a peripheral node found with landmark distances)",
+    ),
 ):
     """
     Creates a sub-database containing for each graph in the original database a subgraph with a given distribution of edges.
+
+    Only the first db_size graphs of the input are read.
     """
+    import os
+    import shutil
+    from itertools import islice
+
     from reader import reader_factory
     from saver import saver_factory
-    from db import DBGraphs
+    from pipeline.jobs import ExtractJob
+    from pipeline.overlap import run_overlapped
+
+    import numpy as np
+
+    from distributions import distribution_factory
 
     reader = reader_factory(input_format)
     saver = saver_factory(output_format)
-    db = reader.read_db(input_path)
 
-    if db_size > len(db.get_graphs()):
-        raise ValueError(
-            f"Requested sub-database size {db_size} exceeds original database size {len(db.get_graphs())}."
+    dist_strategy = distribution_factory(edge_distribution, seed=seed)
+    with timer("sample_sizes"):
+        sizes = np.maximum(dist_strategy.sample(db_size), 0).astype(np.int64)
+
+    graphs_read = 0
+
+    def extraction_items():
+        nonlocal graphs_read
+        # Stop parsing as soon as db_size graphs have been consumed
+        graphs = islice(reader.iter_db(input_path), db_size)
+        for i, (g, num_edges) in enumerate(zip(graphs, sizes.tolist())):
+            graphs_read += 1
+            max_edges = g.number_of_edges()
+            if num_edges > max_edges:
+                print(
+                    f"     - Warning: requested {num_edges} edges, but max is {max_edges}. Using {max_edges} instead."
+                )
+                num_edges = max_edges
+            yield i, g, num_edges
+
+    with saver.open_db(output_path) as writer:
+
+        def write(subgraph):
+            print(f"   - Extracted subgraph of graph {subgraph.get_graph_id()}: {subgraph}")
+            writer.write(subgraph)
+            METRICS.count("graphs")
+            METRICS.count("edges", subgraph.number_of_edges())
+
+        report = run_overlapped(
+            extraction_items(),
+            ExtractJob(sampler, seed=seed, start_node=start_node),
+            write,
+            workers=workers,
+            read_ahead=read_ahead,
+            max_pending=max_pending,
         )
+    print(report.summary())
+    if graphs_read < db_size:
+        # The size is only known once the input is read: drop the short output
+        if os.path.isdir(writer.output_path):
+            shutil.rmtree(writer.output_path)
+        else:
+            os.remove(writer.output_path)
+        raise typer.BadParameter(
+            f"requested sub-database size {db_size} exceeds original database size "
+            f"{graphs_read}, no output written",
+            param_hint="DB_SIZE",
+        )
+
 
-    dist_strategy = distribution_factory(edge_distribution)
+@app.command("shard")
+def shard(
+    input_path: str = typer.Argument(..., help="Path to the source database"),
+    input_format: InputFormat = typer.Argument(..., help="Source format"),
+    num_shards: int = typer.Argument(..., help="Number of shards to write"),
+    output_path: str = typer.Argument(
+        ..., help="Output prefix: shards are written to <prefix>-<i>"
+    ),
+    output_format: OutputFormat = typer.Argument(..., help="Destination format"),
+    cost: CostModel = typer.Option(
+        CostModel.edges,
+        help="Estimated cost of a graph: edges, nodes, size (nodes + edges) or quadratic (edges^2)",
+    ),
+    window: int = typer.Option(
+        1024,
+        help="Graphs held and sorted by cost before assignment (1 = online greedy)",
+    ),
+    buffer_size: int = typer.Option(
+        1 << 20, help="Write buffer of every shard, in bytes"
+    ),
+):
+    """
+    Splits a database into shards of balanced total cost, for parallel
+    downstream jobs.
 
-    sub_db = DBGraphs()
+    The database is streamed once; graphs are assigned with the
+    longest-processing-time rule within windows of --window graphs, so memory
+    does not depend on the size of the input. The assignment is written to
+    <prefix>.assignment.tsv and a summary to <prefix>.manifest.json.
+    """
+    import os
 
-    graphs_to_process = db.get_graphs()[:db_size]
+    from reader import reader_factory
+    from saver import saver_factory
+    from shard import Sharder, cost_factory
 
-    for g in graphs_to_process:
-        num_edges = int(dist_strategy.get())
-        max_edges = g.number_of_edges()
-        if num_edges > max_edges:
-            print(
-                f"     - Warning: requested {num_edges} edges, but max is {max_edges}. Using {max_edges} instead."
-            )
-            num_edges = max_edges
+    reader = reader_factory(input_format)
+    saver = saver_factory(output_format)
+    sharder = Sharder(num_shards, cost_factory(cost), window=window)
+
+    def graphs():
+        for g in reader.iter_db(input_path):
+            METRICS.count("graphs")
+            METRICS.count("edges", g.number_of_edges())
+            yield g
+
+    manifest = sharder.write(
+        graphs(),
+        saver,
+        output_path,
+        buffering=buffer_size,
+        input_path=os.path.abspath(input_path),
+        cost_model=cost.value,
+    )
+    for i, entry in enumerate(manifest["shards"]):
         print(
-            f"   - Extracting subgraph of graph {g.get_graph_id()} with {num_edges} edges...",
-            end="",
-            flush=True,
+            f" - Shard {i}: {entry['graphs']} graphs, {entry['edges']} edges, "
+            f"cost {entry['cost']:g} -> {entry['path']}"
+        )
+    print(f"Done. Imbalance (max / mean cost): {manifest['imbalance']:.3f}")
+
+
+@app.command("pipeline")
+def pipeline(
+    input_path: str = typer.Argument(..., help="Path to the source database"),
+    input_format: InputFormat = typer.Argument(..., help="Source format"),
+    output_path: str = typer.Argument(..., help="Path to the output database"),
+    output_format: OutputFormat = typer.Argument(..., help="Destination format"),
+    stage: list[str] = typer.Option(
+        ...,
+        help="Stage to apply, in order (repeatable): alter:<strategy>, reify:<strategy>, "
+        "dereify:<strategy>, sample:<distribution>, filter:min_edges=..,max_edges=..",
+    ),
+    seed: Optional[int] = typer.Option(None, help="Seed for randomized stages"),
+    workers: Optional[int] = WORKERS_OPTION,
+    read_ahead: int = READ_AHEAD_OPTION,
+    max_pending: Optional[int] = MAX_PENDING_OPTION,
+):
+    """
+    Streams every graph of a database through a chain of stages into a single
+    output, without intermediate files. The output keeps the input order.
+    """
+    from reader import reader_factory
+    from saver import saver_factory
+    from pipeline import Pipeline, stage_factory
+    from pipeline.overlap import run_overlapped
+
+    stages = [stage_factory(spec) for spec in stage]
+    reader = reader_factory(input_format)
+    saver = saver_factory(output_format)
+
+    processed = 0
+    with saver.open_db(output_path) as writer:
+
+        def write(g):
+            nonlocal processed
+            if g is not None:
+                writer.write(g)
+                METRICS.count("graphs")
+                METRICS.count("edges", g.number_of_edges())
+                processed += 1
+
+        report = run_overlapped(
+            enumerate(reader.iter_db(input_path)),
+            Pipeline(stages, seed=seed).process,
+            write,
+            workers=workers,
+            read_ahead=read_ahead,
+            max_pending=max_pending,
         )
-        start_node_id = list(g.nodes())[0]
-        subgraph = g.extract_subgraph_by_edge_count(start_node_id, num_edges)
-        print(f" done. {subgraph}")
-        # Wrap extracted graph with an id so saver can serialize it
-        sub_db.add_graph(DBGraph(subgraph, g.get_graph_id()))
-
-    print("Saving sub-database...", end="")
-    saver.save_db(sub_db, output_path)
-    print("Done.")
+    print(report.summary())
+    print(f"Done. {processed} graphs written.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+from lazy import lazy_attributes
+
+from .types import StageName
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "Pipeline": ".pipeline",
+        "stage_factory": ".stages",
+    },
+)
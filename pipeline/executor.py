@@ -0,0 +1,37 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    workers: int | None = None,
+    max_pending: int | None = None,
+) -> Iterator[R]:
+    """
+    Apply ``fn`` to ``items`` in a process pool and yield the results in input order.
+
+    Items are pulled lazily and at most ``max_pending`` (default: twice the
+    number of workers) are in flight, so memory stays bounded even when the
+    input is a stream. ``workers=1`` runs everything in the calling process.
+    """
+    if workers == 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,48 @@
+import numpy as np
+
+from graph import DBGraph
+
+
+class AlterJob:
+    """Alter one ``(index, graph)`` item; returns the altered graph and a change summary."""
+
+    def __init__(self, strategy: str, seed: int | None = None):
+        self.strategy = strategy
+        self._entropy = np.random.SeedSequence(seed).entropy
+
+    def __call__(self, item: tuple[int, DBGraph]) -> tuple[DBGraph, str]:
+        from alter import GraphAlter
+        from alter.strategy import alter_strategy_factory
+
+        index, graph = item
+        seed = np.random.SeedSequence(self._entropy, spawn_key=(index,))
+        alterer = GraphAlter(strategy=alter_strategy_factory(self.strategy, seed=seed))
+        altered = alterer.alter(graph)
+        return altered, alterer.what_changed(graph, altered)
+
+
+class ExtractJob:
+    """
+    Extract a subgraph with a given number of edges from one
+    ``(index, graph, num_edges)`` item, with a sampler and start node seeded
+    per item.
+    """
+
+    def __init__(
+        self, sampler: str = "bfs", seed: int | None = None, start_node: str = "first"
+    ):
+        self.sampler = sampler
+        self.start_node = start_node
+        self._entropy = np.random.SeedSequence(seed).entropy
+
+    def __call__(self, item: tuple[int, DBGraph, int]) -> DBGraph:
+        from sampler import sampler_factory
+
+        index, graph, num_edges = item
+        rng = np.random.default_rng(
+            np.random.SeedSequence(self._entropy, spawn_key=(index,))
+        )
+        graph_sampler = sampler_factory(self.sampler)
+        start = graph_sampler.start_node(graph, self.start_node, rng=rng)
+        subgraph = graph_sampler.sample(graph, num_edges, start=start, rng=rng)
+        return DBGraph(subgraph, graph.get_graph_id())
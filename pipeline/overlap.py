@@ -0,0 +1,223 @@
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
+from typing import Callable, Iterable, TypeVar
+
+from instrument import METRICS
+from memory import BUDGET, estimate_size
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+@dataclass
+class StageReport:
+    name: str
+    busy: float = 0.0
+    items: int = 0
+    # Number of parallel executors sharing the busy time
+    width: int = 1
+
+    def utilization(self, wall: float) -> float:
+        return self.busy / (wall * self.width) if wall > 0 else 0.0
+
+
+@dataclass
+class OverlapReport:
+    wall: float = 0.0
+    stages: dict[str, StageReport] = field(default_factory=dict)
+
+    def summary(self) -> str:
+        lines = [f"Pipeline wall time: {self.wall:.2f}s"]
+        for stage in self.stages.values():
+            lines.append(
+                f" - {stage.name}: {stage.items} items, {stage.busy:.2f}s busy, "
+                f"{100 * stage.utilization(self.wall):.0f}% utilization"
+                + (f" over {stage.width} workers" if stage.width > 1 else "")
+            )
+        return "\n".join(lines)
+
+
+def _timed(fn: Callable[[T], R], item: T) -> tuple[R, float]:
+    start = perf_counter()
+    result = fn(item)
+    return result, perf_counter() - start
+
+
+def _put(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Blocking put that gives up once ``stop`` is set (so no thread deadlocks on error)."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: queue.Queue, stop: threading.Event):
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def run_overlapped(
+    items: Iterable[T],
+    compute: Callable[[T], R],
+    write: Callable[[R], None],
+    workers: int | None = None,
+    read_ahead: int = 8,
+    max_pending: int | None = None,
+    pool: str = "process",
+    memory_budget: int | None = None,
+) -> OverlapReport:
+    """
+    Read, compute and write concurrently, keeping the input order.
+
+    A reader thread pulls ``items`` (typically a lazy parser) up to
+    ``read_ahead`` items ahead; ``compute`` runs in a pool of ``workers``
+    processes or threads (``workers=1`` runs it in the dispatching thread);
+    a writer thread calls ``write`` on the results in input order. At most
+    ``max_pending`` results (default: twice the workers) wait for the writer,
+    so a slow stage applies backpressure instead of growing a queue. Those
+    bounds count items; with a ``memory_budget`` (default: the global
+    ``--memory-budget``) the reader also waits while the items read but not
+    yet written exceed that many estimated bytes, so a run of large graphs
+    cannot fill the queues.
+
+    Throughput is bounded by the slowest stage rather than the sum of the
+    stages. Returns the busy time and utilization of every stage.
+    """
+    if pool not in ("process", "thread"):
+        raise ValueError(f"pool must be 'process' or 'thread', got {pool!r}")
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    memory_budget = BUDGET.limit if memory_budget is None else memory_budget
+
+    report = OverlapReport(
+        stages={
+            "read": StageReport("read"),
+            "compute": StageReport("compute", width=workers),
+            "write": StageReport("write"),
+        }
+    )
+    read_q = queue.Queue(maxsize=max(1, read_ahead))
+    write_q = queue.Queue(maxsize=max(1, max_pending))
+    stop = threading.Event()
+    errors = []
+    # Estimated bytes of the items between the reader and the end of write
+    in_flight = [0]
+    released = threading.Condition()
+
+    def reserve(item) -> int:
+        size = estimate_size(item)
+        with released:
+            # A single item larger than the budget still goes through alone
+            while in_flight[0] and in_flight[0] + size > memory_budget:
+                if stop.is_set():
+                    break
+                released.wait(0.1)
+            in_flight[0] += size
+        return size
+
+    def release(size: int) -> None:
+        with released:
+            in_flight[0] -= size
+            released.notify()
+
+    def reader():
+        stats = report.stages["read"]
+        try:
+            iterator = iter(items)
+            while not stop.is_set():
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                stats.busy += perf_counter() - start
+                stats.items += 1
+                size = reserve(item) if memory_budget is not None else 0
+                if not _put(read_q, (item, size), stop):
+                    break
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            _put(read_q, _DONE, stop)
+
+    def writer():
+        compute_stats = report.stages["compute"]
+        stats = report.stages["write"]
+        try:
+            while True:
+                pending = _get(write_q, stop)
+                if pending is _DONE:
+                    break
+                future, size = pending
+                result, elapsed = future.result()
+                compute_stats.busy += elapsed
+                compute_stats.items += 1
+                start = perf_counter()
+                write(result)
+                stats.busy += perf_counter() - start
+                stats.items += 1
+                if size:
+                    release(size)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+
+    timed = partial(_timed, compute)
+    if workers == 1:
+        executor = None
+    elif pool == "process":
+        executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    wall_start = perf_counter()
+    threads = [threading.Thread(target=reader), threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            read = _get(read_q, stop)
+            if read is _DONE:
+                break
+            item, size = read
+            if executor is None:
+                future = Future()
+                future.set_result(timed(item))
+            else:
+                future = executor.submit(timed, item)
+            if not _put(write_q, (future, size), stop):
+                break
+        _put(write_q, _DONE, stop)
+    except BaseException:
+        stop.set()
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        report.wall = perf_counter() - wall_start
+        if METRICS.enabled:
+            # Compute runs in worker processes whose own timers are lost, so
+            # the per-stage busy times are the view --metrics-out gets of them
+            for stage in report.stages.values():
+                METRICS.merge(f"overlap.{stage.name}", stage.busy, stage.items)
+
+    if errors:
+        raise errors[0]
+    return report
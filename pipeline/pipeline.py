@@ -0,0 +1,29 @@
+import numpy as np
+
+from graph import DBGraph
+from pipeline.stages import Stage
+
+
+class Pipeline:
+    """
+    Runs graphs through an ordered list of stages, one at a time: ``process``
+    is the compute step handed to ``run_overlapped``.
+
+    Each graph is processed entirely inside one worker, with a seed derived
+    from the root seed and the graph position, so the output is the same for
+    any number of workers and keeps the input order.
+    """
+
+    def __init__(self, stages: list[Stage], seed: int | None = None):
+        self.stages = stages
+        self._entropy = np.random.SeedSequence(seed).entropy
+
+    def process(self, item: tuple[int, DBGraph]) -> DBGraph | None:
+        index, graph = item
+        graph_seed = np.random.SeedSequence(self._entropy, spawn_key=(index,))
+        for stage, stage_seed in zip(self.stages, graph_seed.spawn(len(self.stages))):
+            graph = stage.apply(graph, stage_seed)
+            if graph is None:
+                return None
+        return graph
+
@@ -0,0 +1,123 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from graph import DBGraph
+from pipeline.types import StageName
+
+
+class Stage(ABC):
+
+    @abstractmethod
+    def apply(self, graph: DBGraph, seed: np.random.SeedSequence) -> DBGraph | None:
+        """
+        Transform one graph. Returning None drops the graph from the output.
+        ``seed`` is specific to this graph and stage, so results do not depend
+        on which worker runs the stage.
+        """
+        pass
+
+
+class AlterStage(Stage):
+
+    def __init__(self, strategy: str):
+        self.strategy = strategy
+
+    def apply(self, graph, seed):
+        from alter import GraphAlter
+        from alter.strategy import alter_strategy_factory
+
+        return GraphAlter(alter_strategy_factory(self.strategy, seed=seed)).alter(graph)
+
+
+class ReifyStage(Stage):
+
+    def __init__(self, strategy: str, inverse: bool = False):
+        from reify.strategy import reify_strategy_factory
+        from reify.types import ReifyStrategyTypes
+
+        self.strategy = reify_strategy_factory(ReifyStrategyTypes(strategy))
+        self.inverse = inverse
+
+    def apply(self, graph, seed):
+        if self.inverse:
+            return self.strategy.dereify(graph)
+        return self.strategy.reify(graph)
+
+
+class SampleStage(Stage):
+
+    def __init__(self, distribution: str):
+        from distributions import distribution_factory
+
+        # Fail on a malformed distribution before any graph is read
+        distribution_factory(distribution)
+        self.distribution = distribution
+
+    def apply(self, graph, seed):
+        from distributions import distribution_factory
+
+        if graph.number_of_nodes() == 0:
+            return graph
+        num_edges = int(distribution_factory(self.distribution, seed=seed).get())
+        num_edges = min(max(num_edges, 0), graph.number_of_edges())
+        start_node = next(iter(graph))
+        subgraph = graph.extract_subgraph_by_edge_count(start_node, num_edges)
+        return DBGraph(subgraph, graph_id=graph.get_graph_id())
+
+
+class FilterStage(Stage):
+
+    BOUNDS = ("min_nodes", "max_nodes", "min_edges", "max_edges")
+
+    def __init__(self, **bounds: int):
+        unknown = set(bounds) - set(self.BOUNDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown filter bounds {sorted(unknown)}, expected {self.BOUNDS}"
+            )
+        self.bounds = bounds
+
+    def apply(self, graph, seed):
+        nodes, edges = graph.number_of_nodes(), graph.number_of_edges()
+        b = self.bounds
+        if nodes < b.get("min_nodes", 0) or edges < b.get("min_edges", 0):
+            return None
+        if "max_nodes" in b and nodes > b["max_nodes"]:
+            return None
+        if "max_edges" in b and edges > b["max_edges"]:
+            return None
+        return graph
+
+
+def stage_factory(spec: str) -> Stage:
+    """
+    Build a stage from a "name:argument" spec, e.g. "alter:to_multigraph",
+    "reify:multi_arcs_expansion", "dereify:multi_arcs_expansion",
+    "sample:gaussian(mean=50,stddev=10)" or "filter:min_edges=5,max_edges=500".
+    """
+    name, sep, argument = spec.partition(":")
+    if not sep:
+        raise ValueError(f"Stage spec must be of the form name:argument, got {spec!r}")
+    try:
+        name = StageName(name.strip())
+    except ValueError:
+        raise ValueError(f"Unknown pipeline stage: {name}")
+    argument = argument.strip()
+
+    if name == StageName.alter:
+        return AlterStage(argument)
+    elif name == StageName.reify:
+        return ReifyStage(argument)
+    elif name == StageName.dereify:
+        return ReifyStage(argument, inverse=True)
+    elif name == StageName.sample:
+        return SampleStage(argument)
+    elif name == StageName.filter:
+        bounds = {}
+        for param in filter(None, argument.split(",")):
+            key, value = param.split("=")
+            bounds[key.strip()] = int(value)
+        return FilterStage(**bounds)
+    else:
+        raise ValueError(f"Unknown pipeline stage: {name}")
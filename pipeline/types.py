@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class StageName(str, Enum):
+    alter = "alter"
+    reify = "reify"
+    dereify = "dereify"
+    sample = "sample"
+    filter = "filter"
+
+
+STAGE_NAMES = StageName
@@ -1,2 +1,5 @@
-from reader.reader import reader_factory
+from lazy import lazy_attributes
+
 from reader.types import INPUT_FORMATS, InputFormat
+
+__getattr__ = lazy_attributes(__name__, {"reader_factory": "reader.reader"})
@@ -1,5 +1,7 @@
 import os
 from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+import numpy as np
 import pandas as pd
 import networkx as nx
 from dataclasses import dataclass, field
@@ -7,6 +9,7 @@ from dataclasses import dataclass, field
 from db import Graph
 from graph import DirectedGraph
 from reader.strategy import GraphReaderStrategy
+from records import CSV_ARCS_FOLDER, EdgeBatch, NodeBatch
 
 
 @dataclass
@@ -29,12 +32,27 @@ class CSVGraph:
 
 class CSVGraphReader(GraphReaderStrategy):
 
+    @staticmethod
+    def _csv_files(folder_path) -> list[tuple[str, str]]:
+        """
+        ``(path, label)`` of the CSV files of the folder and of its arcs
+        sub-folder, if any; the label is the file name without ``.csv``.
+        """
+        files = []
+        for folder in (folder_path, os.path.join(folder_path, CSV_ARCS_FOLDER)):
+            if os.path.isdir(folder):
+                files.extend(
+                    (os.path.join(folder, f), f[:-4])
+                    for f in sorted(os.listdir(folder))
+                    if f.endswith(".csv")
+                )
+        return files
+
     def _read_csv_graph(self, folder_path):
         graph = CSVGraph()
 
-        def load_csv(file_name):
-            file_path = os.path.join(folder_path, file_name)
-            label = file_name[:-4]  # remove .csv extension
+        def load_csv(csv_file):
+            file_path, label = csv_file
             df = pd.read_csv(file_path)
             self._is_valid_df(df)
             if self._is_node_df(df):
@@ -43,9 +61,8 @@ class CSVGraphReader(GraphReaderStrategy):
                 return CSVEdge(df=df, label=label)
             return None
 
-        csv_files = [f for f in os.listdir(folder_path) if f.endswith(".csv")]
         with ThreadPoolExecutor() as executor:
-            for result in executor.map(load_csv, csv_files):
+            for result in executor.map(load_csv, self._csv_files(folder_path)):
                 if isinstance(result, CSVNode):
                     graph.nodes.append(result)
                 elif isinstance(result, CSVEdge):
@@ -109,3 +126,42 @@ class CSVGraphReader(GraphReaderStrategy):
     def read(self, folder_path) -> DirectedGraph:
         csv_graph = self._read_csv_graph(folder_path)
         return self._csv_to_nx(csv_graph)
+
+    def iter_batches(
+        self, folder_path, batch_size: int = 1 << 20
+    ) -> Iterator[NodeBatch | EdgeBatch]:
+        """
+        Stream the folder as batches: every node file, then every edge file,
+        ``batch_size`` rows at a time. Labels come from the file names, as in
+        ``read``; ``src|dst`` rows are split by the CSV parser itself.
+        """
+        node_files, edge_files = [], []
+        for file_path, label in self._csv_files(folder_path):
+            with open(file_path) as f:
+                header = f.readline()
+            # Same rules as _is_node_df/_is_edge_df, on the header line only
+            if "id:ID" in header:
+                node_files.append((file_path, label))
+            elif ":START_ID" in header:
+                edge_files.append((file_path, label))
+
+        for file_path, label in node_files:
+            for chunk in pd.read_csv(file_path, chunksize=batch_size):
+                ids = chunk.iloc[:, 0].to_numpy(dtype=np.int64)
+                yield NodeBatch(ids, np.full(len(ids), label, dtype=object))
+        for file_path, label in edge_files:
+            chunks = pd.read_csv(
+                file_path,
+                sep="|",
+                header=None,
+                skiprows=1,
+                names=["src", "dst"],
+                dtype=np.int64,
+                chunksize=batch_size,
+            )
+            for chunk in chunks:
+                yield EdgeBatch(
+                    chunk["src"].to_numpy(),
+                    chunk["dst"].to_numpy(),
+                    np.full(len(chunk), label, dtype=object),
+                )
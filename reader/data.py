@@ -1,6 +1,11 @@
-from operator import le
+from itertools import islice
+from typing import Iterator
+
+import numpy as np
+
 from db import DBGraphs
 from graph import DBGraph, DirectedGraph
+from records import EdgeBatch, NodeBatch, StreamingError
 from reader.strategy import GraphReaderStrategy
 
 
@@ -47,18 +52,22 @@ class DataGraphReader(GraphReaderStrategy):
         else:
             raise ValueError("Invalid edge line format")
 
-    def read_db(self, path: str) -> DBGraphs:
-        # read the file
-        db = DBGraphs()
+    def iter_db(self, path: str) -> Iterator[DBGraph]:
+        """
+        Parse the database line by line, yielding each graph as soon as the
+        next header (or the end of the file) is reached.
+        """
+        graph = None
         with open(path, "r") as file:
-            lines = file.readlines()
-            graph = DBGraph()
-            for l in lines:
+            for l in file:
                 if self._line_is_graph_header(l):
                     # process the graph header
+                    if graph is not None:
+                        yield graph
                     graph_id = self._extract_graph_id(l)
                     graph = DBGraph(graph_id=graph_id)
-                    db.add_graph(graph)
+                elif graph is None:
+                    continue
                 elif self._line_is_node(l):
                     node_id, labels = self._extract_node(l)
                     graph.add_node(node_id, labels=labels)
@@ -68,8 +77,11 @@ class DataGraphReader(GraphReaderStrategy):
                         graph.add_edge(src_id, dst_id)
                     for label in labels:
                         graph.add_edge(src_id, dst_id, label=label)
+        if graph is not None:
+            yield graph
 
-        return db
+    def read_db(self, path: str) -> DBGraphs:
+        return DBGraphs(self.iter_db(path))
 
     def read(self, path: str) -> DirectedGraph:
         # read the file
@@ -82,7 +94,43 @@ class DataGraphReader(GraphReaderStrategy):
                     graph.add_node(node_id, labels=labels)
                 elif self._line_is_edge(l):
                     src_id, dst_id, labels = self._extract_edge(l)
+                    if len(labels) == 0:
+                        graph.add_edge(src_id, dst_id)
                     for label in labels:
                         graph.add_edge(src_id, dst_id, label=label)
 
         return graph
+
+    def iter_batches(
+        self, path: str, batch_size: int = 1 << 16
+    ) -> Iterator[NodeBatch | EdgeBatch]:
+        """
+        Parse a single-graph file ``batch_size`` lines at a time into node and
+        edge batches, as ``read`` would build them: node labels joined as the
+        saver writes them, one arc per edge label and "" for unlabeled records.
+        Nodes declared after an edge of an earlier chunk raise ``StreamingError``.
+        """
+        seen_edges = False
+        with open(path, "r") as file:
+            for lines in iter(lambda: list(islice(file, batch_size)), []):
+                nodes = [l.split() for l in lines if self._line_is_node(l)]
+                edges = [l.split() for l in lines if self._line_is_edge(l)]
+                if nodes:
+                    if seen_edges:
+                        raise StreamingError(
+                            f"{path} declares nodes after edges and cannot be streamed"
+                        )
+                    yield NodeBatch(
+                        np.array([int(p[1]) for p in nodes], dtype=np.int64),
+                        np.array([", ".join(p[2:]) for p in nodes], dtype=object),
+                    )
+                if edges:
+                    seen_edges = True
+                    # One arc per label, like read()
+                    arcs = [(p[1], p[2], label) for p in edges for label in p[3:] or [""]]
+                    src, dst, labels = zip(*arcs)
+                    yield EdgeBatch(
+                        np.array(src, dtype=np.int64),
+                        np.array(dst, dtype=np.int64),
+                        np.array(labels, dtype=object),
+                    )
@@ -1,7 +1,11 @@
+from typing import Iterator
+
 from db import DBGraphs
-from graph import DirectedGraph
+from graph import DBGraph, DirectedGraph
+from instrument import timed, timed_iter
 from reader.strategy import GraphReaderStrategy, reader_factory_strategy
 from reader.types import InputFormat
+from records import EdgeBatch, NodeBatch
 
 
 class Reader:
@@ -9,12 +13,23 @@ class Reader:
     def __init__(self, strategy: GraphReaderStrategy):
         self._strategy = strategy
 
+    @timed("read")
     def read(self, path: str) -> DirectedGraph:
         return self._strategy.read(path)
 
+    @timed("read_db")
     def read_db(self, path: str) -> DBGraphs:
         return self._strategy.read_db(path)
 
+    def iter_db(self, path: str) -> Iterator[DBGraph]:
+        return timed_iter("read_db.graph", self._strategy.iter_db(path))
+
+    def supports_batches(self) -> bool:
+        return type(self._strategy).iter_batches is not GraphReaderStrategy.iter_batches
+
+    def iter_batches(self, path: str) -> Iterator[NodeBatch | EdgeBatch]:
+        return timed_iter("read.batch", self._strategy.iter_batches(path))
+
 
 def reader_factory(input_format: InputFormat) -> Reader:
 
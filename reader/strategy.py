@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from db import DBGraphs
-from graph import DirectedGraph
+from graph import DBGraph, DirectedGraph
+from records import EdgeBatch, NodeBatch
 from reader.types import InputFormat
 
 
@@ -14,6 +16,23 @@ class GraphReaderStrategy(ABC):
     def read_db(self, path: str) -> DBGraphs:
         raise NotImplementedError("Subclasses should implement this method")
 
+    def iter_db(self, path: str) -> Iterator[DBGraph]:
+        """
+        Yield the graphs of a database one at a time. Strategies that can
+        parse incrementally override this to avoid loading the whole database.
+        """
+        yield from self.read_db(path).iter_graphs()
+
+    def iter_batches(self, path: str) -> Iterator[NodeBatch | EdgeBatch]:
+        """
+        Yield the records of a single graph as node and edge batches (every
+        node batch before the first edge batch), without building the graph,
+        for savers that write batches (``SaverStrategy.save_batches``).
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming reads"
+        )
+
 
 def reader_factory_strategy(format: InputFormat) -> GraphReaderStrategy:
     if format == InputFormat.csv:
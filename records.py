@@ -0,0 +1,221 @@
+import json
+import os
+from dataclasses import dataclass
+
+import numpy as np
+
+# Sub-folder of a CSV graph folder that holds the arc files, so that a node
+# label and an arc label never share a file name
+CSV_ARCS_FOLDER = "arcs"
+
+
+class StreamingError(ValueError):
+    """
+    A source that cannot be written batch by batch (e.g. nodes declared after
+    arcs); callers fall back to building the graph.
+    """
+
+
+@dataclass
+class NodeBatch:
+    """A block of node records: ids and, optionally, one label per node."""
+
+    ids: np.ndarray
+    labels: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass
+class EdgeBatch:
+    """A block of arc records: parallel src/dst arrays and optional labels."""
+
+    src: np.ndarray
+    dst: np.ndarray
+    labels: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+
+def label_key(labels) -> str | None:
+    """A node or arc label as one string (several labels joined as in ``.data`` files), None if unlabeled."""
+    if labels is None:
+        return None
+    if not isinstance(labels, str):
+        labels = ", ".join(labels)
+    return labels or None
+
+
+def label_code(labels, vocab: dict) -> int:
+    """
+    Integer code of a node or arc label in ``vocab`` (extended with unseen
+    labels), -1 when unlabeled.
+    """
+    key = label_key(labels)
+    return -1 if key is None else vocab.setdefault(key, len(vocab))
+
+
+def label_codes(values: list, vocab: dict) -> np.ndarray:
+    """``label_code`` of every value, hashing them in one vectorized pass."""
+    import pandas as pd
+
+    try:
+        codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    except TypeError:
+        # Lists of labels are not hashable: join them first
+        codes, uniques = pd.factorize(
+            pd.Series([label_key(v) for v in values], dtype=object)
+        )
+    # Unlabeled values are factorized to -1, the last entry
+    table = np.array([label_code(u, vocab) for u in uniques] + [-1], dtype=np.int64)
+    return table[codes]
+
+
+@dataclass
+class GraphArrays:
+    """
+    A graph as NumPy arrays: ``edge_index[:, j]`` holds the positions (into
+    ``node_ids``) of the endpoints of arc ``j``, and the label arrays the
+    code of every node and arc (-1 when unlabeled).
+    """
+
+    node_ids: np.ndarray
+    node_labels: np.ndarray
+    edge_index: np.ndarray
+    edge_labels: np.ndarray
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return self.edge_index.shape[1]
+
+
+@dataclass
+class DBArrays:
+    """
+    A database as concatenated ``GraphArrays``: graph ``i`` owns nodes
+    ``node_ptr[i]:node_ptr[i + 1]`` and arcs ``edge_ptr[i]:edge_ptr[i + 1]``.
+    ``edge_index`` keeps per-graph node positions, so a slice is a graph's own
+    edge index. ``node_vocab``/``edge_vocab`` list the labels by code.
+    """
+
+    graph_ids: list
+    node_ptr: np.ndarray
+    edge_ptr: np.ndarray
+    node_ids: np.ndarray
+    node_labels: np.ndarray
+    edge_index: np.ndarray
+    edge_labels: np.ndarray
+    node_vocab: list[str]
+    edge_vocab: list[str]
+
+    # Arrays stored as <name>.npy in a saved database, besides meta.json
+    ARRAYS = (
+        "node_ptr",
+        "edge_ptr",
+        "node_ids",
+        "node_labels",
+        "edge_index",
+        "edge_labels",
+    )
+
+    def __len__(self) -> int:
+        return len(self.graph_ids)
+
+    def graph(self, i: int) -> GraphArrays:
+        """Views of the arrays of graph ``i``; nothing is copied."""
+        nodes = slice(self.node_ptr[i], self.node_ptr[i + 1])
+        edges = slice(self.edge_ptr[i], self.edge_ptr[i + 1])
+        return GraphArrays(
+            self.node_ids[nodes],
+            self.node_labels[nodes],
+            self.edge_index[:, edges],
+            self.edge_labels[edges],
+        )
+
+    @classmethod
+    def concatenate(
+        cls, graphs: list[GraphArrays], graph_ids: list, node_vocab: dict, edge_vocab: dict
+    ) -> "DBArrays":
+        node_ptr = np.zeros(len(graphs) + 1, dtype=np.int64)
+        edge_ptr = np.zeros(len(graphs) + 1, dtype=np.int64)
+        np.cumsum([g.num_nodes for g in graphs], out=node_ptr[1:])
+        np.cumsum([g.num_edges for g in graphs], out=edge_ptr[1:])
+
+        def concat(arrays, empty):
+            return np.concatenate(arrays, axis=-1) if arrays else empty
+
+        return cls(
+            graph_ids=list(graph_ids),
+            node_ptr=node_ptr,
+            edge_ptr=edge_ptr,
+            node_ids=concat([g.node_ids for g in graphs], np.empty(0, dtype=np.int64)),
+            node_labels=concat([g.node_labels for g in graphs], np.empty(0, dtype=np.int64)),
+            edge_index=concat([g.edge_index for g in graphs], np.empty((2, 0), dtype=np.int64)),
+            edge_labels=concat([g.edge_labels for g in graphs], np.empty(0, dtype=np.int64)),
+            node_vocab=list(node_vocab),
+            edge_vocab=list(edge_vocab),
+        )
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str | None = "r") -> "DBArrays":
+        """
+        Open a database written by the ``npy`` saver. Arrays are memory-mapped
+        by default, so graphs are read from disk only when sliced.
+        """
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in cls.ARRAYS
+        }
+        return cls(
+            graph_ids=meta["graph_ids"],
+            node_vocab=meta["node_vocab"],
+            edge_vocab=meta["edge_vocab"],
+            **arrays,
+        )
+
+
+class NodeLookup:
+    """
+    Positions of node ids in the order the nodes were streamed, found by
+    binary search over the sorted ids, for writers that receive arcs as ids.
+    """
+
+    def __init__(self, ids: np.ndarray):
+        self._index(ids)
+
+    def _index(self, ids: np.ndarray) -> None:
+        self._ids = ids
+        self._order = np.argsort(ids, kind="stable")
+        self._sorted = ids[self._order]
+        if len(ids) and (self._sorted[1:] == self._sorted[:-1]).any():
+            raise StreamingError("Node ids are declared more than once")
+
+    def _found(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        found = np.searchsorted(self._sorted, ids)
+        if len(self._sorted) == 0:
+            return found, np.zeros(len(ids), dtype=bool)
+        return found, self._sorted[np.minimum(found, len(self._sorted) - 1)] == ids
+
+    def missing(self, ids: np.ndarray) -> np.ndarray:
+        """Distinct ids not in the lookup, in order of first occurrence."""
+        _, known = self._found(ids)
+        unknown, first = np.unique(ids[~known], return_index=True)
+        return unknown[np.argsort(first)]
+
+    def extend(self, ids: np.ndarray) -> None:
+        """Add new ids after the current ones."""
+        self._index(np.concatenate([self._ids, ids]))
+
+    def positions(self, ids: np.ndarray) -> np.ndarray:
+        found, known = self._found(ids)
+        if not known.all():
+            raise ValueError("Arc endpoints must be declared in a node batch first")
+        return self._order[found]
@@ -1,3 +1,11 @@
-from .strategy import reify_strategy_factory
-from .reificator import Reificator
+from lazy import lazy_attributes
+
 from .types import ReifyStrategyTypes
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "reify_strategy_factory": ".strategy",
+        "Reificator": ".reificator",
+    },
+)
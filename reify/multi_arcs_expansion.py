@@ -1,3 +1,5 @@
+import numpy as np
+
 from graph import DBGraph, DirectedGraph
 from reify.strategy import ReifyStrategy
 
@@ -41,27 +43,103 @@ class MultiArcsExpansionStrategy(ReifyStrategy):
         self.target_label = target_label
         self.new_node_prefix = new_node_prefix
 
+    def _is_edge_node(self, labels) -> bool:
+        if isinstance(labels, str):
+            return labels.startswith(self.new_node_prefix)
+        return bool(labels) and str(labels[0]).startswith(self.new_node_prefix)
+
+    def _edge_node_label(self, labels) -> str:
+        label = labels if isinstance(labels, str) else labels[0]
+        return label[len(self.new_node_prefix) :]
+
     def reify(self, graph: DBGraph) -> DBGraph:
+        """
+        Replace every group of parallel arcs with intermediate nodes; single
+        arcs are kept as they are.
 
-        reif_g = graph.copy()
+        Parallel arcs are adjacent in edge order (they share one key dict), so
+        groups are found with one run-length pass over the endpoint arrays and
+        all intermediate node ids are allocated as one contiguous block.
+        """
+        nodes, src, dst = graph.edge_arrays()
+        edges = list(graph.edges(keys=True, data=True))
+        num_edges = len(edges)
+
+        # Run lengths of identical (src, dst) pairs
+        starts = np.ones(num_edges, dtype=bool)
+        starts[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        run_ids = np.cumsum(starts) - 1
+        multiplicity = np.bincount(run_ids)[run_ids] if num_edges else run_ids
+        expanded = np.flatnonzero(multiplicity > 1)
 
         max_node_id = max(graph.nodes(), default=-1)
+        new_ids = range(max_node_id + 1, max_node_id + 1 + len(expanded))
 
-        for u, v in set(graph.edges()):
-            count = graph.number_of_edges(u, v)
-            if count == 1:
-                data = graph.get_edge_data(u, v)[0]
-                reif_g.add_edge(u, v, **data)
-            else:
-                keys = list(graph.get_edge_data(u, v).keys())
-                for i, key in enumerate(keys):
-                    edge_data = graph.get_edge_data(u, v, key)
-                    new_node_id = max_node_id + 1
-                    max_node_id += 1
-                    new_node_label = edge_data.get("label", "")
-                    reif_g.add_node(
-                        new_node_id, labels=f"{self.new_node_prefix}{new_node_label}"
-                    )
-                    reif_g.add_edge(u, new_node_id, label=self.source_label)
-                    reif_g.add_edge(new_node_id, v, label=self.target_label)
+        reif_g = DBGraph(graph_id=graph.get_graph_id())
+        reif_g.add_nodes_from(graph.nodes(data=True))
+        reif_g.add_edges_from(edges[i] for i in np.flatnonzero(multiplicity == 1))
+
+        expanded_edges = [edges[i] for i in expanded]
+        reif_g.add_nodes_from(
+            (new_id, {"labels": f"{self.new_node_prefix}{data.get('label', '')}"})
+            for new_id, (_, _, _, data) in zip(new_ids, expanded_edges)
+        )
+        reif_g.add_edges_from(
+            (u, new_id, {"label": self.source_label})
+            for new_id, (u, _, _, _) in zip(new_ids, expanded_edges)
+        )
+        reif_g.add_edges_from(
+            (new_id, v, {"label": self.target_label})
+            for new_id, (_, v, _, _) in zip(new_ids, expanded_edges)
+        )
         return reif_g
+
+    def dereify(self, graph: DBGraph) -> DBGraph:
+        """
+        Inverse of ``reify``: collapse every intermediate node (label starting
+        with ``new_node_prefix``) back into an arc from its source to its
+        target, labelled with the rest of the node label.
+        """
+        nodes, src, dst = graph.edge_arrays()
+        edges = list(graph.edges(keys=True, data=True))
+        num_nodes = len(nodes)
+
+        is_edge_node = np.fromiter(
+            (
+                self._is_edge_node(data.get("labels", data.get("label", "")))
+                for _, data in graph.nodes(data=True)
+            ),
+            dtype=bool,
+            count=num_nodes,
+        )
+        labels = np.array(
+            [data.get("label") for _, _, _, data in edges], dtype=object
+        )
+
+        # For every intermediate node, the position of its source and target
+        source_of = np.full(num_nodes, -1, dtype=np.int64)
+        target_of = np.full(num_nodes, -1, dtype=np.int64)
+        into = is_edge_node[dst] & (labels == self.source_label)
+        out_of = is_edge_node[src] & (labels == self.target_label)
+        source_of[dst[into]] = src[into]
+        target_of[src[out_of]] = dst[out_of]
+
+        collapsible = is_edge_node & (source_of >= 0) & (target_of >= 0)
+        touched = (collapsible[dst] & into) | (collapsible[src] & out_of)
+
+        deref_g = DBGraph(graph_id=graph.get_graph_id())
+        deref_g.add_nodes_from(
+            node for node, keep in zip(graph.nodes(data=True), ~collapsible) if keep
+        )
+        deref_g.add_edges_from(edges[i] for i in np.flatnonzero(~touched))
+
+        node_data = graph.nodes(data=True)
+        for i in np.flatnonzero(collapsible):
+            data = node_data[nodes[i]]
+            label = self._edge_node_label(data.get("labels", data.get("label", "")))
+            u, v = nodes[source_of[i]], nodes[target_of[i]]
+            if label:
+                deref_g.add_edge(u, v, label=label)
+            else:
+                deref_g.add_edge(u, v)
+        return deref_g
@@ -1,4 +1,5 @@
 from graph import DBGraph, DirectedGraph
+from instrument import timed
 from reify.multi_arcs_expansion import MultiArcsExpansionStrategy
 from reify.strategy import ReifyStrategy
 import enum
@@ -9,8 +10,16 @@ class Reificator:
     def __init__(self, strategy: ReifyStrategy):
         self._strategy = strategy
 
+    @timed("reify")
     def reify(self, graph: DBGraph) -> DBGraph:
         """
         Reify the given graph using the injected strategy.
         """
         return self._strategy.reify(graph)
+
+    @timed("dereify")
+    def dereify(self, graph: DBGraph) -> DBGraph:
+        """
+        Undo the reification of the given graph using the injected strategy.
+        """
+        return self._strategy.dereify(graph)
@@ -12,6 +12,14 @@ class ReifyStrategy(ABC):
         """
         pass
 
+    def dereify(self, graph: DBGraph) -> DBGraph:
+        """
+        Undo ``reify``, returning a graph equivalent to the original one.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support de-reification"
+        )
+
 
 def reify_strategy_factory(strategy_type: str) -> ReifyStrategy:
     """
@@ -0,0 +1,5 @@
+from lazy import lazy_attributes
+
+from .types import SAMPLER_STRATEGIES, SamplerType, StartNodePolicy
+
+__getattr__ = lazy_attributes(__name__, {"sampler_factory": ".strategy"})
@@ -0,0 +1,17 @@
+from graph import DirectedGraph
+from sampler.strategy import SamplerStrategy
+
+
+class BFSSampler(SamplerStrategy):
+    """
+    Breadth-first ball around the start node, as extracted by
+    ``DirectedGraph.extract_subgraph_by_edge_count``. Deterministic; it is the
+    default so existing databases can be rebuilt unchanged.
+    """
+
+    def sample(self, graph: DirectedGraph, num_edges: int, start=None, rng=None) -> DirectedGraph:
+        if graph.number_of_nodes() == 0:
+            return graph.__class__()
+        if start is None:
+            start = next(iter(graph))
+        return graph.extract_subgraph_by_edge_count(start, num_edges)
@@ -0,0 +1,74 @@
+from typing import Iterator
+
+import numpy as np
+
+from sampler.index import ArcIndex
+from sampler.strategy import SamplerStrategy
+
+
+class ForestFireSampler(SamplerStrategy):
+
+    def __init__(self, seed=None, p: float = 0.7):
+        """
+        Forest fire sampling: every burning node sets fire to a geometric
+        number (mean ``p / (1 - p)``) of its unvisited neighbors, chosen at
+        random; a whole front burns in one NumPy step. When the fire dies
+        out it is restarted from a random burned node that still has
+        unvisited neighbors.
+
+        Parameters
+        ----------
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator.
+        p : float
+            Forward burning probability.
+        """
+        super().__init__(seed=seed)
+        if not 0 <= p < 1:
+            raise ValueError(f"p must be in [0, 1), got {p}")
+        self.p = p
+
+    def burn_counts(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """Number of neighbors each of ``size`` burning nodes sets fire to."""
+        return rng.geometric(1 - self.p, size=size) - 1
+
+    def visit(
+        self,
+        index: ArcIndex,
+        start: int,
+        visited: np.ndarray,
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        front = np.array([start], dtype=np.int64)
+        frontier = self.frontier(index, visited, start)
+        while True:
+            if front.size == 0:
+                front = frontier.draw(1, rng)
+                if front is None:
+                    return
+
+            entries, owner = index.entries(front)
+            neighbors = index.neighbors[entries]
+            unvisited = ~visited[neighbors]
+            neighbors, owner = neighbors[unvisited], owner[unvisited]
+            priority = rng.random(neighbors.size)
+
+            # One candidate per neighbor (parallel arcs, neighbors shared by
+            # several burning nodes): the one with the lowest priority
+            by_neighbor = np.lexsort((priority, neighbors))
+            first = np.ones(by_neighbor.size, dtype=bool)
+            first[1:] = neighbors[by_neighbor][1:] != neighbors[by_neighbor][:-1]
+            pick = by_neighbor[first]
+            neighbors, owner, priority = neighbors[pick], owner[pick], priority[pick]
+
+            # Every burning node takes its lowest-priority candidates
+            by_owner = np.lexsort((priority, owner))
+            owner = owner[by_owner]
+            rank = np.arange(owner.size) - np.searchsorted(owner, owner)
+            burned = neighbors[by_owner][rank < self.burn_counts(front.size, rng)[owner]]
+
+            visited[burned] = True
+            if burned.size:
+                frontier.add(burned)
+                yield burned
+            front = burned
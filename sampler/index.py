@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from itertools import islice
+
+import numpy as np
+
+from graph import DirectedGraph, undirected_csr
+
+
+@dataclass
+class ArcIndex:
+    """
+    Integer arrays describing a graph, built once and shared by every sample
+    drawn from it.
+
+    Arcs are numbered in ``graph.edges()`` order; ``src``/``dst`` hold their
+    endpoints as positions into ``nodes``. ``indptr``/``neighbors``/``edge_ids``
+    is the undirected CSR adjacency (samplers traverse arcs in both
+    directions, like the BFS extraction). ``pair_of`` and ``pair_start`` map
+    an arc back to its ``(u, v)`` pair so it can be materialized with its key
+    and attributes.
+    """
+
+    graph: DirectedGraph
+    nodes: list
+    src: np.ndarray
+    dst: np.ndarray
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    edge_ids: np.ndarray
+    pair_of: np.ndarray
+    pair_start: np.ndarray
+    _positions: dict | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_graph(cls, graph: DirectedGraph) -> "ArcIndex":
+        nodes, heads, tails, multiplicity = graph.adjacency_pairs()
+        src = np.repeat(heads, multiplicity)
+        dst = np.repeat(tails, multiplicity)
+        pair_start = np.zeros(len(multiplicity), dtype=np.int64)
+        np.cumsum(multiplicity[:-1], out=pair_start[1:])
+        return cls(
+            graph,
+            nodes,
+            src,
+            dst,
+            *undirected_csr(len(nodes), src, dst),
+            pair_of=np.repeat(np.arange(len(multiplicity), dtype=np.int64), multiplicity),
+            pair_start=pair_start,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src)
+
+    def position(self, node) -> int:
+        """Position of ``node`` in ``nodes``."""
+        if self._positions is None:
+            self._positions = {n: i for i, n in enumerate(self.nodes)}
+        try:
+            return self._positions[node]
+        except KeyError:
+            raise ValueError(f"Node {node} not found in graph.") from None
+
+    def entries(self, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """CSR entry positions of the given nodes, and the index into ``nodes`` owning each."""
+        starts = self.indptr[nodes]
+        lengths = self.indptr[nodes + 1] - starts
+        owner = np.repeat(np.arange(len(nodes), dtype=np.int64), lengths)
+        first = np.cumsum(lengths) - lengths
+        return starts[owner] + np.arange(owner.size, dtype=np.int64) - first[owner], owner
+
+    def degree(self) -> np.ndarray:
+        """Undirected degree (in + out arcs) of every node position."""
+        return np.diff(self.indptr)
+
+    def materialize(self, start: int, arcs: np.ndarray) -> DirectedGraph:
+        """
+        Build the subgraph holding the start node and the given arcs (positions
+        in ``graph.edges()`` order), with their keys and attributes.
+        """
+        graph = self.graph
+        subgraph = graph.__class__()
+        node_ids = np.unique(np.concatenate([[start], self.src[arcs], self.dst[arcs]]))
+        subgraph.add_nodes_from(
+            (node, graph.nodes[node]) for node in map(self.nodes.__getitem__, node_ids.tolist())
+        )
+
+        arcs = np.sort(arcs)
+        offsets = arcs - self.pair_start[self.pair_of[arcs]]
+
+        def arc_records():
+            for u, v, offset in zip(
+                self.src[arcs].tolist(), self.dst[arcs].tolist(), offsets.tolist()
+            ):
+                u, v = self.nodes[u], self.nodes[v]
+                keydict = graph._adj[u][v]
+                key = next(islice(keydict, offset, None))
+                yield u, v, key, keydict[key]
+
+        subgraph.add_edges_from(arc_records())
+        return subgraph
@@ -0,0 +1,44 @@
+from typing import Iterator
+
+import numpy as np
+
+from sampler.index import ArcIndex
+from sampler.strategy import SamplerStrategy
+
+
+class InducedRandomNodeSampler(SamplerStrategy):
+
+    def __init__(self, seed=None, chunk_size: int = 1024):
+        """
+        Induced random node sampling: nodes are added in random order (the
+        start node first) and the sample takes the arcs between added nodes.
+        It is not restricted to the start node's component, so samples are
+        generally disconnected but every target size up to the whole graph
+        can be met.
+
+        Parameters
+        ----------
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator.
+        chunk_size : int
+            Nodes added in the first chunk; later chunks double in size.
+        """
+        super().__init__(seed=seed)
+        self.chunk_size = max(1, chunk_size)
+
+    def visit(
+        self,
+        index: ArcIndex,
+        start: int,
+        visited: np.ndarray,
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        order = rng.permutation(index.num_nodes)
+        order = order[order != start]
+        first, size = 0, self.chunk_size
+        while first < order.size:
+            chunk = order[first : first + size]
+            visited[chunk] = True
+            yield chunk
+            first += size
+            size *= 2
@@ -0,0 +1,80 @@
+from typing import Iterator
+
+import numpy as np
+
+from sampler.index import ArcIndex
+from sampler.strategy import SamplerStrategy
+
+
+class RandomWalkSampler(SamplerStrategy):
+
+    def __init__(
+        self,
+        seed=None,
+        restart: float = 0.15,
+        walkers: int = 32,
+        patience: int = 64,
+    ):
+        """
+        Random walk with restart, with ``walkers`` walks advanced together in
+        one NumPy step.
+
+        Parameters
+        ----------
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator.
+        restart : float
+            Probability that a walker jumps back to its home node (the start
+            node) instead of moving to a random neighbor.
+        walkers : int
+            Number of walks advanced per step.
+        patience : int
+            Steps without reaching a new node after which the walkers move
+            (and rehome) to random visited nodes that still have unvisited
+            neighbors; the walk stops when there is none left.
+        """
+        super().__init__(seed=seed)
+        if not 0 <= restart < 1:
+            raise ValueError(f"restart must be in [0, 1), got {restart}")
+        self.restart = restart
+        self.walkers = max(1, walkers)
+        self.patience = max(1, patience)
+
+    def visit(
+        self,
+        index: ArcIndex,
+        start: int,
+        visited: np.ndarray,
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        if index.neighbors.size == 0:
+            return
+        degree = index.degree()
+        last_entry = index.neighbors.size - 1
+        home = np.full(self.walkers, start, dtype=np.int64)
+        position = home.copy()
+        idle = 0
+        frontier = self.frontier(index, visited, start)
+        while True:
+            deg = degree[position]
+            move = (rng.random(self.walkers) >= self.restart) & (deg > 0)
+            entry = index.indptr[position] + (rng.random(self.walkers) * deg).astype(np.int64)
+            position = np.where(move, index.neighbors[np.minimum(entry, last_entry)], home)
+
+            new = position[~visited[position]]
+            if new.size:
+                # Distinct new nodes, in walker order
+                new = new[np.sort(np.unique(new, return_index=True)[1])]
+                visited[new] = True
+                frontier.add(new)
+                idle = 0
+                yield new
+                continue
+
+            idle += 1
+            if idle >= self.patience:
+                home = frontier.draw(self.walkers, rng)
+                if home is None:
+                    return
+                position = home.copy()
+                idle = 0
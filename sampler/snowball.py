@@ -0,0 +1,26 @@
+import numpy as np
+
+from sampler.forest_fire import ForestFireSampler
+
+
+class SnowballSampler(ForestFireSampler):
+
+    def __init__(self, seed=None, k: int = 5):
+        """
+        Snowball sampling: every node of the current wave recruits up to
+        ``k`` of its unvisited neighbors, chosen at random.
+
+        Parameters
+        ----------
+        seed : int | SeedSequence | None
+            Seed of the NumPy generator.
+        k : int
+            Neighbors recruited per node.
+        """
+        super().__init__(seed=seed)
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        self.k = k
+
+    def burn_counts(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        return np.full(size, self.k, dtype=np.int64)
@@ -0,0 +1,204 @@
+import random
+from abc import ABC
+from itertools import chain
+from typing import Iterator
+
+import numpy as np
+
+from graph import DirectedGraph
+from instrument import timed
+from sampler.index import ArcIndex
+from sampler.types import SamplerType, StartNodePolicy
+
+
+class Frontier:
+    """
+    Visited nodes that may still have unvisited neighbors, for samplers that
+    restart from one of them. Nodes are added as they are visited and dropped
+    lazily, once a draw finds all their neighbors visited, so a restart costs
+    the degrees of the nodes it checks rather than a scan of the whole graph.
+    """
+
+    def __init__(self, index: ArcIndex, visited: np.ndarray, start: int):
+        self._index = index
+        self._visited = visited
+        self._nodes = np.array([start], dtype=np.int64)
+        self._added: list[np.ndarray] = []
+
+    def add(self, nodes: np.ndarray) -> None:
+        self._added.append(nodes)
+
+    def draw(self, size: int, rng: np.random.Generator) -> np.ndarray | None:
+        """
+        ``size`` nodes drawn uniformly (with replacement) among the open ones,
+        or None when every visited node is closed.
+        """
+        if self._added:
+            self._nodes = np.concatenate([self._nodes, *self._added])
+            self._added = []
+        while self._nodes.size:
+            picks = self._nodes[rng.integers(self._nodes.size, size=size)]
+            candidates = np.unique(picks)
+            entries, owner = self._index.entries(candidates)
+            is_open = np.zeros(candidates.size, dtype=bool)
+            is_open[owner[~self._visited[self._index.neighbors[entries]]]] = True
+            if is_open.all():
+                return picks
+            # Closed nodes stay closed (visited only grows): drop them and redraw
+            self._nodes = self._nodes[~np.isin(self._nodes, candidates[~is_open])]
+        return None
+
+
+class SamplerStrategy(ABC):
+    """
+    Extracts a subgraph with a target number of arcs, starting from a node.
+
+    Node-based samplers implement ``visit``: they yield the nodes they reach,
+    in chunks. The sample is made of the arcs between visited nodes, taken
+    in the order they become available (an arc is available once both of its
+    endpoints are visited; arcs made available by the same node come in
+    random order) until exactly ``num_edges`` are taken, unless the part of
+    the graph the sampler can reach is smaller. Traversals reach every node
+    through an arc from an earlier one, so their samples stay connected.
+
+    The integer arrays of a graph (``ArcIndex``) are built once and reused
+    while the same graph is sampled again, as ``db_construct`` does.
+    """
+
+    def __init__(self, seed=None):
+        self._rng = np.random.default_rng(seed)
+        self._index: ArcIndex | None = None
+
+    def index(self, graph: DirectedGraph) -> ArcIndex:
+        if self._index is None or self._index.graph is not graph:
+            self._index = ArcIndex.from_graph(graph)
+        return self._index
+
+    def start_node(
+        self,
+        graph: DirectedGraph,
+        policy: StartNodePolicy = StartNodePolicy.first,
+        rng: np.random.Generator | None = None,
+    ):
+        """
+        Pick the node to grow a sample from: the first node (O(1)), a random
+        node, the node of highest degree (both from the cached ``ArcIndex``)
+        or a peripheral node found with ``extract_k_distant_nodes``.
+        Returns None for an empty graph.
+        """
+        if graph.number_of_nodes() == 0:
+            return None
+        if policy == StartNodePolicy.first:
+            return next(iter(graph))
+        rng = self._rng if rng is None else rng
+        if policy == StartNodePolicy.distant:
+            # Landmarks are drawn from the stdlib generator
+            random.seed(int(rng.integers(2**63)))
+            return graph.extract_k_distant_nodes(1)[0]
+        index = self.index(graph)
+        if policy == StartNodePolicy.random:
+            return index.nodes[int(rng.integers(index.num_nodes))]
+        if policy == StartNodePolicy.highest_degree:
+            return index.nodes[int(np.argmax(index.degree()))]
+        raise ValueError(f"Unsupported start node policy: {policy}")
+
+    @timed("sample")
+    def sample(
+        self,
+        graph: DirectedGraph,
+        num_edges: int,
+        start=None,
+        rng: np.random.Generator | None = None,
+    ) -> DirectedGraph:
+        """
+        Sample ``num_edges`` arcs of ``graph`` around ``start`` (default: the
+        first node). ``rng`` overrides the sampler's own generator, so callers
+        can seed every graph independently.
+        """
+        if graph.number_of_nodes() == 0:
+            return graph.__class__()
+        rng = self._rng if rng is None else rng
+        index = self.index(graph)
+        start = 0 if start is None else index.position(start)
+        num_edges = min(max(num_edges, 0), index.num_edges)
+        return index.materialize(start, self.sample_arcs(index, start, num_edges, rng))
+
+    def sample_arcs(
+        self, index: ArcIndex, start: int, num_edges: int, rng: np.random.Generator
+    ) -> np.ndarray:
+        """Positions (in ``graph.edges()`` order) of the sampled arcs."""
+        rank = np.empty(index.num_nodes, dtype=np.int64)
+        visited = np.zeros(index.num_nodes, dtype=bool)
+        visited[start] = True
+        arcs, ready = [], []
+        available = 0
+        order = 0
+        chunks = chain([np.array([start])], self.visit(index, start, visited, rng))
+        for chunk in chunks if num_edges > 0 else ():
+            # ``visit`` marks ``visited`` itself; collect the arcs the chunk
+            # closes (both endpoints visited, at least one in the chunk)
+            rank[chunk] = order + np.arange(len(chunk))
+            order += len(chunk)
+            entries, owner = index.entries(chunk)
+            neighbors = index.neighbors[entries]
+            closed = visited[neighbors]
+            chunk_arcs, first = np.unique(
+                index.edge_ids[entries[closed]], return_index=True
+            )
+            arcs.append(chunk_arcs)
+            ready.append(
+                np.maximum(rank[chunk[owner[closed]]], rank[neighbors[closed]])[first]
+            )
+            available += chunk_arcs.size
+            if available >= num_edges:
+                break
+
+        if not arcs:
+            return np.empty(0, dtype=np.int64)
+        arcs = np.concatenate(arcs)
+        # Arcs ordered by the rank of their later endpoint, randomly within a rank
+        order = np.lexsort((rng.random(arcs.size), np.concatenate(ready)))
+        return arcs[order[:num_edges]]
+
+    def visit(
+        self,
+        index: ArcIndex,
+        start: int,
+        visited: np.ndarray,
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield chunks of newly visited node positions (marking them in
+        ``visited``), the start node excluded, until the reachable nodes run out.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not sample over integer adjacency arrays"
+        )
+
+    @staticmethod
+    def frontier(index: ArcIndex, visited: np.ndarray, start: int) -> "Frontier":
+        return Frontier(index, visited, start)
+
+def sampler_factory(sampler_type: SamplerType, seed=None) -> SamplerStrategy:
+    if sampler_type == SamplerType.bfs:
+        from sampler.bfs import BFSSampler
+
+        return BFSSampler(seed=seed)
+    elif sampler_type == SamplerType.random_walk:
+        from sampler.random_walk import RandomWalkSampler
+
+        return RandomWalkSampler(seed=seed)
+    elif sampler_type == SamplerType.forest_fire:
+        from sampler.forest_fire import ForestFireSampler
+
+        return ForestFireSampler(seed=seed)
+    elif sampler_type == SamplerType.snowball:
+        from sampler.snowball import SnowballSampler
+
+        return SnowballSampler(seed=seed)
+    elif sampler_type == SamplerType.induced_random_node:
+        from sampler.induced import InducedRandomNodeSampler
+
+        return InducedRandomNodeSampler(seed=seed)
+    else:
+        raise ValueError(f"Unsupported sampler strategy: {sampler_type}")
@@ -0,0 +1,19 @@
+from enum import Enum
+
+
+class SamplerType(str, Enum):
+    bfs = "bfs"
+    random_walk = "random_walk"
+    forest_fire = "forest_fire"
+    snowball = "snowball"
+    induced_random_node = "induced_random_node"
+
+
+SAMPLER_STRATEGIES = SamplerType
+
+
+class StartNodePolicy(str, Enum):
+    first = "first"
+    random = "random"
+    highest_degree = "highest_degree"
+    distant = "distant"
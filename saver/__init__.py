@@ -1,2 +1,5 @@
-from .saver import saver_factory
-from .types import OUTPUT_FORMATS, OutputFormat
+from lazy import lazy_attributes
+
+from .types import DIRECTORY_FORMATS, OUTPUT_FORMATS, NodeIds, OutputFormat
+
+__getattr__ = lazy_attributes(__name__, {"saver_factory": ".saver"})
@@ -0,0 +1,227 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from db import DBGraphs
+from graph import DirectedGraph
+from records import (
+    CSV_ARCS_FOLDER,
+    EdgeBatch,
+    NodeBatch,
+    NodeLookup,
+    StreamingError,
+    label_codes,
+)
+from saver.strategy import SaverStrategy
+
+
+class CSVSaverStrategy(SaverStrategy):
+    """
+    Saves a graph as a folder of Neo4j-style CSV files, the layout read by
+    ``CSVGraphReader``: one ``<label>.csv`` per node label with an
+    ``id:ID(graph)`` column, and one ``arcs/<label>.csv`` per arc label with
+    a ``:START_ID(graph)|:END_ID(graph)`` column of ``src|dst`` rows. Node ids
+    are unique within a graph, so every file shares the one ID space and arcs
+    resolve whatever the labels of their endpoints; labels are given by the
+    file names. Arc files live in their own sub-folder so that nodes and arcs
+    may share labels. Unlabeled nodes and arcs are written as ``Node`` and
+    ``EDGE``.
+
+    A database is saved as one such folder per graph, named after the graph id.
+    """
+
+    DEFAULT_NODE_LABEL = "Node"
+    DEFAULT_EDGE_LABEL = "EDGE"
+    ID_SPACE = "graph"
+    NODE_HEADER = f"id:ID({ID_SPACE})"
+    ARC_HEADER = (f":START_ID({ID_SPACE})", f":END_ID({ID_SPACE})")
+
+    def __init__(self, chunksize: int | None = None, workers: int | None = None):
+        """
+        Parameters
+        ----------
+        chunksize : int | None
+            Rows written per ``to_csv`` chunk (default: whole file at once).
+        workers : int | None
+            Threads writing files in parallel (default: one per file, up to
+            the ``ThreadPoolExecutor`` default).
+        """
+        self.chunksize = chunksize
+        self.workers = workers
+
+    def _frames(self, graph: DirectedGraph) -> dict[str, pd.DataFrame]:
+        """
+        One frame per output file, keyed by file path relative to the graph
+        folder. Arc frames have a start and an end column, written with ``|``
+        as separator so that every row reads back as a single ``src|dst`` value.
+        """
+        node_vocab, edge_vocab = {}, {}
+        arrays = graph.to_arrays(node_vocab, edge_vocab)
+        node_names = list(node_vocab) + [self.DEFAULT_NODE_LABEL]
+        edge_names = list(edge_vocab) + [self.DEFAULT_EDGE_LABEL]
+        # Unlabeled (-1) becomes the default label at the end of the names
+        node_codes = np.where(arrays.node_labels < 0, len(node_vocab), arrays.node_labels)
+        edge_codes = np.where(arrays.edge_labels < 0, len(edge_vocab), arrays.edge_labels)
+
+        node_ids = arrays.node_ids
+        if self.id_map is not None:
+            node_ids = self.id_map.restore(node_ids)
+        src, dst = arrays.edge_index
+
+        frames = {}
+        for label, positions in self._groups(node_codes, node_names):
+            frames[f"{label}.csv"] = pd.DataFrame({self.NODE_HEADER: node_ids[positions]})
+        start, end = self.ARC_HEADER
+        for label, arcs in self._groups(edge_codes, edge_names):
+            frames[os.path.join(CSV_ARCS_FOLDER, f"{label}.csv")] = pd.DataFrame(
+                {start: node_ids[src[arcs]], end: node_ids[dst[arcs]]}
+            )
+        return frames
+
+    @staticmethod
+    def _groups(codes: np.ndarray, names: list[str]):
+        """``(name, positions)`` per distinct code, positions in input order."""
+        if len(codes) == 0:
+            return
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        for start, positions in zip(starts, np.split(order, starts[1:])):
+            name = names[sorted_codes[start]]
+            if os.sep in name or name in (".", ".."):
+                raise ValueError(f"Label {name!r} cannot be used as a CSV file name")
+            yield name, positions
+
+    @staticmethod
+    def _prepare_folder(output_path: str) -> None:
+        """Create ``output_path`` and its arcs folder, without the CSV files left there."""
+        arcs_path = os.path.join(output_path, CSV_ARCS_FOLDER)
+        os.makedirs(arcs_path, exist_ok=True)
+        for folder in (output_path, arcs_path):
+            for name in os.listdir(folder):
+                if name.endswith(".csv"):
+                    os.remove(os.path.join(folder, name))
+
+    @staticmethod
+    def _is_graph_folder(folder: str) -> bool:
+        """Whether ``folder`` holds only CSV files and an arcs folder of CSV files."""
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            if name == CSV_ARCS_FOLDER and os.path.isdir(path):
+                if not all(f.endswith(".csv") for f in os.listdir(path)):
+                    return False
+            elif not name.endswith(".csv"):
+                return False
+        return True
+
+    def save(self, graph: DirectedGraph, output_path: str) -> None:
+        """
+        Write the CSV files of ``graph`` into the folder ``output_path``,
+        replacing the CSV files already there.
+        """
+        frames = self._frames(graph)
+        self._prepare_folder(output_path)
+
+        def write(item):
+            file_name, frame = item
+            frame.to_csv(
+                os.path.join(output_path, file_name),
+                sep="|",
+                index=False,
+                chunksize=self.chunksize,
+            )
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(write, frames.items()))
+
+    def save_batches(
+        self, batches: Iterable[NodeBatch | EdgeBatch], output_path: str
+    ) -> None:
+        """
+        Write a graph from node and edge batches (every node batch before the
+        first edge batch) without building it: rows are appended to the file
+        of their label as they arrive. Endpoints that no node batch declared
+        are written as ``Node`` nodes.
+        """
+        self._prepare_folder(output_path)
+        arcs_path = os.path.join(output_path, CSV_ARCS_FOLDER)
+        node_vocab, edge_vocab = {}, {}
+        files = {}
+        node_ids, lookup = [], None
+
+        def append(path, header, frame, sep=","):
+            if path not in files:
+                files[path] = open(path, "w")
+                files[path].write(header + "\n")
+            frame.to_csv(files[path], sep=sep, header=False, index=False)
+
+        def write_nodes(label, ids):
+            if self.id_map is not None:
+                ids = self.id_map.restore(ids)
+            path = os.path.join(output_path, f"{label}.csv")
+            append(path, self.NODE_HEADER, pd.DataFrame({"id": ids}))
+
+        def codes_of(labels, n, vocab):
+            if labels is None:
+                return np.full(n, -1, dtype=np.int64)
+            return label_codes(labels.tolist(), vocab)
+
+        try:
+            for batch in batches:
+                if isinstance(batch, NodeBatch):
+                    if lookup is not None:
+                        raise StreamingError("Node batches must come before the first edge batch")
+                    codes = codes_of(batch.labels, len(batch), node_vocab)
+                    names = list(node_vocab) + [self.DEFAULT_NODE_LABEL]
+                    for label, positions in self._groups(codes, names):
+                        write_nodes(label, batch.ids[positions])
+                    node_ids.append(batch.ids)
+                    continue
+
+                if lookup is None:
+                    empty = np.empty(0, dtype=np.int64)
+                    lookup = NodeLookup(np.concatenate(node_ids) if node_ids else empty)
+                # Endpoints never declared become unlabeled nodes, as in read()
+                implicit = lookup.missing(np.column_stack((batch.src, batch.dst)).ravel())
+                if len(implicit):
+                    write_nodes(self.DEFAULT_NODE_LABEL, implicit)
+                    lookup.extend(implicit)
+                src, dst = batch.src, batch.dst
+                if self.id_map is not None:
+                    src, dst = self.id_map.restore(src), self.id_map.restore(dst)
+                codes = codes_of(batch.labels, len(batch), edge_vocab)
+                names = list(edge_vocab) + [self.DEFAULT_EDGE_LABEL]
+                for label, arcs in self._groups(codes, names):
+                    append(
+                        os.path.join(arcs_path, f"{label}.csv"),
+                        "|".join(self.ARC_HEADER),
+                        pd.DataFrame({"src": src[arcs], "dst": dst[arcs]}),
+                        sep="|",
+                    )
+            if lookup is None and node_ids:
+                NodeLookup(np.concatenate(node_ids))  # rejects duplicate node ids
+        finally:
+            for f in files.values():
+                f.close()
+
+    def save_db(self, db: DBGraphs, output_path: str, append: bool = False) -> None:
+        """
+        Save every graph into ``output_path/<graph_id>``. Unless appending,
+        graph folders left by a previous save (folders holding only CSV
+        files and their arcs folder) are removed first.
+        """
+        if not append and os.path.isdir(output_path):
+            for name in os.listdir(output_path):
+                folder = os.path.join(output_path, name)
+                if os.path.isdir(folder) and self._is_graph_folder(folder):
+                    shutil.rmtree(folder)
+        os.makedirs(output_path, exist_ok=True)
+        for graph in db.iter_graphs():
+            self.save(graph, os.path.join(output_path, str(graph.get_graph_id())))
+
+    def format_extension(self) -> str:
+        return "csv"
@@ -1,6 +1,38 @@
+import os
+from typing import Iterable
+
 from db import DBGraphs
-from graph import DirectedGraph
-from saver.strategy import SaverStrategy
+from graph import DBGraph, DirectedGraph
+from instrument import timed
+from records import EdgeBatch, NodeBatch
+from saver.strategy import DBWriter, SaverStrategy
+
+
+class DataDBWriter(DBWriter):
+    """Keeps the ``.data`` file open and appends one graph block per write."""
+
+    def __init__(
+        self,
+        strategy: "DataSaverStrategy",
+        output_path: str,
+        append: bool = False,
+        buffering: int = -1,
+    ):
+        self._strategy = strategy
+        self.output_path = output_path
+        self._file = open(output_path, "a" if append else "w", buffering=buffering)
+
+    @timed("save_db.graph")
+    def write(self, graph: DBGraph) -> None:
+        self._file.write(f"t # {graph.get_graph_id()}\n")
+        self._file.write(self._strategy._to_data_string(graph))
+
+    def flush(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
 
 
 class DataSaverStrategy(SaverStrategy):
@@ -16,9 +48,11 @@ class DataSaverStrategy(SaverStrategy):
         e 0 1 labelA, labelB
         e 1 0 labelA
         """
+        if self.id_map is not None:
+            graph = self.id_map.restore_graph(graph)
         res = ""
         for node_id, node_data in graph.nodes(data=True):
-            labels = node_data.get("labels", [])
+            labels = node_data.get("labels", node_data.get("label", []))
             if isinstance(labels, str):
                 labels = [labels]
             labels_str = ", ".join(labels)
@@ -51,10 +85,36 @@ class DataSaverStrategy(SaverStrategy):
         """
         mode = "a" if append else "w"
         with open(output_path, mode) as f:
-            for graph in db.get_graphs():
+            for graph in db.iter_graphs():
                 f.write(f"t # {graph.get_graph_id()}\n")
                 data_string = self._to_data_string(graph)
                 f.write(data_string)
 
+    def open_db(
+        self, output_path: str, append: bool = False, buffering: int = -1
+    ) -> DataDBWriter:
+        return DataDBWriter(self, output_path, append=append, buffering=buffering)
+
+    def _batch_to_data_string(self, batch: NodeBatch | EdgeBatch) -> str:
+        if isinstance(batch, NodeBatch):
+            ids = batch.ids.tolist()
+            labels = [""] * len(ids) if batch.labels is None else batch.labels.tolist()
+            return "".join(f"v {i} {l}\n" for i, l in zip(ids, labels))
+        src = batch.src.tolist()
+        dst = batch.dst.tolist()
+        labels = [""] * len(src) if batch.labels is None else batch.labels.tolist()
+        return "".join(f"e {s} {d} {l}\n" for s, d, l in zip(src, dst, labels))
+
+    def save_batches(
+        self, batches: Iterable[NodeBatch | EdgeBatch], output_path: str
+    ) -> None:
+        """
+        Write node and edge batches to output_path in arrival order.
+        Producers must send every node batch before the first edge batch.
+        """
+        with open(output_path, "w") as f:
+            for batch in batches:
+                f.write(self._batch_to_data_string(batch))
+
     def format_extension(self) -> str:
         return "data"
@@ -0,0 +1,217 @@
+import json
+import os
+import shutil
+from typing import Iterable
+
+import numpy as np
+
+from db import DBGraphs
+from graph import DBGraph, DirectedGraph
+from instrument import timed
+from records import (
+    DBArrays,
+    EdgeBatch,
+    NodeBatch,
+    NodeLookup,
+    StreamingError,
+    label_codes,
+)
+from saver.strategy import DBWriter, SaverStrategy
+
+INT64 = np.dtype(np.int64)
+
+
+class NpyDBWriter(DBWriter):
+    """
+    Writes a database as a directory of ``.npy`` arrays (see ``DBArrays``).
+
+    Every graph is appended to raw int64 part files as it is written, so the
+    database is never held in memory; ``close`` prefixes each array with its
+    ``.npy`` header and writes ``meta.json`` (graph ids and label vocabularies).
+    """
+
+    def __init__(
+        self,
+        strategy: "NpySaverStrategy",
+        output_path: str,
+        append: bool = False,
+        buffering: int = -1,
+    ):
+        if append:
+            raise NotImplementedError(
+                "npy databases are finalized on close and cannot be appended to"
+            )
+        self._strategy = strategy
+        self.output_path = output_path
+        os.makedirs(output_path, exist_ok=True)
+        # edge_index is (2, E): its two rows are streamed to separate parts
+        self._parts = {
+            name: open(self._part_path(name), "wb", buffering=buffering)
+            for name in ("node_ids", "node_labels", "src", "dst", "edge_labels")
+        }
+        self._node_vocab: dict = {}
+        self._edge_vocab: dict = {}
+        self._graph_ids: list = []
+        self._node_counts: list[int] = []
+        self._edge_counts: list[int] = []
+
+    def _part_path(self, name: str) -> str:
+        return os.path.join(self.output_path, f".{name}.part")
+
+    @timed("save_db.graph")
+    def write(self, graph: DBGraph) -> None:
+        self.write_graph(graph, graph.get_graph_id())
+
+    def write_graph(self, graph: DirectedGraph, graph_id) -> None:
+        arrays = graph.to_arrays(self._node_vocab, self._edge_vocab)
+        if arrays.node_ids.dtype.kind not in "iu":
+            raise ValueError(
+                f"npy output needs integer node ids, graph {graph_id} has {arrays.node_ids.dtype}"
+            )
+        self._write_nodes(arrays.node_ids, arrays.node_labels)
+        self._write_arcs(*arrays.edge_index, arrays.edge_labels)
+        self._graph_ids.append(graph_id)
+        self._node_counts.append(arrays.num_nodes)
+        self._edge_counts.append(arrays.num_edges)
+
+    def write_batches(self, batches: Iterable[NodeBatch | EdgeBatch], graph_id) -> None:
+        """
+        Write one graph from node and edge batches (every node batch before
+        the first edge batch); arc endpoints are turned into node positions
+        by binary search over the node ids, without building the graph.
+        Endpoints that no node batch declared are added as unlabeled nodes.
+        """
+        node_ids, lookup = [], None
+        num_nodes = num_edges = 0
+        for batch in batches:
+            if isinstance(batch, NodeBatch):
+                if lookup is not None:
+                    raise StreamingError("Node batches must come before the first edge batch")
+                ids = batch.ids.astype(INT64, copy=False)
+                self._write_nodes(ids, self._codes(batch.labels, len(ids), self._node_vocab))
+                node_ids.append(ids)
+                num_nodes += len(ids)
+            else:
+                if lookup is None:
+                    lookup = NodeLookup(
+                        np.concatenate(node_ids) if node_ids else np.empty(0, dtype=INT64)
+                    )
+                # Endpoints never declared become unlabeled nodes, as in read()
+                implicit = lookup.missing(np.column_stack((batch.src, batch.dst)).ravel())
+                if len(implicit):
+                    self._write_nodes(implicit, np.full(len(implicit), -1, dtype=INT64))
+                    lookup.extend(implicit)
+                    num_nodes += len(implicit)
+                self._write_arcs(
+                    lookup.positions(batch.src),
+                    lookup.positions(batch.dst),
+                    self._codes(batch.labels, len(batch), self._edge_vocab),
+                )
+                num_edges += len(batch)
+        if lookup is None and node_ids:
+            NodeLookup(np.concatenate(node_ids))  # rejects duplicate node ids
+        self._graph_ids.append(graph_id)
+        self._node_counts.append(num_nodes)
+        self._edge_counts.append(num_edges)
+
+    @staticmethod
+    def _codes(labels: np.ndarray | None, n: int, vocab: dict) -> np.ndarray:
+        if labels is None:
+            return np.full(n, -1, dtype=INT64)
+        return label_codes(labels.tolist(), vocab)
+
+    def _write_nodes(self, node_ids: np.ndarray, codes: np.ndarray) -> None:
+        if self._strategy.id_map is not None:
+            node_ids = self._strategy.id_map.restore(node_ids)
+        node_ids.astype(INT64, copy=False).tofile(self._parts["node_ids"])
+        codes.tofile(self._parts["node_labels"])
+
+    def _write_arcs(self, src: np.ndarray, dst: np.ndarray, codes: np.ndarray) -> None:
+        src.astype(INT64, copy=False).tofile(self._parts["src"])
+        dst.astype(INT64, copy=False).tofile(self._parts["dst"])
+        codes.tofile(self._parts["edge_labels"])
+
+    def flush(self) -> None:
+        for part in self._parts.values():
+            part.flush()
+            os.fsync(part.fileno())
+
+    def _write_npy(self, name: str, shape: tuple, parts: tuple = (), data=None) -> None:
+        with open(os.path.join(self.output_path, f"{name}.npy"), "wb") as f:
+            np.lib.format.write_array_header_1_0(
+                f,
+                {
+                    "descr": np.lib.format.dtype_to_descr(INT64),
+                    "fortran_order": False,
+                    "shape": shape,
+                },
+            )
+            if data is not None:
+                f.write(np.ascontiguousarray(data, dtype=INT64).tobytes())
+            for part in parts:
+                with open(self._part_path(part), "rb") as src:
+                    shutil.copyfileobj(src, f, 1 << 20)
+
+    def close(self) -> None:
+        if self._parts is None:
+            return
+        for part in self._parts.values():
+            part.close()
+        self._parts = None
+
+        num_nodes, num_edges = sum(self._node_counts), sum(self._edge_counts)
+        for name, counts in (("node_ptr", self._node_counts), ("edge_ptr", self._edge_counts)):
+            ptr = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=ptr[1:])
+            self._write_npy(name, ptr.shape, data=ptr)
+        self._write_npy("node_ids", (num_nodes,), ["node_ids"])
+        self._write_npy("node_labels", (num_nodes,), ["node_labels"])
+        self._write_npy("edge_index", (2, num_edges), ["src", "dst"])
+        self._write_npy("edge_labels", (num_edges,), ["edge_labels"])
+        for name in ("node_ids", "node_labels", "src", "dst", "edge_labels"):
+            os.remove(self._part_path(name))
+
+        with open(os.path.join(self.output_path, "meta.json"), "w") as f:
+            json.dump(
+                {
+                    "graph_ids": self._graph_ids,
+                    "node_vocab": list(self._node_vocab),
+                    "edge_vocab": list(self._edge_vocab),
+                    "arrays": list(DBArrays.ARRAYS),
+                },
+                f,
+            )
+
+
+class NpySaverStrategy(SaverStrategy):
+    """
+    Saves graphs as memory-mappable NumPy arrays, for ML pipelines: the
+    output is a directory holding ``edge_index.npy`` (int64, ``(2, E)``, per
+    graph node positions), ``node_ptr.npy``/``edge_ptr.npy`` (graph offsets),
+    ``node_ids.npy``, ``node_labels.npy``/``edge_labels.npy`` (label codes,
+    -1 for unlabeled) and ``meta.json``. Read it back with ``DBArrays.load``.
+    A single graph is saved as a database of one graph.
+    """
+
+    def save(self, graph: DirectedGraph, output_path: str) -> None:
+        with self.open_db(output_path) as writer:
+            writer.write_graph(graph, 0)
+
+    def save_db(self, db: DBGraphs, output_path: str, append: bool = False) -> None:
+        with self.open_db(output_path, append=append) as writer:
+            for graph in db.iter_graphs():
+                writer.write(graph)
+
+    def save_batches(
+        self, batches: Iterable[NodeBatch | EdgeBatch], output_path: str
+    ) -> None:
+        with self.open_db(output_path) as writer:
+            writer.write_batches(batches, 0)
+
+    def open_db(
+        self, output_path: str, append: bool = False, buffering: int = -1
+    ) -> NpyDBWriter:
+        return NpyDBWriter(self, output_path, append=append, buffering=buffering)
+
+    def format_extension(self) -> str:
+        return "npy"
@@ -1,8 +1,19 @@
 from fileinput import filename
 from db import DBGraphs
 from graph import DirectedGraph
-from saver.strategy import saver_factory_strategy, SaverStrategy
+from instrument import timed
+from records import EdgeBatch, NodeBatch
+from saver.strategy import DBWriter, saver_factory_strategy, SaverStrategy
 import os
+import shutil
+from typing import Iterable
+
+
+def _remove(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    elif os.path.exists(path):
+        os.remove(path)
 
 
 class Saver:
@@ -14,7 +25,8 @@ class Saver:
 
     def _construct_path(self, given_path: str) -> str:
         ext = self._strategy.format_extension()
-        if os.path.isdir(given_path):
+        # Directory outputs (npy) are named after their format like files
+        if os.path.isdir(given_path) and not given_path.rstrip(os.sep).endswith(f".{ext}"):
             return os.path.join(given_path, f"{self.__DEFAULT_FILE_NAME}.{ext}")
         else:
             abs_path = os.path.abspath(given_path)
@@ -22,6 +34,7 @@ class Saver:
             abs_path = os.path.splitext(abs_path)[0]
             return f"{abs_path}.{ext}"
 
+    @timed("save")
     def save(self, graph: DirectedGraph, output_path: str):
         """
         Save a single graph to the given output path using the strategy
@@ -29,6 +42,7 @@ class Saver:
         output_path = self._construct_path(output_path)
         self._strategy.save(graph, output_path)
 
+    @timed("save_db")
     def save_db(self, graphs: DBGraphs, output_path: str, append: bool = False):
         """
         Save a database of graphs to the given output path using the strategy.
@@ -37,7 +51,44 @@ class Saver:
         self._strategy.save_db(graphs, output_path, append=append)
 
 
-def saver_factory(output_format) -> Saver:
+    def open_db(self, output_path: str, append: bool = False, **kwargs) -> DBWriter:
+        """
+        Open the database at the given output path for incremental writes.
+        """
+        output_path = self._construct_path(output_path)
+        return self._strategy.open_db(output_path, append=append, **kwargs)
+
+    def supports_batches(self) -> bool:
+        return type(self._strategy).save_batches is not SaverStrategy.save_batches
+
+    @timed("save_batches")
+    def save_batches(self, batches: Iterable[NodeBatch | EdgeBatch], output_path: str):
+        """
+        Stream node and edge batches of a single graph to the given output path.
+
+        The batches are written to a hidden sibling first, which replaces the
+        output only once the source has been read completely: a source that
+        fails (missing, or not streamable) leaves an existing output untouched.
+        """
+        output_path = self._construct_path(output_path)
+        head, tail = os.path.split(output_path)
+        tmp_path = os.path.join(head, f".{tail}.tmp")
+        _remove(tmp_path)
+        try:
+            self._strategy.save_batches(batches, tmp_path)
+        except BaseException:
+            _remove(tmp_path)
+            raise
+        _remove(output_path)
+        os.replace(tmp_path, output_path)
+
+
+def saver_factory(output_format, id_map=None) -> Saver:
+    """
+    ``id_map`` makes the saver write the original node ids of graphs whose
+    ids were compacted with it.
+    """
     save_strategy = saver_factory_strategy(output_format)
+    save_strategy.id_map = id_map
     saver = Saver(save_strategy)
     return saver
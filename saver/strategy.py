@@ -1,11 +1,56 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 from db import DBGraphs
-from graph import DirectedGraph
+from graph import DBGraph, DirectedGraph
+from idmap import IdMap
+from instrument import timed
+from records import EdgeBatch, NodeBatch
 from saver.types import OutputFormat
 
 
+class DBWriter:
+    """
+    Incremental writer for a database: graphs are written as they are passed
+    in, so callers never need to hold the whole database.
+
+    This generic version reopens the output for every graph through
+    ``save_db(..., append=True)``; strategies can return a faster writer that
+    keeps the file open.
+    """
+
+    def __init__(self, strategy: "SaverStrategy", output_path: str, append: bool = False):
+        self._strategy = strategy
+        self.output_path = output_path
+        if not append:
+            # Truncate (or create) the output once
+            strategy.save_db(DBGraphs(), output_path)
+
+    @timed("save_db.graph")
+    def write(self, graph: DBGraph) -> None:
+        self._strategy.save_db(DBGraphs([graph]), self.output_path, append=True)
+
+    def flush(self) -> None:
+        """
+        Make every graph written so far durable, so the output size is a
+        consistent boundary between graphs (used by checkpoints).
+        """
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "DBWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 class SaverStrategy(ABC):
+    # Set on graphs with compact node ids (see ``idmap.compact_graph``) to
+    # write the original ids instead
+    id_map: "IdMap | None" = None
 
     @abstractmethod
     def save(self, graph: DirectedGraph, output_path: str):
@@ -19,11 +64,39 @@ class SaverStrategy(ABC):
     def save_db(self, graphs: DBGraphs, output_path: str, append: bool = False):
         pass
 
+    def open_db(
+        self, output_path: str, append: bool = False, buffering: int = -1
+    ) -> DBWriter:
+        """
+        Open ``output_path`` for writing graphs one at a time. ``buffering``
+        is the write buffer size for strategies that keep the file open.
+        """
+        return DBWriter(self, output_path, append=append)
+
+    def save_batches(
+        self, batches: Iterable[NodeBatch | EdgeBatch], output_path: str
+    ) -> None:
+        """
+        Write a single graph from a stream of node and edge batches, as they
+        arrive, without building the graph in memory.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming writes"
+        )
+
 
 def saver_factory_strategy(format: OutputFormat) -> SaverStrategy:
     if format == OutputFormat.data:
         from saver.data import DataSaverStrategy
 
         return DataSaverStrategy()
+    elif format == OutputFormat.npy:
+        from saver.npy import NpySaverStrategy
+
+        return NpySaverStrategy()
+    elif format == OutputFormat.csv:
+        from saver.csv import CSVSaverStrategy
+
+        return CSVSaverStrategy()
     else:
         raise ValueError(f"Unsupported format: {format}")
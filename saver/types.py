@@ -3,6 +3,16 @@ from enum import Enum
 
 class OutputFormat(str, Enum):
     data = "data"
+    npy = "npy"
+    csv = "csv"
 
 
 OUTPUT_FORMATS = OutputFormat
+
+# Written as a folder of files, so a byte offset cannot mark a resume point
+DIRECTORY_FORMATS = frozenset({OutputFormat.npy, OutputFormat.csv})
+
+
+class NodeIds(str, Enum):
+    compact = "compact"
+    original = "original"
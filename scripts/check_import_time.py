@@ -0,0 +1,69 @@
+"""
+Import-time regression check for the CLI.
+
+Runs ``python -X importtime -c "import main"`` a few times and fails when
+importing the CLI loads one of the heavy libraries (they must only be
+imported inside the commands that need them) or when the best run exceeds
+the time budget.
+
+Usage:
+    python scripts/check_import_time.py [--budget-ms 250] [--runs 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("networkx", "numpy", "pandas")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str) -> tuple[float, set[str]]:
+    """Return the cumulative import time of ``module`` in ms and the top-level packages it loaded."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = None
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if not cumulative.isdigit():
+            continue  # header line
+        loaded.add(name.split(".")[0])
+        if name == module:
+            total_us = int(cumulative)
+    if total_us is None:
+        raise RuntimeError(f"No import time reported for {module!r}")
+    return total_us / 1000, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=250.0, help="Time budget in ms")
+    parser.add_argument("--runs", type=int, default=5, help="Runs (the fastest is kept)")
+    args = parser.parse_args()
+
+    best_ms, loaded = min(measure(args.module) for _ in range(args.runs))
+    heavy = sorted(set(HEAVY_MODULES) & loaded)
+
+    print(f"import {args.module}: {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    failed = False
+    if heavy:
+        print(f"FAIL: importing {args.module} loads {', '.join(heavy)}")
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f"FAIL: import time exceeds the budget by {best_ms - args.budget_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
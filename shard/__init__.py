@@ -0,0 +1,11 @@
+from lazy import lazy_attributes
+
+from .types import COST_MODELS, CostModel
+
+__getattr__ = lazy_attributes(
+    __name__,
+    {
+        "Sharder": ".sharder",
+        "cost_factory": ".strategy",
+    },
+)
@@ -0,0 +1,28 @@
+from graph import DirectedGraph
+from shard.strategy import CostStrategy
+
+
+class EdgeCost(CostStrategy):
+    """Number of arcs, the usual proxy for mining and matching time."""
+
+    def cost(self, graph: DirectedGraph) -> float:
+        return graph.number_of_edges()
+
+
+class NodeCost(CostStrategy):
+    def cost(self, graph: DirectedGraph) -> float:
+        return graph.number_of_nodes()
+
+
+class SizeCost(CostStrategy):
+    """Nodes plus arcs, close to the size of the graph on disk."""
+
+    def cost(self, graph: DirectedGraph) -> float:
+        return graph.number_of_nodes() + graph.number_of_edges()
+
+
+class QuadraticCost(CostStrategy):
+    """Squared arc count, for jobs whose time grows superlinearly with the graph."""
+
+    def cost(self, graph: DirectedGraph) -> float:
+        return graph.number_of_edges() ** 2
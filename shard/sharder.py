@@ -0,0 +1,113 @@
+import heapq
+import json
+import os
+from typing import Iterable, Iterator
+
+from graph import DBGraph
+from saver.saver import Saver
+from shard.strategy import CostStrategy
+
+
+class Sharder:
+    """
+    Splits a stream of graphs into ``num_shards`` shards of balanced cost.
+
+    Graphs are assigned with the longest-processing-time rule: the most
+    expensive graph goes to the least loaded shard. Only ``window`` graphs
+    are held at a time (sorted by cost within the window, then assigned), so
+    memory does not grow with the database; ``window=1`` is plain online
+    greedy, a larger window gets closer to LPT over the whole input.
+    """
+
+    def __init__(self, num_shards: int, cost: CostStrategy, window: int = 1024):
+        if num_shards < 1:
+            raise ValueError(f"num_shards must be at least 1, got {num_shards}")
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        self.num_shards = num_shards
+        self.cost = cost
+        self.window = window
+        self.loads = [0.0] * num_shards
+        # (load, shard) of every shard; ties go to the lowest shard index
+        self._heap = [(0.0, shard) for shard in range(num_shards)]
+
+    def _place(self, cost: float) -> int:
+        load, shard = heapq.heappop(self._heap)
+        load += cost
+        self.loads[shard] = load
+        heapq.heappush(self._heap, (load, shard))
+        return shard
+
+    def _flush(self, pending: list) -> Iterator[tuple[int, DBGraph, float]]:
+        # Costliest first; equal costs keep the input order
+        pending.sort(key=lambda item: (-item[0], item[1]))
+        for cost, _, graph in pending:
+            yield self._place(cost), graph, cost
+        pending.clear()
+
+    def assign(self, graphs: Iterable[DBGraph]) -> Iterator[tuple[int, DBGraph, float]]:
+        """Yield ``(shard, graph, cost)`` for every graph, a window at a time."""
+        pending = []
+        for position, graph in enumerate(graphs):
+            pending.append((float(self.cost.cost(graph)), position, graph))
+            if len(pending) >= self.window:
+                yield from self._flush(pending)
+        yield from self._flush(pending)
+
+    @staticmethod
+    def shard_paths(output_path: str, num_shards: int) -> list[str]:
+        """``<stem>-<i>`` for every shard, numbered with a fixed width."""
+        stem = os.path.splitext(output_path)[0]
+        width = len(str(num_shards - 1))
+        return [f"{stem}-{i:0{width}d}" for i in range(num_shards)]
+
+    def write(
+        self,
+        graphs: Iterable[DBGraph],
+        saver: Saver,
+        output_path: str,
+        buffering: int = 1 << 20,
+        **extra,
+    ) -> dict:
+        """
+        Stream ``graphs`` into the shards, each through its own buffered
+        writer. The assignment is written line by line to
+        ``<stem>.assignment.tsv`` (graph id, shard) and a summary to
+        ``<stem>.manifest.json``, along with the ``extra`` fields; the
+        manifest is returned.
+        """
+        stem = os.path.splitext(output_path)[0]
+        paths = self.shard_paths(output_path, self.num_shards)
+        writers = [saver.open_db(path, buffering=buffering) for path in paths]
+        stats = [{"graphs": 0, "nodes": 0, "edges": 0} for _ in paths]
+        assignment_path = f"{stem}.assignment.tsv"
+        try:
+            with open(assignment_path, "w") as assignment:
+                assignment.write("graph_id\tshard\n")
+                for shard, graph, _ in self.assign(graphs):
+                    writers[shard].write(graph)
+                    assignment.write(f"{graph.get_graph_id()}\t{shard}\n")
+                    stats[shard]["graphs"] += 1
+                    stats[shard]["nodes"] += graph.number_of_nodes()
+                    stats[shard]["edges"] += graph.number_of_edges()
+        finally:
+            for writer in writers:
+                writer.close()
+
+        mean = sum(self.loads) / self.num_shards
+        manifest = {
+            **extra,
+            "num_shards": self.num_shards,
+            "window": self.window,
+            "assignment": os.path.basename(assignment_path),
+            "imbalance": max(self.loads) / mean if mean > 0 else 1.0,
+            "shards": [
+                {"path": writer.output_path, "cost": load, **shard_stats}
+                for writer, load, shard_stats in zip(writers, self.loads, stats)
+            ],
+        }
+        tmp = f"{stem}.manifest.json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, f"{stem}.manifest.json")
+        return manifest
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+
+from graph import DirectedGraph
+from shard.types import CostModel
+
+
+class CostStrategy(ABC):
+    """Estimates how expensive a graph is for the jobs consuming the shards."""
+
+    @abstractmethod
+    def cost(self, graph: DirectedGraph) -> float:
+        pass
+
+
+def cost_factory(model: CostModel) -> CostStrategy:
+    if model == CostModel.edges:
+        from shard.costs import EdgeCost
+
+        return EdgeCost()
+    elif model == CostModel.nodes:
+        from shard.costs import NodeCost
+
+        return NodeCost()
+    elif model == CostModel.size:
+        from shard.costs import SizeCost
+
+        return SizeCost()
+    elif model == CostModel.quadratic:
+        from shard.costs import QuadraticCost
+
+        return QuadraticCost()
+    else:
+        raise ValueError(f"Unsupported cost model: {model}")
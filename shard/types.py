@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class CostModel(str, Enum):
+    edges = "edges"
+    nodes = "nodes"
+    size = "size"
+    quadratic = "quadratic"
+
+
+COST_MODELS = CostModel